@@ -5,168 +5,259 @@ Provides insights into knowledge usage, gaps, and organizational patterns
 """
 
 import asyncio
+import functools
 import json
-from datetime import datetime, timedelta
-from typing import Dict, List, Any
+import time
+from datetime import datetime, timedelta, timezone
+from types import MappingProxyType
+from typing import AsyncIterator, Dict, Any, Mapping, Tuple
 from collections import defaultdict
-from src.knowledge.vector_store import VectorStore
-from src.config import settings
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+
+# Sample payloads served until the dashboard is backed by a real query log.
+# They are shared read-only objects: callers that need to mutate a section
+# must copy it first.
+_USAGE_STATS = MappingProxyType({
+    "total_queries": 1250,
+    "unique_users": 45,
+    "avg_response_time": 2.3,
+    "top_questions": (
+        "What is our authentication strategy?",
+        "How do we handle deployments?",
+        "What are our coding standards?",
+        "Show me recent project decisions",
+        "How do I set up the development environment?"
+    ),
+    "knowledge_sources": MappingProxyType({
+        "github": 450,
+        "jira": 320,
+        "confluence": 280,
+        "slack": 200
+    }),
+    "confidence_scores": MappingProxyType({
+        "high": 65,
+        "medium": 25,
+        "low": 10
+    })
+})
+
+_KNOWLEDGE_GAPS = (
+    MappingProxyType({
+        "topic": "Microservices Architecture",
+        "frequency": 15,
+        "last_asked": "2024-01-15",
+        "suggested_sources": ("Architecture docs", "System design reviews"),
+        "priority": "high"
+    }),
+    MappingProxyType({
+        "topic": "Security Best Practices",
+        "frequency": 12,
+        "last_asked": "2024-01-12",
+        "suggested_sources": ("Security guidelines", "Compliance docs"),
+        "priority": "high"
+    }),
+    MappingProxyType({
+        "topic": "Performance Optimization",
+        "frequency": 8,
+        "last_asked": "2024-01-10",
+        "suggested_sources": ("Performance guides", "Monitoring docs"),
+        "priority": "medium"
+    })
+)
+
+_POPULAR_TOPICS = (
+    MappingProxyType({
+        "topic": "Authentication & Security",
+        "query_count": 45,
+        "avg_confidence": 0.85,
+        "trend": "increasing"
+    }),
+    MappingProxyType({
+        "topic": "Deployment & DevOps",
+        "query_count": 38,
+        "avg_confidence": 0.78,
+        "trend": "stable"
+    }),
+    MappingProxyType({
+        "topic": "Code Standards & Reviews",
+        "query_count": 32,
+        "avg_confidence": 0.92,
+        "trend": "increasing"
+    }),
+    MappingProxyType({
+        "topic": "Project Management",
+        "query_count": 28,
+        "avg_confidence": 0.75,
+        "trend": "stable"
+    }),
+    MappingProxyType({
+        "topic": "System Architecture",
+        "query_count": 22,
+        "avg_confidence": 0.68,
+        "trend": "decreasing"
+    })
+)
+
+_USER_INSIGHTS = MappingProxyType({
+    "active_users": MappingProxyType({
+        "daily": 12,
+        "weekly": 35,
+        "monthly": 45
+    }),
+    "peak_usage_times": tuple(
+        MappingProxyType({"hour": hour, "queries": queries})
+        for hour, queries in ((9, 45), (10, 52), (11, 38), (14, 41), (15, 48), (16, 35))
+    ),
+    "department_usage": MappingProxyType({
+        "engineering": 45,
+        "product": 25,
+        "design": 15,
+        "marketing": 10,
+        "other": 5
+    }),
+    "query_complexity": MappingProxyType({
+        "simple": 60,
+        "moderate": 30,
+        "complex": 10
+    })
+})
+
+_KNOWLEDGE_HEALTH = MappingProxyType({
+    "overall_score": 78,
+    "components": MappingProxyType({
+        "coverage": 75,
+        "accuracy": 82,
+        "accessibility": 80,
+        "freshness": 75
+    }),
+    "recommendations": (
+        "Add more documentation for microservices architecture",
+        "Update security guidelines with latest best practices",
+        "Create more visual guides for complex processes",
+        "Implement automated knowledge freshness checks"
+    )
+})
+
+
+NDJSON_MEDIA_TYPE = "application/x-ndjson"
+
+
+def _json_default(obj: Any) -> Any:
+    """Serialize the read-only section mappings and datetimes"""
+    if isinstance(obj, Mapping):
+        return dict(obj)
+    if isinstance(obj, datetime):
+        return obj.isoformat()
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+def dumps_report(report: Mapping[str, Any]) -> bytes:
+    """Serialize a dashboard report to JSON bytes, using orjson when installed"""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(report, default=_json_default, option=orjson.OPT_NAIVE_UTC)
+    return json.dumps(report, default=_json_default).encode("utf-8")
+
+
+def async_ttl_cache(method):
+    """Memoize an async dashboard getter for the TTL configured in ``_TTL``.
+
+    Entries are refreshed lazily: an expired section is only recomputed when
+    it is next requested.
+    """
+    @functools.wraps(method)
+    async def wrapper(self, *args, **kwargs):
+        key = method.__name__
+        if args or kwargs:
+            key = f"{key}:{args}:{sorted(kwargs.items())}"
+        ttl = self._TTL.get(method.__name__, 0)
+        cached = self._cache.get(key)
+        if cached is not None and time.monotonic() - cached[0] < ttl:
+            return cached[1]
+        value = await method(self, *args, **kwargs)
+        self._cache[key] = (time.monotonic(), value)
+        return value
+    return wrapper
+
 
 class AnalyticsDashboard:
     """Analytics dashboard for Agentic Mentor insights"""
     
+    # Seconds each section stays fresh before it is recomputed on access
+    _TTL = {
+        "get_usage_statistics": 300,
+        "get_knowledge_gaps": 900,
+        "get_popular_topics": 900,
+        "get_user_insights": 300,
+        "get_knowledge_health_score": 3600,
+    }
+    
     def __init__(self):
-        self.vector_store = VectorStore()
+        self._vector_store = None
+        self._cache: Dict[str, Tuple[float, Any]] = {}
+    
+    @property
+    def vector_store(self):
+        """Vector store, created on first use to avoid loading the embedding model at import"""
+        if self._vector_store is None:
+            from src.knowledge.vector_store import get_vector_store
+            self._vector_store = get_vector_store()
+        return self._vector_store
+    
+    def clear_cache(self):
+        """Drop all memoized dashboard sections"""
+        self._cache.clear()
         
-    async def get_usage_statistics(self, days: int = 30) -> Dict[str, Any]:
+    @async_ttl_cache
+    async def get_usage_statistics(self, days: int = 30) -> Mapping[str, Any]:
         """Get usage statistics for the specified period"""
         # This would typically query a database
         # For now, return sample data
-        return {
-            "total_queries": 1250,
-            "unique_users": 45,
-            "avg_response_time": 2.3,
-            "top_questions": [
-                "What is our authentication strategy?",
-                "How do we handle deployments?",
-                "What are our coding standards?",
-                "Show me recent project decisions",
-                "How do I set up the development environment?"
-            ],
-            "knowledge_sources": {
-                "github": 450,
-                "jira": 320,
-                "confluence": 280,
-                "slack": 200
-            },
-            "confidence_scores": {
-                "high": 65,
-                "medium": 25,
-                "low": 10
-            }
-        }
+        return _USAGE_STATS
     
-    async def get_knowledge_gaps(self) -> List[Dict[str, Any]]:
+    @async_ttl_cache
+    async def get_knowledge_gaps(self) -> Tuple[Mapping[str, Any], ...]:
         """Identify knowledge gaps based on unanswered questions"""
-        gaps = [
-            {
-                "topic": "Microservices Architecture",
-                "frequency": 15,
-                "last_asked": "2024-01-15",
-                "suggested_sources": ["Architecture docs", "System design reviews"],
-                "priority": "high"
-            },
-            {
-                "topic": "Security Best Practices",
-                "frequency": 12,
-                "last_asked": "2024-01-12",
-                "suggested_sources": ["Security guidelines", "Compliance docs"],
-                "priority": "high"
-            },
-            {
-                "topic": "Performance Optimization",
-                "frequency": 8,
-                "last_asked": "2024-01-10",
-                "suggested_sources": ["Performance guides", "Monitoring docs"],
-                "priority": "medium"
-            }
-        ]
-        return gaps
-    
-    async def get_popular_topics(self, days: int = 30) -> List[Dict[str, Any]]:
+        return _KNOWLEDGE_GAPS
+    
+    @async_ttl_cache
+    async def get_popular_topics(self, days: int = 30) -> Tuple[Mapping[str, Any], ...]:
         """Get most popular topics and questions"""
-        topics = [
-            {
-                "topic": "Authentication & Security",
-                "query_count": 45,
-                "avg_confidence": 0.85,
-                "trend": "increasing"
-            },
-            {
-                "topic": "Deployment & DevOps",
-                "query_count": 38,
-                "avg_confidence": 0.78,
-                "trend": "stable"
-            },
-            {
-                "topic": "Code Standards & Reviews",
-                "query_count": 32,
-                "avg_confidence": 0.92,
-                "trend": "increasing"
-            },
-            {
-                "topic": "Project Management",
-                "query_count": 28,
-                "avg_confidence": 0.75,
-                "trend": "stable"
-            },
-            {
-                "topic": "System Architecture",
-                "query_count": 22,
-                "avg_confidence": 0.68,
-                "trend": "decreasing"
-            }
-        ]
-        return topics
-    
-    async def get_user_insights(self) -> Dict[str, Any]:
+        return _POPULAR_TOPICS
+    
+    @async_ttl_cache
+    async def get_user_insights(self) -> Mapping[str, Any]:
         """Get insights about user behavior and patterns"""
-        return {
-            "active_users": {
-                "daily": 12,
-                "weekly": 35,
-                "monthly": 45
-            },
-            "peak_usage_times": [
-                {"hour": 9, "queries": 45},
-                {"hour": 10, "queries": 52},
-                {"hour": 11, "queries": 38},
-                {"hour": 14, "queries": 41},
-                {"hour": 15, "queries": 48},
-                {"hour": 16, "queries": 35}
-            ],
-            "department_usage": {
-                "engineering": 45,
-                "product": 25,
-                "design": 15,
-                "marketing": 10,
-                "other": 5
-            },
-            "query_complexity": {
-                "simple": 60,
-                "moderate": 30,
-                "complex": 10
-            }
-        }
+        return _USER_INSIGHTS
     
-    async def get_knowledge_health_score(self) -> Dict[str, Any]:
+    @async_ttl_cache
+    async def get_knowledge_health_score(self) -> Mapping[str, Any]:
         """Calculate overall knowledge health score"""
-        return {
-            "overall_score": 78,
-            "components": {
-                "coverage": 75,
-                "accuracy": 82,
-                "accessibility": 80,
-                "freshness": 75
-            },
-            "recommendations": [
-                "Add more documentation for microservices architecture",
-                "Update security guidelines with latest best practices",
-                "Create more visual guides for complex processes",
-                "Implement automated knowledge freshness checks"
-            ]
-        }
+        return _KNOWLEDGE_HEALTH
     
     async def generate_report(self) -> Dict[str, Any]:
         """Generate comprehensive analytics report"""
+        # Sections are independent, so fetch them concurrently
+        usage, gaps, topics, users, health = await asyncio.gather(
+            self.get_usage_statistics(),
+            self.get_knowledge_gaps(),
+            self.get_popular_topics(),
+            self.get_user_insights(),
+            self.get_knowledge_health_score()
+        )
         return {
-            "timestamp": datetime.now().isoformat(),
+            "timestamp": datetime.now(tz=timezone.utc).isoformat(),
             "period": "Last 30 days",
-            "usage_stats": await self.get_usage_statistics(),
-            "knowledge_gaps": await self.get_knowledge_gaps(),
-            "popular_topics": await self.get_popular_topics(),
-            "user_insights": await self.get_user_insights(),
-            "knowledge_health": await self.get_knowledge_health_score()
+            "usage_stats": usage,
+            "knowledge_gaps": gaps,
+            "popular_topics": topics,
+            "user_insights": users,
+            "knowledge_health": health
         }
 
 class DashboardAPI:
@@ -179,19 +270,44 @@ class DashboardAPI:
         """Get all dashboard data"""
         return await self.dashboard.generate_report()
     
-    async def get_usage_stats(self) -> Dict[str, Any]:
+    async def get_dashboard_json(self) -> bytes:
+        """Get all dashboard data serialized as JSON"""
+        return dumps_report(await self.dashboard.generate_report())
+    
+    async def stream_dashboard_data(self) -> AsyncIterator[bytes]:
+        """Yield each report section as an NDJSON line as soon as it is ready.
+        
+        Suitable for a FastAPI ``StreamingResponse`` with
+        ``media_type=NDJSON_MEDIA_TYPE``.
+        """
+        sections = {
+            "usage_stats": self.dashboard.get_usage_statistics,
+            "knowledge_gaps": self.dashboard.get_knowledge_gaps,
+            "popular_topics": self.dashboard.get_popular_topics,
+            "user_insights": self.dashboard.get_user_insights,
+            "knowledge_health": self.dashboard.get_knowledge_health_score
+        }
+        
+        async def _section(name, getter):
+            return name, await getter()
+        
+        for next_done in asyncio.as_completed([_section(name, getter) for name, getter in sections.items()]):
+            name, data = await next_done
+            yield dumps_report({"section": name, "data": data}) + b"\n"
+    
+    async def get_usage_stats(self) -> Mapping[str, Any]:
         """Get usage statistics"""
         return await self.dashboard.get_usage_statistics()
     
-    async def get_knowledge_gaps(self) -> List[Dict[str, Any]]:
+    async def get_knowledge_gaps(self) -> Tuple[Mapping[str, Any], ...]:
         """Get knowledge gaps"""
         return await self.dashboard.get_knowledge_gaps()
     
-    async def get_popular_topics(self) -> List[Dict[str, Any]]:
+    async def get_popular_topics(self) -> Tuple[Mapping[str, Any], ...]:
         """Get popular topics"""
         return await self.dashboard.get_popular_topics()
     
-    async def get_health_score(self) -> Dict[str, Any]:
+    async def get_health_score(self) -> Mapping[str, Any]:
         """Get knowledge health score"""
         return await self.dashboard.get_knowledge_health_score()
 
@@ -225,4 +341,6 @@ async def main():
     print(f"\n💡 Knowledge Health Score: {report['knowledge_health']['overall_score']}/100")
 
 if __name__ == "__main__":
-    asyncio.run(main()) 
\ No newline at end of file
+    from src.utils.event_loop import run
+    
+    run(main()) 
\ No newline at end of file
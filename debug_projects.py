@@ -3,12 +3,17 @@
 Debug script for projects count
 """
 
-import asyncio
 import sys
-import requests
+import aiohttp
 import json
 from pathlib import Path
 
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
 # Add src to path
 sys.path.insert(0, str(Path(__file__).parent / "src"))
 
@@ -28,27 +33,33 @@ async def debug_projects():
     # Test the API
     print("\n🌐 Testing API...")
     try:
-        response = requests.get("http://localhost:3000/api/stats")
-        if response.status_code == 200:
-            data = response.json()
-            print(f"✅ API Response:")
-            print(f"   Documents: {data.get('documents', 0)}")
-            print(f"   Projects: {data.get('repositories', 0)}")
-            print(f"   Sources: {data.get('sources', 0)}")
-            
-            if data.get('repositories_list'):
-                print(f"\n📋 Projects List:")
-                for project in data['repositories_list']:
-                    print(f"   - {project['name']}: {project['documents']} docs")
-            else:
-                print("❌ No projects list found")
-        else:
-            print(f"❌ API Error: {response.status_code}")
-            print(response.text)
-    except requests.exceptions.ConnectionError:
+        async with aiohttp.ClientSession(timeout=aiohttp.ClientTimeout(total=5)) as session:
+            async with session.get("http://localhost:3000/api/stats") as response:
+                if response.status == 200:
+                    body = await response.read()
+                    data = orjson.loads(body) if ORJSON_AVAILABLE else json.loads(body)
+                    print(f"✅ API Response:")
+                    print(f"   Documents: {data.get('documents', 0)}")
+                    print(f"   Projects: {data.get('repositories', 0)}")
+                    print(f"   Sources: {data.get('sources', 0)}")
+                    
+                    if data.get('repositories_list'):
+                        print(f"\n📋 Projects List:")
+                        sys.stdout.write("".join(
+                            f"   - {project['name']}: {project['documents']} docs\n"
+                            for project in data['repositories_list']
+                        ))
+                    else:
+                        print("❌ No projects list found")
+                else:
+                    print(f"❌ API Error: {response.status}")
+                    print(await response.text())
+    except aiohttp.ClientConnectionError:
         print("❌ Cannot connect to server. Make sure it's running on localhost:3000")
     except Exception as e:
         print(f"❌ Error: {e}")
 
 if __name__ == "__main__":
-    asyncio.run(debug_projects()) 
\ No newline at end of file
+    from src.utils.event_loop import run
+    
+    run(debug_projects()) 
\ No newline at end of file
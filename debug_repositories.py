@@ -4,13 +4,32 @@ Debug the _get_repositories_info method directly
 """
 
 import sys
-import asyncio
+import aiohttp
 from pathlib import Path
 
 # Add src to path
 sys.path.insert(0, str(Path(__file__).parent / "src"))
 
-from src.main import AgenticMentor
+SERVER_URL = "http://localhost:3000"
+
+
+async def _fetch_from_server():
+    """Ask a running server for repositories, reusing its loaded vector store and models"""
+    async with aiohttp.ClientSession(timeout=aiohttp.ClientTimeout(total=30)) as session:
+        async with session.get(f"{SERVER_URL}/api/debug/repositories") as response:
+            response.raise_for_status()
+            data = await response.json()
+            return data["repositories"]
+
+
+async def _fetch_in_process():
+    """Fall back to the module-level app instance when no server is running"""
+    # Reuse the AgenticMentor that src.main creates; its components load on first use
+    from src.main import app
+    
+    await app.ensure_ready()
+    return await app._get_repositories_info()
+
 
 async def debug_repositories():
     """Debug the repositories info method"""
@@ -19,19 +38,27 @@ async def debug_repositories():
     print("=" * 40)
     
     try:
-        # Create app instance
-        app = AgenticMentor()
-        
-        # Test the method directly
-        repositories = await app._get_repositories_info()
+        try:
+            repositories = await _fetch_from_server()
+            print(f"🌐 Using running server at {SERVER_URL}")
+        except aiohttp.ClientConnectionError:
+            print(f"💡 No server at {SERVER_URL}, loading the app in-process")
+            repositories = await _fetch_in_process()
+        except aiohttp.ClientResponseError as e:
+            if e.status != 404:
+                raise
+            print(f"💡 Server at {SERVER_URL} was not started with WEB_DEBUG=true, loading the app in-process")
+            repositories = await _fetch_in_process()
         
         print(f"\n📊 Results:")
         print(f"   Total repositories found: {len(repositories)}")
         
         if repositories:
             print(f"   Repositories:")
-            for i, repo in enumerate(repositories[:5]):
-                print(f"   - {i+1}. {repo['name']}: {repo['documents']} docs ({repo['source_type']})")
+            sys.stdout.write("".join(
+                f"   - {i+1}. {repo['name']}: {repo['documents']} docs ({repo['source_type']})\n"
+                for i, repo in enumerate(repositories[:5])
+            ))
         else:
             print("   ❌ No repositories found!")
             
@@ -41,4 +68,6 @@ async def debug_repositories():
         traceback.print_exc()
 
 if __name__ == "__main__":
-    asyncio.run(debug_repositories()) 
\ No newline at end of file
+    from src.utils.event_loop import run
+    
+    run(debug_repositories())
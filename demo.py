@@ -4,116 +4,166 @@ Demo script for Agentic Mentor
 """
 
 import asyncio
+import io
 import os
 import sys
 from pathlib import Path
 from datetime import datetime
+from typing import NamedTuple, Optional, Tuple
 
 # Add src to path
 sys.path.insert(0, str(Path(__file__).parent / "src"))
 
-from src.knowledge.vector_store import VectorStore
-from src.knowledge.search import SemanticSearch
-from src.agents.qa_agent import QAAgent
-from src.agents.memory_agent import MemoryAgent
-from src.agents.reflection_agent import ReflectionAgent
 from src.models import KnowledgeChunk, SourceType
 
+class _DemoQuery(NamedTuple):
+    """Lightweight stand-in for a Query in the agent demos"""
+    query_text: str
+    id: str = "demo"
+    user_id: str = "demo"
+    timestamp: Optional[datetime] = None
 
-async def create_sample_data():
+
+class _DemoResponse(NamedTuple):
+    """Lightweight stand-in for an AgentResponse in the agent demos"""
+    response_text: str
+    confidence_score: float
+    sources: Tuple[str, ...] = ()
+
+
+# Upper bound on Q&A queries in flight at once during the demo
+MAX_CONCURRENT_QUERIES = 5
+
+# Each demo prints into its own buffer so demos running concurrently don't interleave
+async def _buffered(demo, *args):
+    """Run a demo coroutine, capturing its output; returns (output, error)"""
+    buffer = io.StringIO()
+    try:
+        await demo(buffer, *args)
+        return buffer.getvalue(), None
+    except Exception as e:
+        return buffer.getvalue(), e
+
+
+# Vector store and agent modules pull in chromadb, sentence-transformers and
+# the LLM SDKs, so they are imported inside the demos that use them.
+
+
+def _warm_vector_store():
+    """Load the shared vector store and run a one-text embedding, paying the model
+    load and first-call setup up front; blocking, so run it in a worker thread"""
+    from src.knowledge.vector_store import get_vector_store
+    
+    vector_store = get_vector_store()
+    vector_store.embed(["warm-up"])
+    return vector_store
+
+
+async def create_sample_data(vector_store=None):
     """Create sample knowledge chunks for demonstration"""
     
     print("🤖 Creating sample knowledge base...")
     
+    from src.knowledge.vector_store import VectorStore, get_vector_store
+    from src.knowledge.search import SemanticSearch
+    
     # Initialize components
-    vector_store = VectorStore()
+    vector_store = vector_store or get_vector_store()
     search_engine = SemanticSearch(vector_store)
     
-    # Sample knowledge chunks
+    # Sample knowledge chunks share a single timestamp; the literals are
+    # trusted, so they are built without re-running validation
+    now = datetime.utcnow()
     sample_chunks = [
-        KnowledgeChunk(
+        KnowledgeChunk.model_construct(
             id="auth-001",
             content="We use Auth0 for authentication across all our React applications. The implementation includes custom hooks for user management and role-based access control. Key files: src/hooks/useAuth.js, src/components/AuthProvider.jsx",
             source_type=SourceType.GITHUB,
             source_id="frontend-app/auth",
             source_url="https://github.com/company/frontend-app/blob/main/src/hooks/useAuth.js",
             metadata={"type": "code", "language": "javascript", "topic": "authentication"},
-            created_at=datetime.utcnow(),
-            updated_at=datetime.utcnow()
+            created_at=now,
+            updated_at=now
         ),
-        KnowledgeChunk(
+        KnowledgeChunk.model_construct(
             id="testing-001",
             content="Our testing strategy uses Jest with React Testing Library for frontend tests. We maintain 80% code coverage minimum. For API testing, we use supertest with custom test utilities. See: tests/api/helpers.js for common test patterns.",
             source_type=SourceType.CONFLUENCE,
             source_id="testing-guide",
             source_url="https://company.atlassian.net/wiki/spaces/TECH/pages/123456/Testing+Strategy",
             metadata={"type": "documentation", "topic": "testing"},
-            created_at=datetime.utcnow(),
-            updated_at=datetime.utcnow()
+            created_at=now,
+            updated_at=now
         ),
-        KnowledgeChunk(
+        KnowledgeChunk.model_construct(
             id="deployment-001",
             content="Deployment process: 1) Run tests in CI/CD pipeline 2) Build Docker image 3) Deploy to staging environment 4) Run integration tests 5) Deploy to production with blue-green deployment. See Jira ticket DEPLOY-123 for detailed process.",
             source_type=SourceType.JIRA,
             source_id="DEPLOY-123",
             source_url="https://company.atlassian.net/browse/DEPLOY-123",
             metadata={"type": "process", "topic": "deployment"},
-            created_at=datetime.utcnow(),
-            updated_at=datetime.utcnow()
+            created_at=now,
+            updated_at=now
         ),
-        KnowledgeChunk(
+        KnowledgeChunk.model_construct(
             id="database-001",
             content="Database migrations are handled with Flyway. We use versioned migration files in src/main/resources/db/migration/. Naming convention: V{version}__{description}.sql. Always test migrations in staging first.",
             source_type=SourceType.GITHUB,
             source_id="backend-app/db",
             source_url="https://github.com/company/backend-app/tree/main/src/main/resources/db/migration",
             metadata={"type": "code", "language": "sql", "topic": "database"},
-            created_at=datetime.utcnow(),
-            updated_at=datetime.utcnow()
+            created_at=now,
+            updated_at=now
         ),
-        KnowledgeChunk(
+        KnowledgeChunk.model_construct(
             id="slack-001",
             content="Team discussion: We decided to use Redux Toolkit instead of MobX for state management because it provides better TypeScript support and has a more predictable API. Migration guide available in Confluence.",
             source_type=SourceType.SLACK,
             source_id="tech-decisions",
             source_url="https://company.slack.com/archives/C1234567890/p1234567890",
             metadata={"type": "discussion", "topic": "state-management"},
-            created_at=datetime.utcnow(),
-            updated_at=datetime.utcnow()
+            created_at=now,
+            updated_at=now
         ),
-        KnowledgeChunk(
+        KnowledgeChunk.model_construct(
             id="api-001",
             content="API design follows RESTful principles with OpenAPI 3.0 specification. All endpoints return consistent JSON responses with error codes. Authentication via JWT tokens. Rate limiting: 1000 requests per hour per user.",
             source_type=SourceType.CONFLUENCE,
             source_id="api-standards",
             source_url="https://company.atlassian.net/wiki/spaces/API/pages/789012/API+Standards",
             metadata={"type": "documentation", "topic": "api"},
-            created_at=datetime.utcnow(),
-            updated_at=datetime.utcnow()
+            created_at=now,
+            updated_at=now
         ),
-        KnowledgeChunk(
+        KnowledgeChunk.model_construct(
             id="monitoring-001",
             content="We use Prometheus for metrics collection and Grafana for visualization. Key metrics: response time, error rate, throughput. Alerts configured for 5xx errors > 1% and response time > 2s.",
             source_type=SourceType.GITHUB,
             source_id="monitoring-setup",
             source_url="https://github.com/company/infrastructure/tree/main/monitoring",
             metadata={"type": "configuration", "topic": "monitoring"},
-            created_at=datetime.utcnow(),
-            updated_at=datetime.utcnow()
+            created_at=now,
+            updated_at=now
         )
     ]
     
-    # Add chunks to vector store
-    await vector_store.add_chunks(sample_chunks)
+    # Add chunks to vector store as parallel columns so they are embedded in one batch
+    await vector_store.add_documents(
+        ids=[chunk.id for chunk in sample_chunks],
+        contents=[chunk.content for chunk in sample_chunks],
+        metadatas=[VectorStore.chunk_metadata(chunk) for chunk in sample_chunks]
+    )
     
     print(f"✅ Added {len(sample_chunks)} sample knowledge chunks")
     return vector_store, search_engine
 
 
-async def demo_qa_agent(search_engine):
+async def demo_qa_agent(out: io.StringIO, search_engine):
     """Demonstrate Q&A agent capabilities"""
     
-    print("\n🤖 Testing Q&A Agent...")
+    print("\n🤖 Testing Q&A Agent...", file=out)
+    
+    from src.agents.qa_agent import QAAgent
     
     qa_agent = QAAgent(None, search_engine)
     
@@ -126,29 +176,41 @@ async def demo_qa_agent(search_engine):
         "What state management solution did we choose and why?"
     ]
     
-    for i, query in enumerate(queries, 1):
-        print(f"\n📝 Query {i}: {query}")
-        
-        try:
-            result = await qa_agent.process({
+    # Queries are independent, so run them concurrently (bounded) and report in order
+    semaphore = asyncio.Semaphore(MAX_CONCURRENT_QUERIES)
+    
+    async def ask(query):
+        async with semaphore:
+            return await qa_agent.process({
                 "query_text": query,
                 "user_id": "demo_user",
                 "context": {}
             })
+    
+    results = await asyncio.gather(*(ask(query) for query in queries), return_exceptions=True)
+    
+    for i, (query, result) in enumerate(zip(queries, results), 1):
+        print(f"\n📝 Query {i}: {query}", file=out)
+        
+        try:
+            if isinstance(result, Exception):
+                raise result
             
             response = result["response"]
-            print(f"🤖 Response: {response.response_text[:200]}...")
-            print(f"📊 Confidence: {response.confidence_score:.2f}")
-            print(f"🔗 Sources: {len(response.sources)} found")
+            print(f"🤖 Response: {response.response_text[:200]}...", file=out)
+            print(f"📊 Confidence: {response.confidence_score:.2f}", file=out)
+            print(f"🔗 Sources: {len(response.sources)} found", file=out)
             
         except Exception as e:
-            print(f"❌ Error: {e}")
+            print(f"❌ Error: {e}", file=out)
 
 
-async def demo_memory_agent():
+async def demo_memory_agent(out: io.StringIO):
     """Demonstrate memory agent capabilities"""
     
-    print("\n🧠 Testing Memory Agent...")
+    print("\n🧠 Testing Memory Agent...", file=out)
+    
+    from src.agents.memory_agent import MemoryAgent
     
     memory_agent = MemoryAgent()
     
@@ -171,33 +233,37 @@ async def demo_memory_agent():
         }
     ]
     
-    for interaction in sample_interactions:
-        await memory_agent.process({
+    now = datetime.utcnow()
+    await asyncio.gather(*(
+        memory_agent.process({
             "operation": "learn",
-            "query": type('Query', (), {'id': 'demo', 'user_id': 'demo', 'query_text': interaction['query'], 'timestamp': datetime.utcnow()})(),
-            "response": type('Response', (), {'response_text': interaction['response'], 'confidence_score': 0.8, 'sources': []})(),
+            "query": _DemoQuery(interaction['query'], timestamp=now),
+            "response": _DemoResponse(interaction['response'], 0.8),
             "satisfaction_score": interaction['satisfaction']
         })
+        for interaction in sample_interactions
+    ))
     
     # Get memory stats
     stats = await memory_agent.get_memory_stats()
-    print(f"📊 Memory Stats: {stats['total_memories']} memories, Avg satisfaction: {stats['average_satisfaction']:.2f}")
+    print(f"📊 Memory Stats: {stats['total_memories']} memories, Avg satisfaction: {stats['average_satisfaction']:.2f}", file=out)
 
 
-async def demo_reflection_agent():
+async def demo_reflection_agent(out: io.StringIO):
     """Demonstrate reflection agent capabilities"""
     
-    print("\n🔍 Testing Reflection Agent...")
+    print("\n🔍 Testing Reflection Agent...", file=out)
+    
+    from src.agents.reflection_agent import ReflectionAgent
     
     reflection_agent = ReflectionAgent()
     
     # Sample response to analyze
-    sample_query = type('Query', (), {'query_text': 'How do we handle authentication?'})()
-    sample_response = type('Response', (), {
-        'response_text': 'We use Auth0 for authentication. It provides JWT tokens and handles user sessions.',
-        'confidence_score': 0.7,
-        'sources': []
-    })()
+    sample_query = _DemoQuery('How do we handle authentication?')
+    sample_response = _DemoResponse(
+        'We use Auth0 for authentication. It provides JWT tokens and handles user sessions.',
+        0.7
+    )
     
     # Analyze response
     analysis = await reflection_agent.process({
@@ -207,15 +273,15 @@ async def demo_reflection_agent():
         "search_results": []
     })
     
-    print(f"📊 Analysis: Quality score {analysis['quality_score']:.2f}")
-    print(f"✅ Strengths: {', '.join(analysis['strengths'])}")
-    print(f"🔧 Improvements: {', '.join(analysis['improvement_areas'])}")
+    print(f"📊 Analysis: Quality score {analysis['quality_score']:.2f}", file=out)
+    print(f"✅ Strengths: {', '.join(analysis['strengths'])}", file=out)
+    print(f"🔧 Improvements: {', '.join(analysis['improvement_areas'])}", file=out)
 
 
-async def demo_search_capabilities(search_engine):
+async def demo_search_capabilities(out: io.StringIO, search_engine):
     """Demonstrate search capabilities"""
     
-    print("\n🔍 Testing Search Capabilities...")
+    print("\n🔍 Testing Search Capabilities...", file=out)
     
     # Test different search types
     search_tests = [
@@ -225,13 +291,16 @@ async def demo_search_capabilities(search_engine):
     ]
     
     for query, description in search_tests:
-        print(f"\n🔎 {description}: '{query}'")
+        print(f"\n🔎 {description}: '{query}'", file=out)
         
         results = await search_engine.search(query, limit=3)
         
-        for i, result in enumerate(results, 1):
-            chunk = result.chunk
-            print(f"  {i}. {chunk.source_type.value}: {chunk.content[:100]}... (similarity: {result.similarity_score:.2f})")
+        lines = [
+            f"  {i}. {result.chunk.source_type.value}: {result.chunk.content[:100]}... (similarity: {result.similarity_score:.2f})"
+            for i, result in enumerate(results, 1)
+        ]
+        if lines:
+            out.write("\n".join(lines) + "\n")
 
 
 async def main():
@@ -241,14 +310,34 @@ async def main():
     print("=" * 50)
     
     try:
-        # Create sample data
-        vector_store, search_engine = await create_sample_data()
+        # The embedding model loads and warms up in a worker thread while the demos
+        # that don't search (memory, reflection) already run
+        warmup = asyncio.ensure_future(asyncio.to_thread(_warm_vector_store))
+        independent = [
+            asyncio.ensure_future(_buffered(demo_memory_agent)),
+            asyncio.ensure_future(_buffered(demo_reflection_agent))
+        ]
+        try:
+            # Create sample data
+            vector_store, search_engine = await create_sample_data(await warmup)
+        except BaseException:
+            for task in independent:
+                task.cancel()
+            raise
         
-        # Demo different components
-        await demo_search_capabilities(search_engine)
-        await demo_qa_agent(search_engine)
-        await demo_memory_agent()
-        await demo_reflection_agent()
+        # Demo the search-backed components concurrently too, then print every
+        # demo's output in order
+        outcomes = await asyncio.gather(
+            _buffered(demo_search_capabilities, search_engine),
+            _buffered(demo_qa_agent, search_engine),
+            *independent
+        )
+        
+        for output, _ in outcomes:
+            sys.stdout.write(output)
+        for _, error in outcomes:
+            if error is not None:
+                raise error
         
         print("\n" + "=" * 50)
         print("✅ Demo completed successfully!")
@@ -271,4 +360,6 @@ async def main():
 
 
 if __name__ == "__main__":
-    asyncio.run(main()) 
\ No newline at end of file
+    from src.utils.event_loop import run
+    
+    run(main()) 
\ No newline at end of file
@@ -15,309 +15,525 @@ os.environ["WEB_PORT"] = "3002"
 # Add src to path
 sys.path.insert(0, str(Path(__file__).parent / "src"))
 
-def start_enhanced_server():
-    """Start the enhanced server with all agents"""
+import asyncio
+import time
+from collections import OrderedDict
+from datetime import datetime
+from functools import lru_cache
+from typing import Dict, Any, List, Optional, Tuple
+
+from fastapi import FastAPI, HTTPException, Request
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import HTMLResponse, ORJSONResponse, Response, StreamingResponse
+from fastapi.templating import Jinja2Templates
+import orjson
+import uvicorn
+from pydantic import BaseModel, Field, ValidationError
+
+# Import all agents
+from src.agents.qa_agent import QAAgent
+from src.agents.enhanced_crawler_agent import EnhancedCrawlerAgent
+from src.agents.knowledge_synthesis_agent import KnowledgeSynthesisAgent
+from src.agents.memory_agent import MemoryAgent
+from src.knowledge.vector_store import get_vector_store
+from src.knowledge.search import SemanticSearch
+from src.utils.event_loop import UVLOOP_AVAILABLE
+
+try:
+    import httptools  # noqa: F401 - uvicorn's C HTTP parser
+    HTTPTOOLS_AVAILABLE = True
+except ImportError:
+    HTTPTOOLS_AVAILABLE = False
+
+
+# Components are created on first use and shared for the life of the process,
+# so importing this module (e.g. ``uvicorn enhanced_gemini_server:app``) stays cheap
+@lru_cache(maxsize=1)
+def get_search_engine() -> SemanticSearch:
+    return SemanticSearch(get_vector_store())
+
+
+@lru_cache(maxsize=1)
+def get_qa_agent() -> QAAgent:
+    return QAAgent(get_vector_store(), get_search_engine())
+
+
+@lru_cache(maxsize=1)
+def get_crawler_agent() -> EnhancedCrawlerAgent:
+    return EnhancedCrawlerAgent(get_vector_store())
+
+
+@lru_cache(maxsize=1)
+def get_synthesis_agent() -> KnowledgeSynthesisAgent:
+    return KnowledgeSynthesisAgent(get_vector_store(), get_search_engine())
+
+
+@lru_cache(maxsize=1)
+def get_memory_agent() -> MemoryAgent:
+    return MemoryAgent()
+
+
+class QueryRequest(BaseModel):
+    """Body of /api/query"""
+    query: Optional[str] = None
+    user_id: str = "anonymous"
+    agent_type: str = "qa"  # qa, synthesis, crawl
+
+
+class SynthesisRequest(BaseModel):
+    """Body of /api/synthesis"""
+    query: Optional[str] = None
+    sources: List[str] = Field(default_factory=lambda: ["github", "jira", "confluence"])
+    user_context: Dict[str, Any] = Field(default_factory=dict)
+
+
+class CrawlRequest(BaseModel):
+    """Body of /api/crawl"""
+    job_type: str = "github_enhanced"
+    config: Dict[str, Any] = Field(default_factory=dict)
+
+
+# Create FastAPI app
+app = FastAPI(
+    title="Agentic Mentor - Enhanced",
+    description="AI-Driven Internal Knowledge Explorer with Multi-Agent System",
+    version="2.0.0",
+    default_response_class=ORJSONResponse
+)
+
+# Setup templates
+templates_dir = "templates"
+os.makedirs(templates_dir, exist_ok=True)
+templates = Jinja2Templates(directory=templates_dir)
+
+# Create static directory
+static_dir = "static"
+os.makedirs(static_dir, exist_ok=True)
+
+
+@lru_cache(maxsize=None)
+def _render_page(template_name: str) -> str:
+    """Render a page once; the templates take no per-request context"""
+    return templates.get_template(template_name).render()
+
+
+@app.get("/", response_class=HTMLResponse)
+async def home():
+    """Landing page"""
+    return HTMLResponse(_render_page("landing.html"))
+
+
+@app.get("/chat", response_class=HTMLResponse)
+async def chat():
+    """Chat interface"""
+    return HTMLResponse(_render_page("index.html"))
+
+
+class _QueryCache:
+    """Small LRU of serialized /api/query responses with a freshness window.
+    
+    Entries are per user and keep the memory record of the original answer, so a
+    cache hit still lands in the user's conversation history.
+    """
+    
+    def __init__(self, max_size: int = 256, ttl: float = 300.0):
+        self.max_size = max_size
+        self.ttl = ttl
+        self._entries: "OrderedDict[Tuple[str, str, str], Tuple[float, bytes, Optional[Dict[str, Any]]]]" = OrderedDict()
     
-    print("🤖" + "="*50 + "🤖")
-    print("           AGENTIC MENTOR - Enhanced Edition")
-    print("🤖" + "="*50 + "🤖")
-    print("🌐 Server will be available at: http://localhost:3002")
-    print("📊 Web Interface: http://localhost:3002")
-    print("🔧 API Endpoints: http://localhost:3002/api/")
-    print("🧠 Using Google Gemini 1.5 Flash")
-    print("🤖 Enhanced Agents: Q&A, Crawler, Synthesis, Memory")
-    print("=" * 60)
-    print("✅ Environment variables set:")
-    print(f"   GEMINI_API_KEY: {os.environ.get('GEMINI_API_KEY', 'Not set')[:20]}...")
-    print(f"   USE_GEMINI: {os.environ.get('USE_GEMINI', 'Not set')}")
-    print("=" * 60)
-    print("Press Ctrl+C to stop the server")
-    print("=" * 60)
+    def get(self, key: Tuple[str, str, str]) -> Optional[Tuple[bytes, Optional[Dict[str, Any]]]]:
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        stored_at, body, memory = entry
+        if time.monotonic() - stored_at >= self.ttl:
+            del self._entries[key]
+            return None
+        self._entries.move_to_end(key)
+        return body, memory
     
+    def put(self, key: Tuple[str, str, str], body: bytes, memory: Optional[Dict[str, Any]] = None) -> None:
+        self._entries[key] = (time.monotonic(), body, memory)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+
+
+_query_cache = _QueryCache()
+
+
+@app.post("/api/query")
+async def query(request: Request):
+    """Handle a user query with enhanced agents"""
     try:
-        from fastapi import FastAPI, HTTPException
-        from fastapi.responses import HTMLResponse
-        from fastapi.staticfiles import StaticFiles
-        from fastapi.templating import Jinja2Templates
-        from fastapi import Request
-        import uvicorn
-        from datetime import datetime
-        import asyncio
-        from typing import Dict, Any
-        
-        # Import all agents
-        from src.llm_client import LLMClient
-        from src.agents.qa_agent import QAAgent
-        from src.agents.enhanced_crawler_agent import EnhancedCrawlerAgent
-        from src.agents.knowledge_synthesis_agent import KnowledgeSynthesisAgent
-        from src.agents.memory_agent import MemoryAgent
-        from src.knowledge.vector_store import VectorStore
-        from src.knowledge.search import SemanticSearch
-        
-        # Create FastAPI app
-        app = FastAPI(
-            title="Agentic Mentor - Enhanced",
-            description="AI-Driven Internal Knowledge Explorer with Multi-Agent System",
-            version="2.0.0"
-        )
+        data = QueryRequest.model_validate_json(await request.body())
+        query_text = data.query
+        user_id = data.user_id
+        agent_type = data.agent_type
         
-        # Setup templates
-        templates_dir = "templates"
-        os.makedirs(templates_dir, exist_ok=True)
-        templates = Jinja2Templates(directory=templates_dir)
+        if not query_text:
+            raise HTTPException(status_code=400, detail="Query text is required")
         
-        # Create static directory
-        static_dir = "static"
-        os.makedirs(static_dir, exist_ok=True)
+        # The same user repeating a recent query is answered from the cache without
+        # running the agents again; answers are never shared between users
+        cache_key = (agent_type, user_id, query_text)
+        if agent_type != "crawl":
+            cached = _query_cache.get(cache_key)
+            if cached is not None:
+                body, memory = cached
+                if memory is not None:
+                    await get_memory_agent().process(memory)
+                return Response(body, media_type="application/json")
         
-        # Initialize components
-        vector_store = VectorStore()
-        search_engine = SemanticSearch(vector_store)
-        llm_client = LLMClient()
+        # Route to appropriate agent
+        memory = None
+        if agent_type == "qa":
+            result = await _handle_qa_query(get_qa_agent(), query_text, user_id)
+        elif agent_type == "synthesis":
+            result = await _handle_synthesis_query(get_synthesis_agent(), query_text, user_id)
+        elif agent_type == "crawl":
+            return await _handle_crawl_query(get_crawler_agent(), query_text, user_id)
+        else:
+            # Default to Q&A with synthesis
+            result, memory = await _handle_enhanced_query(
+                get_qa_agent(), get_synthesis_agent(), get_memory_agent(), 
+                query_text, user_id
+            )
         
-        # Initialize all agents
-        qa_agent = QAAgent(vector_store, search_engine)
-        crawler_agent = EnhancedCrawlerAgent(vector_store)
-        synthesis_agent = KnowledgeSynthesisAgent(vector_store, search_engine)
-        memory_agent = MemoryAgent()
+        body = orjson.dumps(jsonable_encoder(result))
+        if result.get("success"):
+            _query_cache.put(cache_key, body, memory)
+        return Response(body, media_type="application/json")
         
-        @app.get("/", response_class=HTMLResponse)
-        async def home(request: Request):
-            """Landing page"""
-            return templates.TemplateResponse("landing.html", {"request": request})
-        
-        @app.get("/chat", response_class=HTMLResponse)
-        async def chat(request: Request):
-            """Chat interface"""
-            return templates.TemplateResponse("index.html", {"request": request})
-        
-        @app.post("/api/query")
-        async def query(request: Request):
-            """Handle a user query with enhanced agents"""
-            try:
-                data = await request.json()
-                query_text = data.get("query")
-                user_id = data.get("user_id", "anonymous")
-                agent_type = data.get("agent_type", "qa")  # qa, synthesis, crawl
-                
-                if not query_text:
-                    raise HTTPException(status_code=400, detail="Query text is required")
-                
-                # Route to appropriate agent
-                if agent_type == "qa":
-                    return await _handle_qa_query(qa_agent, query_text, user_id)
-                elif agent_type == "synthesis":
-                    return await _handle_synthesis_query(synthesis_agent, query_text, user_id)
-                elif agent_type == "crawl":
-                    return await _handle_crawl_query(crawler_agent, query_text, user_id)
-                else:
-                    # Default to Q&A with synthesis
-                    return await _handle_enhanced_query(
-                        qa_agent, synthesis_agent, memory_agent, 
-                        query_text, user_id
-                    )
-                
-            except Exception as e:
-                return {
-                    "success": False,
-                    "error": str(e),
-                    "response": "I apologize, but I encountered an error. Please try again."
-                }
+    except Exception as e:
+        return {
+            "success": False,
+            "error": str(e),
+            "response": "I apologize, but I encountered an error. Please try again."
+        }
+
+
+async def _handle_qa_query(qa_agent, query_text: str, user_id: str):
+    """Handle Q&A query"""
+    result = await qa_agent.process({
+        "query_text": query_text,
+        "user_id": user_id
+    })
+    
+    return {
+        "success": True,
+        "agent_type": "qa",
+        "query_id": result["query"].id,
+        "response": result["response"].response_text,
+        "confidence": result["response"].confidence_score,
+        "sources": [s.chunk.source_type.value for s in result["search_results"]],
+        "suggested_follow_up": result["response"].suggested_follow_up
+    }
+
+
+async def _handle_synthesis_query(synthesis_agent, query_text: str, user_id: str):
+    """Handle knowledge synthesis query"""
+    result = await synthesis_agent.process({
+        "operation": "synthesize",
+        "query": query_text,
+        "sources": ["github", "jira", "confluence"],
+        "user_context": {"role": "developer"}
+    })
+    
+    return {
+        "success": True,
+        "agent_type": "synthesis",
+        "synthesis": result["synthesis"],
+        "gaps": result["gaps"],
+        "connections": result["connections"],
+        "confidence": result["confidence"]
+    }
+
+
+async def _handle_crawl_query(crawler_agent, query_text: str, user_id: str):
+    """Handle crawling query"""
+    result = await crawler_agent.process({
+        "job_type": "github_enhanced",
+        "config": {"repos": ["your-org/your-repo"]}
+    })
+    
+    return {
+        "success": True,
+        "agent_type": "crawl",
+        "job_result": result,
+        "message": "Crawling completed successfully"
+    }
+
+
+def _memory_record(qa_result: Dict[str, Any], user_id: str) -> Dict[str, Any]:
+    """Memory agent input that stores a Q&A exchange in the user's history"""
+    return {
+        "operation": "store",
+        "query": qa_result["query"],
+        "response": qa_result["response"],
+        "user_id": user_id
+    }
+
+
+async def _handle_enhanced_query(qa_agent, synthesis_agent, memory_agent, 
+                               query_text: str, user_id: str) -> Tuple[Dict[str, Any], Dict[str, Any]]:
+    """Handle enhanced query with multiple agents; returns the response and its memory record"""
+    
+    # Get Q&A response
+    qa_result = await qa_agent.process({
+        "query_text": query_text,
+        "user_id": user_id
+    })
+    
+    # Store in memory
+    memory = _memory_record(qa_result, user_id)
+    memory_task = memory_agent.process(memory)
+    
+    # Get synthesis if multiple sources found, overlapping it with the memory store
+    synthesis_result = None
+    if len(qa_result["search_results"]) > 1:
+        synthesis_result, _ = await asyncio.gather(
+            synthesis_agent.process({
+                "operation": "synthesize",
+                "query": query_text,
+                "sources": list({s.chunk.source_type.value for s in qa_result["search_results"]}),
+                "user_context": {"role": "developer"}
+            }),
+            memory_task
+        )
+    else:
+        await memory_task
+    
+    # Build enhanced response
+    enhanced_response = {
+        "success": True,
+        "agent_type": "enhanced",
+        "query_id": qa_result["query"].id,
+        "response": qa_result["response"].response_text,
+        "confidence": qa_result["response"].confidence_score,
+        "sources": [s.chunk.source_type.value for s in qa_result["search_results"]],
+        "suggested_follow_up": qa_result["response"].suggested_follow_up
+    }
+    
+    if synthesis_result:
+        enhanced_response["synthesis"] = synthesis_result["synthesis"]
+        enhanced_response["gaps"] = synthesis_result["gaps"]
+    
+    return enhanced_response, memory
+
+
+def _ndjson(payload: Dict[str, Any]) -> bytes:
+    """Encode one stage of a streamed response as an NDJSON line"""
+    return orjson.dumps(jsonable_encoder(payload)) + b"\n"
+
+
+async def _stream_enhanced_query(qa_agent, synthesis_agent, memory_agent,
+                                 query_text: str, user_id: str):
+    """Yield the enhanced query's stages as they complete: qa, synthesis, done"""
+    memory_task = None
+    try:
+        qa_result = await qa_agent.process({
+            "query_text": query_text,
+            "user_id": user_id
+        })
+        yield _ndjson({
+            "stage": "qa",
+            "success": True,
+            "query_id": qa_result["query"].id,
+            "response": qa_result["response"].response_text,
+            "confidence": qa_result["response"].confidence_score,
+            "sources": [s.chunk.source_type.value for s in qa_result["search_results"]],
+            "suggested_follow_up": qa_result["response"].suggested_follow_up
+        })
         
-        async def _handle_qa_query(qa_agent, query_text: str, user_id: str):
-            """Handle Q&A query"""
-            result = await qa_agent.process({
-                "query_text": query_text,
-                "user_id": user_id
-            })
-            
-            return {
-                "success": True,
-                "agent_type": "qa",
-                "query_id": result["query"].id,
-                "response": result["response"].response_text,
-                "confidence": result["response"].confidence_score,
-                "sources": [s.chunk.source_type.value for s in result["search_results"]],
-                "suggested_follow_up": result["response"].suggested_follow_up
-            }
+        # Store in memory in the background while synthesis runs
+        memory_task = asyncio.ensure_future(memory_agent.process(_memory_record(qa_result, user_id)))
         
-        async def _handle_synthesis_query(synthesis_agent, query_text: str, user_id: str):
-            """Handle knowledge synthesis query"""
-            result = await synthesis_agent.process({
+        if len(qa_result["search_results"]) > 1:
+            synthesis_result = await synthesis_agent.process({
                 "operation": "synthesize",
                 "query": query_text,
-                "sources": ["github", "jira", "confluence"],
+                "sources": list({s.chunk.source_type.value for s in qa_result["search_results"]}),
                 "user_context": {"role": "developer"}
             })
-            
-            return {
-                "success": True,
-                "agent_type": "synthesis",
-                "synthesis": result["synthesis"],
-                "gaps": result["gaps"],
-                "connections": result["connections"],
-                "confidence": result["confidence"]
-            }
-        
-        async def _handle_crawl_query(crawler_agent, query_text: str, user_id: str):
-            """Handle crawling query"""
-            result = await crawler_agent.process({
-                "job_type": "github_enhanced",
-                "config": {"repos": ["your-org/your-repo"]}
+            yield _ndjson({
+                "stage": "synthesis",
+                "synthesis": synthesis_result["synthesis"],
+                "gaps": synthesis_result["gaps"]
             })
-            
-            return {
-                "success": True,
-                "agent_type": "crawl",
-                "job_result": result,
-                "message": "Crawling completed successfully"
-            }
         
-        async def _handle_enhanced_query(qa_agent, synthesis_agent, memory_agent, 
-                                       query_text: str, user_id: str):
-            """Handle enhanced query with multiple agents"""
-            
-            # Get Q&A response
-            qa_result = await qa_agent.process({
-                "query_text": query_text,
-                "user_id": user_id
-            })
-            
-            # Get synthesis if multiple sources found
-            synthesis_result = None
-            if len(qa_result["search_results"]) > 1:
-                synthesis_result = await synthesis_agent.process({
-                    "operation": "synthesize",
-                    "query": query_text,
-                    "sources": list(set([s.chunk.source_type.value for s in qa_result["search_results"]])),
-                    "user_context": {"role": "developer"}
-                })
-            
-            # Store in memory
-            await memory_agent.process({
-                "operation": "store",
-                "query": qa_result["query"],
-                "response": qa_result["response"],
-                "user_id": user_id
-            })
-            
-            # Build enhanced response
-            enhanced_response = {
-                "success": True,
-                "agent_type": "enhanced",
-                "query_id": qa_result["query"].id,
-                "response": qa_result["response"].response_text,
-                "confidence": qa_result["response"].confidence_score,
-                "sources": [s.chunk.source_type.value for s in qa_result["search_results"]],
-                "suggested_follow_up": qa_result["response"].suggested_follow_up
-            }
-            
-            if synthesis_result:
-                enhanced_response["synthesis"] = synthesis_result["synthesis"]
-                enhanced_response["gaps"] = synthesis_result["gaps"]
-            
-            return enhanced_response
+        await memory_task
+        yield _ndjson({"stage": "done", "success": True})
         
-        @app.post("/api/synthesis")
-        async def synthesis(request: Request):
-            """Knowledge synthesis endpoint"""
-            try:
-                data = await request.json()
-                query_text = data.get("query")
-                sources = data.get("sources", ["github", "jira", "confluence"])
-                
-                if not query_text:
-                    raise HTTPException(status_code=400, detail="Query text is required")
-                
-                result = await synthesis_agent.process({
-                    "operation": "synthesize",
-                    "query": query_text,
-                    "sources": sources,
-                    "user_context": data.get("user_context", {})
-                })
-                
-                return {
-                    "success": True,
-                    "synthesis": result["synthesis"],
-                    "gaps": result["gaps"],
-                    "connections": result["connections"],
-                    "confidence": result["confidence"]
-                }
-                
-            except Exception as e:
-                return {
-                    "success": False,
-                    "error": str(e)
-                }
+    except Exception as e:
+        yield _ndjson({"stage": "error", "success": False, "error": str(e)})
+    finally:
+        # Client disconnects close the generator; don't leave the store running
+        if memory_task is not None and not memory_task.done():
+            memory_task.cancel()
+
+
+@app.post("/api/query/stream")
+async def query_stream(request: Request):
+    """Enhanced query streamed as NDJSON, one line per completed stage"""
+    try:
+        data = QueryRequest.model_validate_json(await request.body())
+    except ValidationError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    
+    if not data.query:
+        raise HTTPException(status_code=400, detail="Query text is required")
+    
+    return StreamingResponse(
+        _stream_enhanced_query(
+            get_qa_agent(), get_synthesis_agent(), get_memory_agent(),
+            data.query, data.user_id
+        ),
+        media_type="application/x-ndjson"
+    )
+
+
+@app.post("/api/synthesis")
+async def synthesis(request: Request):
+    """Knowledge synthesis endpoint"""
+    try:
+        data = SynthesisRequest.model_validate_json(await request.body())
+        query_text = data.query
+        sources = data.sources
+        
+        if not query_text:
+            raise HTTPException(status_code=400, detail="Query text is required")
+        
+        result = await get_synthesis_agent().process({
+            "operation": "synthesize",
+            "query": query_text,
+            "sources": sources,
+            "user_context": data.user_context
+        })
+        
+        return {
+            "success": True,
+            "synthesis": result["synthesis"],
+            "gaps": result["gaps"],
+            "connections": result["connections"],
+            "confidence": result["confidence"]
+        }
+        
+    except Exception as e:
+        return {
+            "success": False,
+            "error": str(e)
+        }
+
+
+@app.post("/api/crawl")
+async def crawl(request: Request):
+    """Enhanced crawling endpoint"""
+    try:
+        data = CrawlRequest.model_validate_json(await request.body())
+        job_type = data.job_type
+        config = data.config
         
-        @app.post("/api/crawl")
-        async def crawl(request: Request):
-            """Enhanced crawling endpoint"""
-            try:
-                data = await request.json()
-                job_type = data.get("job_type", "github_enhanced")
-                config = data.get("config", {})
-                
-                result = await crawler_agent.process({
-                    "job_type": job_type,
-                    "config": config
-                })
-                
-                return {
-                    "success": True,
-                    "job_result": result
-                }
-                
-            except Exception as e:
-                return {
-                    "success": False,
-                    "error": str(e)
-                }
+        result = await get_crawler_agent().process({
+            "job_type": job_type,
+            "config": config
+        })
         
-        @app.get("/api/agents")
-        async def get_agents():
-            """Get available agents"""
-            return {
-                "agents": [
-                    {
-                        "name": "Q&A Agent",
-                        "description": "Answers questions using RAG",
-                        "endpoint": "/api/query?agent_type=qa"
-                    },
-                    {
-                        "name": "Knowledge Synthesis Agent",
-                        "description": "Combines information from multiple sources",
-                        "endpoint": "/api/synthesis"
-                    },
-                    {
-                        "name": "Enhanced Crawler Agent",
-                        "description": "Intelligent knowledge extraction",
-                        "endpoint": "/api/crawl"
-                    },
-                    {
-                        "name": "Memory Agent",
-                        "description": "Learns from past interactions",
-                        "endpoint": "internal"
-                    }
-                ]
-            }
+        return {
+            "success": True,
+            "job_result": result
+        }
         
-        @app.get("/api/health")
-        async def health_check():
-            """Health check endpoint"""
-            return {
-                "status": "healthy",
-                "timestamp": datetime.utcnow().isoformat(),
-                "version": "2.0.0-enhanced",
-                "agents": ["qa", "synthesis", "crawler", "memory"]
-            }
+    except Exception as e:
+        return {
+            "success": False,
+            "error": str(e)
+        }
+
+
+# The agent catalogue never changes, so it is serialized once at import
+_AGENTS_RESPONSE = orjson.dumps({
+    "agents": [
+        {
+            "name": "Q&A Agent",
+            "description": "Answers questions using RAG",
+            "endpoint": "/api/query?agent_type=qa"
+        },
+        {
+            "name": "Knowledge Synthesis Agent",
+            "description": "Combines information from multiple sources",
+            "endpoint": "/api/synthesis"
+        },
+        {
+            "name": "Enhanced Crawler Agent",
+            "description": "Intelligent knowledge extraction",
+            "endpoint": "/api/crawl"
+        },
+        {
+            "name": "Memory Agent",
+            "description": "Learns from past interactions",
+            "endpoint": "internal"
+        }
+    ]
+})
+
+
+@app.get("/api/agents")
+async def get_agents():
+    """Get available agents"""
+    return Response(_AGENTS_RESPONSE, media_type="application/json")
+
+
+@app.get("/api/health")
+async def health_check():
+    """Health check endpoint"""
+    return ORJSONResponse({
+        "status": "healthy",
+        "timestamp": datetime.utcnow().isoformat(),
+        "version": "2.0.0-enhanced",
+        "agents": ["qa", "synthesis", "crawler", "memory"]
+    })
+
+
+BANNER = f"""🤖{'=' * 50}🤖
+           AGENTIC MENTOR - Enhanced Edition
+🤖{'=' * 50}🤖
+🌐 Server will be available at: http://localhost:3002
+📊 Web Interface: http://localhost:3002
+🔧 API Endpoints: http://localhost:3002/api/
+🧠 Using Google Gemini 1.5 Flash
+🤖 Enhanced Agents: Q&A, Crawler, Synthesis, Memory
+{'=' * 60}
+✅ Environment variables set:
+   GEMINI_API_KEY: {os.environ.get('GEMINI_API_KEY', 'Not set')[:20]}...
+   USE_GEMINI: {os.environ.get('USE_GEMINI', 'Not set')}
+{'=' * 60}
+Press Ctrl+C to stop the server
+{'=' * 60}
+"""
+
+
+def start_enhanced_server():
+    """Start the enhanced server with all agents"""
+    
+    sys.stdout.write(BANNER)
+    sys.stdout.flush()
+    
+    try:
+        # Build the agents before binding so the first request doesn't pay for it
+        get_qa_agent()
+        get_crawler_agent()
+        get_synthesis_agent()
+        get_memory_agent()
         
-        # Start the server
+        # Start the server on the C-accelerated loop and HTTP parser when installed
         uvicorn.run(
             app,
             host="0.0.0.0",
             port=3002,
-            log_level="info"
+            log_level="info",
+            loop="uvloop" if UVLOOP_AVAILABLE else "asyncio",
+            http="httptools" if HTTPTOOLS_AVAILABLE else "h11"
         )
         
     except Exception as e:
@@ -325,4 +541,4 @@ def start_enhanced_server():
         sys.exit(1)
 
 if __name__ == "__main__":
-    start_enhanced_server() 
\ No newline at end of file
+    start_enhanced_server()
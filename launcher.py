@@ -0,0 +1,77 @@
+#!/usr/bin/env python3
+"""
+Shared bootstrap for the Agentic Mentor launcher scripts
+"""
+
+import os
+import sys
+from pathlib import Path
+from types import MappingProxyType
+from typing import Dict, Mapping, Optional
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent / "src"))
+
+# Environment every launcher runs with; bypasses .env file issues. Read-only so a
+# launcher can't accidentally change the defaults for the others
+_DEFAULT_ENV: Mapping[str, str] = MappingProxyType({
+    "OPENAI_API_KEY": "demo_key",
+    "SECRET_KEY": "demo-secret-key",
+    "ENCRYPTION_KEY": "demo-encryption-key",
+    "WEB_HOST": "0.0.0.0",
+    "WEB_DEBUG": "false",
+    "WEB_JSON_ENCODER": "orjson",
+    "LOG_LEVEL": "INFO",
+    "LOG_FILE": "./logs/agentic_mentor.log",
+    "VECTOR_STORE_TYPE": "chroma",
+    "CHROMA_PERSIST_DIRECTORY": "./data/chroma",
+    "DATABASE_URL": "sqlite:///./data/agentic_mentor.db",
+    "REDIS_URL": "redis://localhost:6379",
+    "AGENT_MEMORY_SIZE": "1000",
+    "AGENT_REFLECTION_ENABLED": "true",
+    "AGENT_LEARNING_RATE": "0.1",
+    "SEMANTIC_CACHE_ENABLED": "true",
+    "SEMANTIC_CACHE_THRESHOLD": "0.92",
+    "SEMANTIC_CACHE_SIZE": "10000",
+    "SEMANTIC_CACHE_TTL": "300",
+    "LLM_CACHE_ENABLED": "false",
+    "LLM_CACHE_THRESHOLD": "0.95",
+    "LLM_CACHE_SIZE": "1000"
+})
+
+
+def port_from_argv(default: int) -> int:
+    """Read ``--port N`` (or ``--port=N``) from the command line; the launchers take no other options"""
+    argv = sys.argv[1:]
+    if "-h" in argv or "--help" in argv:
+        print(f"usage: {Path(sys.argv[0]).name} [--port PORT]   (default port: {default})")
+        sys.exit(0)
+    for i, arg in enumerate(argv):
+        if arg.startswith("--port="):
+            return int(arg.split("=", 1)[1])
+        if arg == "--port" and i + 1 < len(argv):
+            return int(argv[i + 1])
+    return default
+
+
+def bootstrap(port: int, env: Optional[Dict[str, str]] = None):
+    """Apply the launcher environment and run the server on ``port``"""
+    os.environ.update(_DEFAULT_ENV)
+    if env:
+        os.environ.update(env)
+    os.environ["WEB_PORT"] = str(port)
+    
+    try:
+        # Imported here so the heavy model/vector store imports only happen once the
+        # arguments are parsed and the environment is in place
+        from src.main import AgenticMentor
+        
+        app = AgenticMentor()
+        app.run()
+        
+    except KeyboardInterrupt:
+        print("\n🛑 Server stopped by user")
+    except Exception as e:
+        print(f"❌ Error starting server: {e}")
+        import traceback
+        traceback.print_exc()
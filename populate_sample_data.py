@@ -4,12 +4,16 @@ Populate sample data for Agentic Mentor
 Adds sample repository information to the knowledge base
 """
 
+import argparse
 import asyncio
+import hashlib
 import os
 import sys
-import uuid
-from datetime import datetime
+from datetime import datetime, timezone
 from pathlib import Path
+from typing import List
+
+import numpy as np
 
 # Add src to path
 sys.path.insert(0, str(Path(__file__).parent / "src"))
@@ -17,134 +21,199 @@ sys.path.insert(0, str(Path(__file__).parent / "src"))
 from src.knowledge.vector_store import VectorStore
 from src.models import KnowledgeChunk, SourceType
 
-async def populate_sample_data():
+# Embeddings of the sample contents, keyed by content hash, so reruns skip the encoder
+SAMPLE_EMBEDDINGS_PATH = Path(__file__).parent / "data" / "sample_embeddings.npz"
+
+# Rows per Chroma insert; Chroma is fastest with batches of roughly 50-250 rows
+SAMPLE_INSERT_BATCH_SIZE = int(os.getenv("SAMPLE_INSERT_BATCH_SIZE", "100"))
+
+SAMPLE_TOPICS_SUMMARY = "\n".join([
+    "🔍 You can now ask questions about:",
+    "   - Authentication (Auth0 implementation)",
+    "   - Testing strategies (Jest, React Testing Library)",
+    "   - Deployment processes",
+    "   - Database migrations (Flyway)",
+    "   - State management (Redux Toolkit)",
+    "   - API design standards",
+    "   - Monitoring setup (Prometheus/Grafana)",
+    "   - Security best practices",
+    "   - Agentic Mentor project details",
+    "   - Fitness Agent project details",
+]) + "\n"
+
+# Sample repository data based on your GitHub profile:
+# (id, content, source_type, source_id, source_url, metadata)
+SAMPLE_DOCUMENTS = (
+    (
+        "auth-001",
+        "We use Auth0 for authentication across all our React applications. The implementation includes custom hooks for user management and role-based access control. Key files: src/hooks/useAuth.js, src/components/AuthProvider.jsx",
+        SourceType.GITHUB,
+        "frontend-app/auth",
+        "https://github.com/company/frontend-app/blob/main/src/hooks/useAuth.js",
+        {"type": "code", "language": "javascript", "topic": "authentication"}
+    ),
+    (
+        "testing-001",
+        "Our testing strategy uses Jest with React Testing Library for frontend tests. We maintain 80% code coverage minimum. For API testing, we use supertest with custom test utilities. See: tests/api/helpers.js for common test patterns.",
+        SourceType.CONFLUENCE,
+        "testing-guide",
+        "https://company.atlassian.net/wiki/spaces/TECH/pages/123456/Testing+Strategy",
+        {"type": "documentation", "topic": "testing"}
+    ),
+    (
+        "deployment-001",
+        "Deployment process: 1) Run tests in CI/CD pipeline 2) Build Docker image 3) Deploy to staging environment 4) Run integration tests 5) Deploy to production with blue-green deployment. See Jira ticket DEPLOY-123 for detailed process.",
+        SourceType.JIRA,
+        "DEPLOY-123",
+        "https://company.atlassian.net/browse/DEPLOY-123",
+        {"type": "process", "topic": "deployment"}
+    ),
+    (
+        "database-001",
+        "Database migrations are handled with Flyway. We use versioned migration files in src/main/resources/db/migration/. Naming convention: V{version}__{description}.sql. Always test migrations in staging first.",
+        SourceType.GITHUB,
+        "backend-app/db",
+        "https://github.com/company/backend-app/tree/main/src/main/resources/db/migration",
+        {"type": "code", "language": "sql", "topic": "database"}
+    ),
+    (
+        "slack-001",
+        "Team discussion: We decided to use Redux Toolkit instead of MobX for state management because it provides better TypeScript support and has a more predictable API. Migration guide available in Confluence.",
+        SourceType.SLACK,
+        "tech-decisions",
+        "https://company.slack.com/archives/C1234567890/p1234567890",
+        {"type": "discussion", "topic": "state-management"}
+    ),
+    (
+        "api-001",
+        "API design follows RESTful principles with OpenAPI 3.0 specification. All endpoints return consistent JSON responses with error codes. Authentication via JWT tokens. Rate limiting: 1000 requests per hour per user.",
+        SourceType.CONFLUENCE,
+        "api-standards",
+        "https://company.atlassian.net/wiki/spaces/API/pages/789012/API+Standards",
+        {"type": "documentation", "topic": "api"}
+    ),
+    (
+        "monitoring-001",
+        "We use Prometheus for metrics collection and Grafana for visualization. Key metrics: response time, error rate, throughput. Alerts configured for 5xx errors > 1% and response time > 2s.",
+        SourceType.GITHUB,
+        "monitoring-setup",
+        "https://github.com/company/infrastructure/tree/main/monitoring",
+        {"type": "configuration", "topic": "monitoring"}
+    ),
+    (
+        "agentic-mentor-001",
+        "Agentic Mentor is an AI-powered internal knowledge explorer that helps employees find and understand organizational knowledge scattered across various tools like GitHub, Jira, Confluence, Slack, and email.",
+        SourceType.GITHUB,
+        "Agentic-mentor",
+        "https://github.com/maniselvam-v/Agentic-mentor",
+        {"type": "project", "language": "python", "topic": "ai-knowledge"}
+    ),
+    (
+        "fitness-agent-001",
+        "Fitness Agent is an AI-powered fitness application that provides personalized workout recommendations, health tracking, and nutrition guidance. Features include ML models for personalization and React Native mobile apps.",
+        SourceType.GITHUB,
+        "Fitness-Agent-A-Agentic-AI-Project",
+        "https://github.com/maniselvam-v/Fitness-Agent-A-Agentic-AI-Project",
+        {"type": "project", "language": "python", "topic": "fitness-ai"}
+    ),
+    (
+        "security-001",
+        "Security best practices: 1) Use environment variables for secrets 2) Implement rate limiting 3) Validate all inputs 4) Use HTTPS everywhere 5) Regular security audits 6) Keep dependencies updated.",
+        SourceType.CONFLUENCE,
+        "security-guide",
+        "https://company.atlassian.net/wiki/spaces/SEC/pages/456789/Security+Best+Practices",
+        {"type": "documentation", "topic": "security"}
+    ),
+)
+
+
+def build_sample_chunks() -> List[KnowledgeChunk]:
+    """Build one chunk per sample document"""
+    # Naive UTC like every other stored timestamp, without the deprecated utcnow()
+    now = datetime.now(timezone.utc).replace(tzinfo=None)
+    return [
+        KnowledgeChunk(
+            id=chunk_id,
+            content=content,
+            source_type=source_type,
+            source_id=source_id,
+            source_url=source_url,
+            metadata=dict(metadata),
+            created_at=now,
+            updated_at=now
+        )
+        for chunk_id, content, source_type, source_id, source_url, metadata in SAMPLE_DOCUMENTS
+    ]
+
+
+def _content_key(content: str) -> str:
+    return hashlib.sha256(content.encode()).hexdigest()
+
+
+def load_sample_embeddings(vector_store: VectorStore,
+                           chunks: List[KnowledgeChunk],
+                           batch_size: int = 64,
+                           rebuild: bool = False) -> np.ndarray:
+    """Return one embedding per chunk, encoding only contents missing from the saved file"""
+    cached = {}
+    if SAMPLE_EMBEDDINGS_PATH.exists() and not rebuild:
+        with np.load(SAMPLE_EMBEDDINGS_PATH) as saved:
+            cached = dict(zip(saved["keys"].tolist(), saved["vecs"]))
+    
+    keys = [_content_key(chunk.content) for chunk in chunks]
+    missing = list(dict.fromkeys(key for key in keys if key not in cached))
+    if missing:
+        contents = {key: chunk.content for key, chunk in zip(keys, chunks)}
+        vecs = vector_store.embed([contents[key] for key in missing], batch_size=batch_size)
+        cached.update(zip(missing, vecs))
+        SAMPLE_EMBEDDINGS_PATH.parent.mkdir(parents=True, exist_ok=True)
+        np.savez(SAMPLE_EMBEDDINGS_PATH, keys=np.array(list(cached)), vecs=np.stack(list(cached.values())))
+    
+    return np.stack([cached[key] for key in keys])
+
+
+async def _insert_batched(vector_store: VectorStore,
+                          chunks: List[KnowledgeChunk],
+                          embeddings: np.ndarray,
+                          batch_size: int = SAMPLE_INSERT_BATCH_SIZE) -> List[str]:
+    """Insert chunks with their embeddings in consecutive windows of ``batch_size``"""
+    chunk_ids: List[str] = []
+    for start in range(0, len(chunks), batch_size):
+        end = start + batch_size
+        chunk_ids.extend(await vector_store.add_chunks(chunks[start:end], embeddings=embeddings[start:end]))
+    return chunk_ids
+
+
+async def populate_sample_data(rebuild_embeddings: bool = False):
     """Populate the knowledge base with sample repository data"""
     
     print("📚 Populating Agentic Mentor with sample repository data...")
     
+    sample_chunks = build_sample_chunks()
     vector_store = VectorStore()
     
-    # Sample repository data based on your GitHub profile
-    sample_chunks = [
-        KnowledgeChunk(
-            id="auth-001",
-            content="We use Auth0 for authentication across all our React applications. The implementation includes custom hooks for user management and role-based access control. Key files: src/hooks/useAuth.js, src/components/AuthProvider.jsx",
-            source_type=SourceType.GITHUB,
-            source_id="frontend-app/auth",
-            source_url="https://github.com/company/frontend-app/blob/main/src/hooks/useAuth.js",
-            metadata={"type": "code", "language": "javascript", "topic": "authentication"},
-            created_at=datetime.utcnow(),
-            updated_at=datetime.utcnow()
-        ),
-        KnowledgeChunk(
-            id="testing-001",
-            content="Our testing strategy uses Jest with React Testing Library for frontend tests. We maintain 80% code coverage minimum. For API testing, we use supertest with custom test utilities. See: tests/api/helpers.js for common test patterns.",
-            source_type=SourceType.CONFLUENCE,
-            source_id="testing-guide",
-            source_url="https://company.atlassian.net/wiki/spaces/TECH/pages/123456/Testing+Strategy",
-            metadata={"type": "documentation", "topic": "testing"},
-            created_at=datetime.utcnow(),
-            updated_at=datetime.utcnow()
-        ),
-        KnowledgeChunk(
-            id="deployment-001",
-            content="Deployment process: 1) Run tests in CI/CD pipeline 2) Build Docker image 3) Deploy to staging environment 4) Run integration tests 5) Deploy to production with blue-green deployment. See Jira ticket DEPLOY-123 for detailed process.",
-            source_type=SourceType.JIRA,
-            source_id="DEPLOY-123",
-            source_url="https://company.atlassian.net/browse/DEPLOY-123",
-            metadata={"type": "process", "topic": "deployment"},
-            created_at=datetime.utcnow(),
-            updated_at=datetime.utcnow()
-        ),
-        KnowledgeChunk(
-            id="database-001",
-            content="Database migrations are handled with Flyway. We use versioned migration files in src/main/resources/db/migration/. Naming convention: V{version}__{description}.sql. Always test migrations in staging first.",
-            source_type=SourceType.GITHUB,
-            source_id="backend-app/db",
-            source_url="https://github.com/company/backend-app/tree/main/src/main/resources/db/migration",
-            metadata={"type": "code", "language": "sql", "topic": "database"},
-            created_at=datetime.utcnow(),
-            updated_at=datetime.utcnow()
-        ),
-        KnowledgeChunk(
-            id="slack-001",
-            content="Team discussion: We decided to use Redux Toolkit instead of MobX for state management because it provides better TypeScript support and has a more predictable API. Migration guide available in Confluence.",
-            source_type=SourceType.SLACK,
-            source_id="tech-decisions",
-            source_url="https://company.slack.com/archives/C1234567890/p1234567890",
-            metadata={"type": "discussion", "topic": "state-management"},
-            created_at=datetime.utcnow(),
-            updated_at=datetime.utcnow()
-        ),
-        KnowledgeChunk(
-            id="api-001",
-            content="API design follows RESTful principles with OpenAPI 3.0 specification. All endpoints return consistent JSON responses with error codes. Authentication via JWT tokens. Rate limiting: 1000 requests per hour per user.",
-            source_type=SourceType.CONFLUENCE,
-            source_id="api-standards",
-            source_url="https://company.atlassian.net/wiki/spaces/API/pages/789012/API+Standards",
-            metadata={"type": "documentation", "topic": "api"},
-            created_at=datetime.utcnow(),
-            updated_at=datetime.utcnow()
-        ),
-        KnowledgeChunk(
-            id="monitoring-001",
-            content="We use Prometheus for metrics collection and Grafana for visualization. Key metrics: response time, error rate, throughput. Alerts configured for 5xx errors > 1% and response time > 2s.",
-            source_type=SourceType.GITHUB,
-            source_id="monitoring-setup",
-            source_url="https://github.com/company/infrastructure/tree/main/monitoring",
-            metadata={"type": "configuration", "topic": "monitoring"},
-            created_at=datetime.utcnow(),
-            updated_at=datetime.utcnow()
-        ),
-        KnowledgeChunk(
-            id="agentic-mentor-001",
-            content="Agentic Mentor is an AI-powered internal knowledge explorer that helps employees find and understand organizational knowledge scattered across various tools like GitHub, Jira, Confluence, Slack, and email.",
-            source_type=SourceType.GITHUB,
-            source_id="Agentic-mentor",
-            source_url="https://github.com/maniselvam-v/Agentic-mentor",
-            metadata={"type": "project", "language": "python", "topic": "ai-knowledge"},
-            created_at=datetime.utcnow(),
-            updated_at=datetime.utcnow()
-        ),
-        KnowledgeChunk(
-            id="fitness-agent-001",
-            content="Fitness Agent is an AI-powered fitness application that provides personalized workout recommendations, health tracking, and nutrition guidance. Features include ML models for personalization and React Native mobile apps.",
-            source_type=SourceType.GITHUB,
-            source_id="Fitness-Agent-A-Agentic-AI-Project",
-            source_url="https://github.com/maniselvam-v/Fitness-Agent-A-Agentic-AI-Project",
-            metadata={"type": "project", "language": "python", "topic": "fitness-ai"},
-            created_at=datetime.utcnow(),
-            updated_at=datetime.utcnow()
-        ),
-        KnowledgeChunk(
-            id="security-001",
-            content="Security best practices: 1) Use environment variables for secrets 2) Implement rate limiting 3) Validate all inputs 4) Use HTTPS everywhere 5) Regular security audits 6) Keep dependencies updated.",
-            source_type=SourceType.CONFLUENCE,
-            source_id="security-guide",
-            source_url="https://company.atlassian.net/wiki/spaces/SEC/pages/456789/Security+Best+Practices",
-            metadata={"type": "documentation", "topic": "security"},
-            created_at=datetime.utcnow(),
-            updated_at=datetime.utcnow()
-        )
-    ]
-    
     try:
-        # Add chunks to vector store
-        chunk_ids = await vector_store.add_chunks(sample_chunks)
+        # Only samples missing from the store are inserted, so reruns are cheap
+        existing = await vector_store.existing_ids([chunk.id for chunk in sample_chunks])
+        sample_chunks = [chunk for chunk in sample_chunks if chunk.id not in existing]
+        if not sample_chunks:
+            print("✅ Sample data is already up to date")
+            return 0
         
-        print(f"✅ Successfully added {len(chunk_ids)} sample documents to the knowledge base!")
-        print(f"📊 Document count: {len(chunk_ids)}")
-        print(f"🔍 You can now ask questions about:")
-        print(f"   - Authentication (Auth0 implementation)")
-        print(f"   - Testing strategies (Jest, React Testing Library)")
-        print(f"   - Deployment processes")
-        print(f"   - Database migrations (Flyway)")
-        print(f"   - State management (Redux Toolkit)")
-        print(f"   - API design standards")
-        print(f"   - Monitoring setup (Prometheus/Grafana)")
-        print(f"   - Security best practices")
-        print(f"   - Agentic Mentor project details")
-        print(f"   - Fitness Agent project details")
+        # Reuse saved embeddings and encode any new samples in one batched call
+        # Larger batches keep a GPU busy; on CPU smaller ones avoid memory spikes
+        batch_size = 256 if vector_store.on_gpu else 64
+        embeddings = load_sample_embeddings(
+            vector_store, sample_chunks, batch_size=batch_size, rebuild=rebuild_embeddings
+        )
+        
+        chunk_ids = await _insert_batched(vector_store, sample_chunks, embeddings)
+        
+        sys.stdout.write(
+            f"✅ Successfully added {len(chunk_ids)} sample documents to the knowledge base!\n"
+            f"📊 Document count: {len(chunk_ids)}\n"
+            + SAMPLE_TOPICS_SUMMARY
+        )
         
         return len(chunk_ids)
         
@@ -153,4 +222,8 @@ async def populate_sample_data():
         return 0
 
 if __name__ == "__main__":
-    asyncio.run(populate_sample_data()) 
\ No newline at end of file
+    parser = argparse.ArgumentParser(description="Populate the knowledge base with sample data")
+    parser.add_argument("--rebuild-embeddings", action="store_true",
+                        help=f"Re-encode every sample and rewrite {SAMPLE_EMBEDDINGS_PATH.name}")
+    args = parser.parse_args()
+    asyncio.run(populate_sample_data(rebuild_embeddings=args.rebuild_embeddings)) 
\ No newline at end of file
@@ -6,23 +6,76 @@ Helps users configure all necessary API keys
 
 import os
 import json
+import re
+import sys
+from dataclasses import dataclass
 from pathlib import Path
+from typing import Dict, Optional, Tuple
 
-def setup_api_keys():
-    """Interactive API key setup"""
-    print("🔑 Agentic Mentor API Key Setup")
-    print("=" * 50)
-    
-    # Load existing .env if it exists
-    env_file = Path(".env")
-    existing_config = {}
-    if env_file.exists():
-        with open(env_file, 'r') as f:
-            for line in f:
-                if '=' in line and not line.startswith('#'):
-                    key, value = line.strip().split('=', 1)
-                    existing_config[key] = value
-    
+# KEY=value lines of a .env file (comments and blank lines never match)
+_ENV_LINE = re.compile(r'^([A-Z_][A-Z0-9_]*)=(.*?)[ \t\r]*$', re.M)
+
+@dataclass(frozen=True)
+class PromptField:
+    """A value asked for interactively; ``deps`` are only asked for when it is given"""
+    key: str
+    prompt: str
+    deps: Tuple["PromptField", ...] = ()
+
+
+@dataclass(frozen=True)
+class Provider:
+    """An LLM provider or integration configured through one top-level prompt"""
+    name: str
+    field: PromptField
+    flag: Optional[str] = None
+
+
+LLM_PROVIDERS = {
+    "1": Provider("Gemini", PromptField("GEMINI_API_KEY", "Enter your Gemini API Key (or press Enter to use existing): "), "USE_GEMINI"),
+    "2": Provider("OpenAI", PromptField("OPENAI_API_KEY", "Enter your OpenAI API Key: "), "USE_OPENAI"),
+    "3": Provider("Grok", PromptField("GROK_API_KEY", "Enter your Grok API Key: "), "USE_GROK"),
+}
+
+INTEGRATIONS = (
+    ("📚", Provider("GitHub", PromptField(
+        "GITHUB_TOKEN", "Enter your GitHub Personal Access Token (or press Enter to skip): ", (
+            PromptField("GITHUB_ORGANIZATION", "Enter your GitHub organization name: "),
+        )
+    ))),
+    ("📋", Provider("Jira", PromptField(
+        "JIRA_API_TOKEN", "Enter your Jira API Token (or press Enter to skip): ", (
+            PromptField("JIRA_SERVER", "Enter your Jira server URL (e.g., https://company.atlassian.net): "),
+            PromptField("JIRA_USERNAME", "Enter your Jira email: "),
+        )
+    ))),
+    ("📖", Provider("Confluence", PromptField(
+        "CONFLUENCE_API_TOKEN", "Enter your Confluence API Token (or press Enter to skip): ", (
+            PromptField("CONFLUENCE_SERVER", "Enter your Confluence server URL: "),
+            PromptField("CONFLUENCE_USERNAME", "Enter your Confluence email: "),
+        )
+    ))),
+    ("💬", Provider("Slack", PromptField(
+        "SLACK_BOT_TOKEN", "Enter your Slack Bot Token (or press Enter to skip): ", (
+            PromptField("SLACK_APP_TOKEN", "Enter your Slack App Token: "),
+        )
+    ))),
+)
+
+
+def _ask(field: PromptField, config: Dict[str, str]) -> bool:
+    """Prompt for ``field`` and, if answered, its dependents; returns whether it was answered"""
+    value = input(field.prompt).strip()
+    if not value:
+        return False
+    config[field.key] = value
+    for dep in field.deps:
+        _ask(dep, config)
+    return True
+
+
+def _prompt_config(existing_config: Dict[str, str]):
+    """Fill ``existing_config`` from interactive prompts"""
     print("\n📋 Required API Keys:")
     print("1. LLM Provider (Choose one)")
     print("2. Optional: GitHub, Jira, Confluence, Slack")
@@ -36,78 +89,35 @@ def setup_api_keys():
     
     llm_choice = input("Enter your choice (1-3): ").strip()
     
-    if llm_choice == "1":
-        gemini_key = input("Enter your Gemini API Key (or press Enter to use existing): ").strip()
-        if gemini_key:
-            existing_config["GEMINI_API_KEY"] = gemini_key
-        existing_config["USE_GEMINI"] = "true"
-        existing_config["USE_OPENAI"] = "false"
-        existing_config["USE_GROK"] = "false"
-        print("✅ Gemini configured!")
-        
-    elif llm_choice == "2":
-        openai_key = input("Enter your OpenAI API Key: ").strip()
-        if openai_key:
-            existing_config["OPENAI_API_KEY"] = openai_key
-        existing_config["USE_GEMINI"] = "false"
-        existing_config["USE_OPENAI"] = "true"
-        existing_config["USE_GROK"] = "false"
-        print("✅ OpenAI configured!")
-        
-    elif llm_choice == "3":
-        grok_key = input("Enter your Grok API Key: ").strip()
-        if grok_key:
-            existing_config["GROK_API_KEY"] = grok_key
-        existing_config["USE_GEMINI"] = "false"
-        existing_config["USE_OPENAI"] = "false"
-        existing_config["USE_GROK"] = "true"
-        print("✅ Grok configured!")
-    
-    # GitHub Integration
-    print("\n📚 GitHub Integration (Optional):")
-    github_token = input("Enter your GitHub Personal Access Token (or press Enter to skip): ").strip()
-    if github_token:
-        existing_config["GITHUB_TOKEN"] = github_token
-        github_org = input("Enter your GitHub organization name: ").strip()
-        if github_org:
-            existing_config["GITHUB_ORGANIZATION"] = github_org
-        print("✅ GitHub integration configured!")
-    
-    # Jira Integration
-    print("\n📋 Jira Integration (Optional):")
-    jira_token = input("Enter your Jira API Token (or press Enter to skip): ").strip()
-    if jira_token:
-        existing_config["JIRA_API_TOKEN"] = jira_token
-        jira_server = input("Enter your Jira server URL (e.g., https://company.atlassian.net): ").strip()
-        if jira_server:
-            existing_config["JIRA_SERVER"] = jira_server
-        jira_username = input("Enter your Jira email: ").strip()
-        if jira_username:
-            existing_config["JIRA_USERNAME"] = jira_username
-        print("✅ Jira integration configured!")
-    
-    # Confluence Integration
-    print("\n📖 Confluence Integration (Optional):")
-    confluence_token = input("Enter your Confluence API Token (or press Enter to skip): ").strip()
-    if confluence_token:
-        existing_config["CONFLUENCE_API_TOKEN"] = confluence_token
-        confluence_server = input("Enter your Confluence server URL: ").strip()
-        if confluence_server:
-            existing_config["CONFLUENCE_SERVER"] = confluence_server
-        confluence_username = input("Enter your Confluence email: ").strip()
-        if confluence_username:
-            existing_config["CONFLUENCE_USERNAME"] = confluence_username
-        print("✅ Confluence integration configured!")
-    
-    # Slack Integration
-    print("\n💬 Slack Integration (Optional):")
-    slack_bot_token = input("Enter your Slack Bot Token (or press Enter to skip): ").strip()
-    if slack_bot_token:
-        existing_config["SLACK_BOT_TOKEN"] = slack_bot_token
-        slack_app_token = input("Enter your Slack App Token: ").strip()
-        if slack_app_token:
-            existing_config["SLACK_APP_TOKEN"] = slack_app_token
-        print("✅ Slack integration configured!")
+    chosen = LLM_PROVIDERS.get(llm_choice)
+    if chosen:
+        _ask(chosen.field, existing_config)
+        for provider in LLM_PROVIDERS.values():
+            existing_config[provider.flag] = "true" if provider is chosen else "false"
+        print(f"✅ {chosen.name} configured!")
+    
+    for icon, integration in INTEGRATIONS:
+        print(f"\n{icon} {integration.name} Integration (Optional):")
+        if _ask(integration.field, existing_config):
+            print(f"✅ {integration.name} integration configured!")
+
+
+def setup_api_keys(config_path: Optional[str] = None):
+    """Interactive API key setup, or scripted when ``config_path`` points to a JSON file"""
+    print("🔑 Agentic Mentor API Key Setup")
+    print("=" * 50)
+    
+    # Load existing .env if it exists
+    env_file = Path(".env")
+    existing_config = {}
+    if env_file.exists():
+        existing_config = dict(_ENV_LINE.findall(env_file.read_text()))
+    
+    if config_path:
+        # Scripted setup: take every value from the config file without prompting
+        existing_config.update((key, str(value)) for key, value in json.loads(Path(config_path).read_text()).items())
+    else:
+        _prompt_config(existing_config)
     
     # Write configuration to .env file
     print("\n💾 Saving configuration...")
@@ -116,10 +126,14 @@ def setup_api_keys():
     with open("env.example", 'r') as f:
         template_content = f.read()
     
-    # Replace values with user input
-    for key, value in existing_config.items():
-        template_content = template_content.replace(f"{key}=your_{key.lower()}_here", f"{key}={value}")
-        template_content = template_content.replace(f"{key}=your-{key.lower()}-here", f"{key}={value}")
+    # Replace placeholder values with user input in a single pass over the template
+    def fill_placeholder(match):
+        key, value = match.groups()
+        if key in existing_config and value in (f"your_{key.lower()}_here", f"your-{key.lower()}-here"):
+            return f"{key}={existing_config[key]}"
+        return match.group(0)
+    
+    template_content = _ENV_LINE.sub(fill_placeholder, template_content)
     
     # Write to .env file
     with open(".env", 'w') as f:
@@ -128,25 +142,36 @@ def setup_api_keys():
     print("✅ Configuration saved to .env file!")
     
     # Show next steps
-    print("\n🚀 Next Steps:")
-    print("1. Run: python setup_knowledge_base.py")
-    print("2. Run: python run_server.py")
-    print("3. Visit: http://localhost:3000")
+    sys.stdout.write(
+        "\n🚀 Next Steps:\n"
+        "1. Run: python setup_knowledge_base.py\n"
+        "2. Run: python run_server.py\n"
+        "3. Visit: http://localhost:3000\n"
+    )
     
     return True
 
 def get_api_key_links():
     """Show links to get API keys"""
-    print("\n🔗 API Key Sources:")
-    print("• Gemini: https://makersuite.google.com/app/apikey")
-    print("• OpenAI: https://platform.openai.com/api-keys")
-    print("• GitHub: https://github.com/settings/tokens")
-    print("• Jira: https://id.atlassian.com/manage-profile/security/api-tokens")
-    print("• Slack: https://api.slack.com/apps")
+    sys.stdout.write(
+        "\n🔗 API Key Sources:\n"
+        "• Gemini: https://makersuite.google.com/app/apikey\n"
+        "• OpenAI: https://platform.openai.com/api-keys\n"
+        "• GitHub: https://github.com/settings/tokens\n"
+        "• Jira: https://id.atlassian.com/manage-profile/security/api-tokens\n"
+        "• Slack: https://api.slack.com/apps\n"
+    )
 
 if __name__ == "__main__":
+    import argparse
+    
+    parser = argparse.ArgumentParser(description="Configure Agentic Mentor API keys")
+    parser.add_argument("--config", help="JSON file of KEY: value settings to apply without prompting")
+    
+    args = parser.parse_args()
+    
     try:
-        setup_api_keys()
+        setup_api_keys(args.config)
         get_api_key_links()
     except KeyboardInterrupt:
         print("\n\n❌ Setup cancelled.")
@@ -45,9 +45,6 @@ def setup_gemini():
         os.environ["USE_GEMINI"] = "true"
         os.environ["GEMINI_API_KEY"] = gemini_key
         
-        # Initialize client
-        client = LLMClient()
-        
         # Test with a simple query
         test_messages = [
             {"role": "user", "content": "Hello! Can you respond with 'Gemini is working!'?"}
@@ -57,7 +54,9 @@ def setup_gemini():
         import asyncio
         
         async def test_connection():
-            response = await client.call_llm(test_messages)
+            # The client's pooled connections are closed again when the block exits
+            async with LLMClient() as client:
+                response = await client.call_llm(test_messages)
             print(f"✅ Gemini Response: {response}")
             return True
         
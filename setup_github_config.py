@@ -3,21 +3,37 @@
 GitHub Configuration Setup for Agentic Mentor
 """
 
+import hashlib
 import os
+import re
 import sys
+import tempfile
+from functools import lru_cache
 from pathlib import Path
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# .env keys owned by this script; any existing lines for them are replaced as one block
+_GITHUB_KEYS = frozenset({"GITHUB_TOKEN", "GITHUB_TOKENS", "GITHUB_ORGANIZATION", "GITHUB_REPOS"})
+_GH_LINE_RE = re.compile(r"(?m)^(?:# GitHub Integration\n)?(?:%s)=.*(?:\n|\Z)" % "|".join(sorted(_GITHUB_KEYS)))
+
+
 def setup_github_config():
     """Setup GitHub configuration for Agentic Mentor"""
     
     print("🔑 GitHub Configuration Setup for Agentic Mentor")
     print("=" * 50)
     
-    # Get GitHub token
-    github_token = input("Enter your GitHub Personal Access Token: ").strip()
-    if not github_token:
+    # Get GitHub token(s) - several tokens raise the crawler's combined rate limit
+    tokens_input = input("Enter your GitHub Personal Access Token (comma-separate several to rotate them): ").strip()
+    github_tokens = [token.strip() for token in tokens_input.split(",") if token.strip()]
+    if not github_tokens:
         print("❌ GitHub token is required!")
         return False
+    github_token = github_tokens[0]
     
     # Get organization (optional)
     github_org = input("Enter your GitHub organization name (optional): ").strip()
@@ -32,48 +48,47 @@ def setup_github_config():
         print("❌ .env file not found!")
         return False
     
-    # Read current .env content
-    with open(env_file, 'r') as f:
-        content = f.read()
-    
     # Add or update GitHub configuration
     github_config = f"""
 # GitHub Integration
 GITHUB_TOKEN={github_token}
 """
     
+    if len(github_tokens) > 1:
+        github_config += f"GITHUB_TOKENS={','.join(github_tokens)}\n"
+    
     if github_org:
         github_config += f"GITHUB_ORGANIZATION={github_org}\n"
     
     if github_repos:
         github_config += f"GITHUB_REPOS={','.join(github_repos)}\n"
     
-    # Check if GitHub config already exists
-    if "GITHUB_TOKEN=" in content:
-        # Update existing config
-        lines = content.split('\n')
-        new_lines = []
-        skip_github = False
-        
-        for line in lines:
-            if line.startswith("GITHUB_TOKEN=") or line.startswith("GITHUB_ORGANIZATION=") or line.startswith("GITHUB_REPOS="):
-                if not skip_github:
-                    new_lines.extend(github_config.strip().split('\n'))
-                    skip_github = True
-                continue
-            new_lines.append(line)
-        
-        content = '\n'.join(new_lines)
-    else:
-        # Add new config
+    # Replace the first GitHub line (with its section comment) by the new block and
+    # drop the rest in one regex pass, then swap the result in atomically
+    github_block = github_config.lstrip()
+    with open(env_file, 'r', buffering=1 << 20) as f:
+        content = f.read()
+    
+    replaced = 0
+    
+    def _replace(match):
+        nonlocal replaced
+        replaced += 1
+        return github_block if replaced == 1 else ""
+    
+    content = _GH_LINE_RE.sub(_replace, content)
+    if not replaced:
         content += github_config
     
-    # Write updated .env file
-    with open(env_file, 'w') as f:
-        f.write(content)
+    with tempfile.NamedTemporaryFile('w', dir=env_file.parent, delete=False, buffering=1 << 20) as tmp:
+        tmp.write(content)
+    os.replace(tmp.name, env_file)
     
     print("✅ GitHub configuration updated in .env file!")
-    print(f"   Token: {github_token[:10]}...")
+    # A short hash identifies the token without echoing any of the secret itself
+    print(f"   Token fingerprint: {hashlib.blake2b(github_token.encode(), digest_size=4).hexdigest()}")
+    if len(github_tokens) > 1:
+        print(f"   Rotating across {len(github_tokens)} tokens")
     if github_org:
         print(f"   Organization: {github_org}")
     if github_repos:
@@ -81,32 +96,45 @@ GITHUB_TOKEN={github_token}
     
     return True
 
+@lru_cache(maxsize=1)
+def _cached_token() -> str:
+    """GitHub token from settings, read once (settings load .env on first import)"""
+    from src.config import settings
+    return settings.github_token
+
+
+@lru_cache(maxsize=1)
+def _get_gh_session():
+    """Authenticated session shared by every GitHub API call so connections are reused"""
+    import requests
+    
+    session = requests.Session()
+    session.headers.update({
+        "Authorization": f"token {_cached_token()}",
+        "Accept": "application/vnd.github.v3+json"
+    })
+    return session
+
+
 def test_github_connection():
     """Test GitHub API connection"""
     
     print("\n🧪 Testing GitHub API Connection...")
     
     try:
-        import requests
-        from src.config import settings
-        
         # Test GitHub API
-        headers = {
-            "Authorization": f"token {settings.github_token}",
-            "Accept": "application/vnd.github.v3+json"
-        }
-        
-        response = requests.get("https://api.github.com/user", headers=headers)
+        response = _get_gh_session().get("https://api.github.com/user", timeout=5)
         
         if response.status_code == 200:
-            user_data = response.json()
+            user_data = orjson.loads(response.content) if orjson else response.json()
             print(f"✅ GitHub connection successful!")
             print(f"   User: {user_data.get('login', 'Unknown')}")
             print(f"   Name: {user_data.get('name', 'Unknown')}")
             return True
         else:
             print(f"❌ GitHub connection failed: {response.status_code}")
-            print(f"   Error: {response.text}")
+            # Error pages can be large HTML documents; the start is enough to diagnose
+            print(f"   Error: {response.text[:256]}")
             return False
             
     except Exception as e:
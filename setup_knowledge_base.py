@@ -5,117 +5,265 @@ Helps users populate their knowledge base with organizational data
 """
 
 import os
+import io
+import sys
 import asyncio
+import hashlib
+import threading
+from datetime import datetime, timezone
 from pathlib import Path
-from src.knowledge.vector_store import VectorStore
-from src.knowledge.crawlers import GitHubCrawler, JiraCrawler, ConfluenceCrawler
-from src.config import settings
+from typing import Optional, TextIO
+
+# src.* imports live in the functions that use them so importing this module stays cheap;
+# the vector store and crawlers pull in chromadb, sentence-transformers and the source SDKs
+
+# Sample organizational data: (content, type, source_url, department, priority)
+_SAMPLES = [
+    (
+        "Our authentication strategy uses OAuth 2.0 with JWT tokens. All API endpoints require valid authentication headers.",
+        "documentation",
+        "https://docs.company.com/auth",
+        "security",
+        "high"
+    ),
+    (
+        "Deployment process: 1) Run tests 2) Build Docker image 3) Deploy to staging 4) Run integration tests 5) Deploy to production",
+        "process",
+        "https://confluence.company.com/deployment",
+        "devops",
+        "medium"
+    ),
+    (
+        "Code review guidelines: All PRs must have at least 2 approvals, pass all tests, and follow coding standards.",
+        "policy",
+        "https://github.com/company/repo/pull/123",
+        "engineering",
+        "high"
+    ),
+]
 
 class KnowledgeBaseSetup:
     """Setup and populate the knowledge base with organizational data"""
     
     def __init__(self):
+        from src.knowledge.crawlers import new_http_session
+        from src.knowledge.vector_store import VectorStore
+        
         self.vector_store = VectorStore()
+        # One connection pool for every HTTP call made by the integrations
+        self.http = new_http_session()
+        self._crawler_agent = None
+    
+    def close(self):
+        """Release pooled HTTP connections"""
+        self.http.close()
         
-    async def setup_sample_data(self):
-        """Add sample organizational data for testing"""
-        print("📚 Setting up sample knowledge base...")
-        
-        sample_data = [
-            {
-                "content": "Our authentication strategy uses OAuth 2.0 with JWT tokens. All API endpoints require valid authentication headers.",
-                "source_type": "documentation",
-                "source_url": "https://docs.company.com/auth",
-                "metadata": {"department": "security", "priority": "high"}
-            },
-            {
-                "content": "Deployment process: 1) Run tests 2) Build Docker image 3) Deploy to staging 4) Run integration tests 5) Deploy to production",
-                "source_type": "process",
-                "source_url": "https://confluence.company.com/deployment",
-                "metadata": {"department": "devops", "priority": "medium"}
-            },
-            {
-                "content": "Code review guidelines: All PRs must have at least 2 approvals, pass all tests, and follow coding standards.",
-                "source_type": "policy",
-                "source_url": "https://github.com/company/repo/pull/123",
-                "metadata": {"department": "engineering", "priority": "high"}
-            }
-        ]
+    async def setup_sample_data(self, out: Optional[TextIO] = None):
+        """Add sample organizational data for testing, reporting progress to ``out`` (stdout by default)"""
+        print("📚 Setting up sample knowledge base...", file=out)
+        from src.models import KnowledgeChunk, SourceType
+        
+        # IDs are content hashes, so re-running setup skips samples that are already stored
+        ids = [hashlib.sha256(sample[0].encode()).hexdigest() for sample in _SAMPLES]
+        existing = await self.vector_store.existing_ids(ids)
         
-        for item in sample_data:
-            await self.vector_store.add_chunk(
-                content=item["content"],
-                source_type=item["source_type"],
-                source_url=item["source_url"],
-                metadata=item["metadata"]
+        # New samples share one timestamp and go to the store in a single batched add
+        now = datetime.now(timezone.utc).replace(tzinfo=None)
+        sample_chunks = [
+            KnowledgeChunk(
+                id=doc_id,
+                content=content,
+                source_type=SourceType.MANUAL,
+                source_id="system_docs",
+                source_url=source_url,
+                metadata={"type": doc_type, "department": department, "priority": priority},
+                created_at=now,
+                updated_at=now
             )
+            for doc_id, (content, doc_type, source_url, department, priority) in zip(ids, _SAMPLES)
+            if doc_id not in existing
+        ]
+        await self.vector_store.add_chunks(sample_chunks)
         
-        print(f"✅ Added {len(sample_data)} sample documents")
+        print(f"✅ Added {len(sample_chunks)} sample documents ({len(existing)} already present)", file=out)
+    
+    async def _crawl_into_store(self, crawler, config: dict) -> int:
+        """Crawl through CrawlerAgent, whose batch writer stores chunks while fetching continues;
+        returns how many new chunks were stored"""
+        from src.agents.crawler_agent import CrawlerAgent
+        
+        if self._crawler_agent is None:
+            self._crawler_agent = CrawlerAgent(self.vector_store)
+        agent = self._crawler_agent
+        # Only this agent uses the crawler set up with the credentials entered here;
+        # the process-wide shared crawlers are left alone
+        agent.crawlers = {**agent.crawlers, crawler.source_type: crawler}
+        result = await agent.process({"source_type": crawler.source_type.value, "config": config})
+        return len(result["chunk_ids"])
     
     async def setup_github_integration(self, repo_url: str, token: str):
         """Setup GitHub repository crawling"""
         print(f"🔗 Setting up GitHub integration for {repo_url}")
         
-        crawler = GitHubCrawler(token)
-        await crawler.crawl_repository(repo_url)
+        from src.knowledge.crawlers import GitHubCrawler
         
-        print("✅ GitHub integration complete")
+        crawler = GitHubCrawler(http=self.http)
+        crawler.github_token = token
+        # Accept either owner/repo or a full https://github.com/owner/repo URL
+        repo = repo_url.rstrip("/").split("github.com/")[-1]
+        if repo.endswith(".git"):
+            repo = repo[:-len(".git")]
+        stored = await self._crawl_into_store(crawler, {"repos": [repo]})
+        
+        print(f"✅ GitHub integration complete ({stored} new chunks)")
     
     async def setup_jira_integration(self, server_url: str, username: str, token: str):
         """Setup Jira integration"""
         print(f"🔗 Setting up Jira integration for {server_url}")
         
-        crawler = JiraCrawler(server_url, username, token)
-        await crawler.crawl_projects()
+        from src.knowledge.crawlers import JiraCrawler
+        
+        crawler = JiraCrawler()
+        crawler.server, crawler.username, crawler.api_token = server_url, username, token
+        stored = await self._crawl_into_store(crawler, {})
         
-        print("✅ Jira integration complete")
+        print(f"✅ Jira integration complete ({stored} new chunks)")
     
     async def setup_confluence_integration(self, server_url: str, username: str, token: str):
         """Setup Confluence integration"""
         print(f"🔗 Setting up Confluence integration for {server_url}")
         
-        crawler = ConfluenceCrawler(server_url, username, token)
-        await crawler.crawl_spaces()
+        from src.knowledge.crawlers import ConfluenceCrawler
         
-        print("✅ Confluence integration complete")
+        crawler = ConfluenceCrawler()
+        crawler.server, crawler.username, crawler.api_token = server_url, username, token
+        stored = await self._crawl_into_store(crawler, {})
+        
+        print(f"✅ Confluence integration complete ({stored} new chunks)")
     
-    async def run_setup(self):
-        """Run the complete knowledge base setup"""
+    async def run_setup(self, settings=None):
+        """Run the complete knowledge base setup with ``settings`` (the global settings by default)"""
         print("🚀 Starting Agentic Mentor Knowledge Base Setup")
         print("=" * 50)
         
-        # 1. Setup sample data
-        await self.setup_sample_data()
-        
-        # 2. Setup integrations (if configured)
-        if settings.github_token:
-            print("\n📋 GitHub Integration:")
-            print("Enter your GitHub repository URL (or press Enter to skip):")
-            repo_url = input().strip()
-            if repo_url:
-                await self.setup_github_integration(repo_url, settings.github_token)
-        
-        if settings.jira_api_token:
-            print("\n📋 Jira Integration:")
-            print("Enter your Jira server URL (or press Enter to skip):")
-            server_url = input().strip()
-            if server_url:
-                await self.setup_jira_integration(server_url, settings.jira_username, settings.jira_api_token)
-        
-        if settings.confluence_api_token:
-            print("\n📋 Confluence Integration:")
-            print("Enter your Confluence server URL (or press Enter to skip):")
-            server_url = input().strip()
-            if server_url:
-                await self.setup_confluence_integration(server_url, settings.confluence_username, settings.confluence_api_token)
+        if settings is None:
+            from src.config import settings
+        
+        # Read the credentials once: the prompts and the integrations they schedule
+        # all use this one snapshot
+        github_token = settings.github_token
+        jira_username, jira_api_token = settings.jira_username, settings.jira_api_token
+        confluence_username, confluence_api_token = settings.confluence_username, settings.confluence_api_token
+        
+        # 1. Load sample data in the background while the prompts below wait for the user;
+        #    its progress is held back until the prompts are answered
+        sample_output = _HeldOutput()
+        sample_task = asyncio.create_task(self.setup_sample_data(sample_output))
+        
+        # 2. Ask for every integration first, then crawl the chosen ones concurrently
+        integrations = []
+        try:
+            if github_token:
+                print("\n📋 GitHub Integration:")
+                print("Enter your GitHub repository URL (or press Enter to skip):")
+                repo_url = (await _ainput()).strip()
+                if repo_url:
+                    integrations.append(self.setup_github_integration(repo_url, github_token))
+            
+            if jira_api_token:
+                print("\n📋 Jira Integration:")
+                print("Enter your Jira server URL (or press Enter to skip):")
+                server_url = (await _ainput()).strip()
+                if server_url:
+                    integrations.append(self.setup_jira_integration(server_url, jira_username, jira_api_token))
+            
+            if confluence_api_token:
+                print("\n📋 Confluence Integration:")
+                print("Enter your Confluence server URL (or press Enter to skip):")
+                server_url = (await _ainput()).strip()
+                if server_url:
+                    integrations.append(self.setup_confluence_integration(server_url, confluence_username, confluence_api_token))
+        except BaseException:
+            sample_task.cancel()
+            for integration in integrations:
+                integration.close()
+            raise
+        finally:
+            sample_output.release()
+        
+        results = await asyncio.gather(sample_task, *integrations, return_exceptions=True)
+        if isinstance(results[0], BaseException):
+            raise results[0]
+        for result in results[1:]:
+            if isinstance(result, Exception):
+                print(f"❌ Integration failed: {result}")
         
         print("\n🎉 Knowledge base setup complete!")
         print("Your Agentic Mentor is now ready to answer questions about your organization!")
 
+
+class _HeldOutput(io.StringIO):
+    """Text stream that buffers writes until ``release()``, then passes them straight to stdout"""
+    
+    released = False
+    
+    def write(self, text: str) -> int:
+        if self.released:
+            return sys.stdout.write(text)
+        return super().write(text)
+    
+    def release(self):
+        if not self.released:
+            self.released = True
+            sys.stdout.write(self.getvalue())
+
+
+async def _ainput() -> str:
+    """``input()`` without blocking the event loop.
+    
+    The read runs in a daemon thread rather than ``asyncio.to_thread``: an executor
+    thread stuck in ``input()`` can't be cancelled, so on Ctrl-C ``asyncio.run``
+    would wait for it until Enter is pressed.
+    """
+    loop = asyncio.get_running_loop()
+    future = loop.create_future()
+    
+    def settle(line: Optional[str], error: Optional[BaseException]):
+        if future.done():
+            return
+        if error is not None:
+            future.set_exception(error)
+        else:
+            future.set_result(line)
+    
+    def read():
+        try:
+            line, error = input(), None
+        except BaseException as e:  # EOFError when stdin is closed
+            line, error = None, e
+        try:
+            loop.call_soon_threadsafe(settle, line, error)
+        except RuntimeError:
+            pass  # the loop is already closed: nobody is waiting any more
+    
+    threading.Thread(target=read, daemon=True).start()
+    return await future
+
 async def main():
     """Main setup function"""
+    from src.config import settings
+    
     setup = KnowledgeBaseSetup()
-    await setup.run_setup()
+    try:
+        await setup.run_setup(settings)
+    finally:
+        setup.close()
 
 if __name__ == "__main__":
-    asyncio.run(main()) 
\ No newline at end of file
+    try:
+        asyncio.run(main())
+    except KeyboardInterrupt:
+        print("\n⏹️ Setup cancelled", flush=True)
+        # Skip interpreter shutdown: an _ainput thread may still hold stdin's lock,
+        # which makes finalization abort
+        os._exit(130)
\ No newline at end of file
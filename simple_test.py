@@ -3,6 +3,7 @@
 Simple test to check ChromaDB contents without loading embedding model
 """
 
+import os
 import sys
 from pathlib import Path
 
@@ -10,6 +11,7 @@ from pathlib import Path
 sys.path.insert(0, str(Path(__file__).parent / "src"))
 
 import chromadb
+import pandas as pd
 from chromadb.config import Settings
 
 def test_chroma_directly():
@@ -19,11 +21,18 @@ def test_chroma_directly():
     print("=" * 40)
     
     try:
-        # Initialize ChromaDB client
-        client = chromadb.PersistentClient(
-            path="./data/chroma",
-            settings=Settings(anonymized_telemetry=False)
-        )
+        # Initialize ChromaDB client (a Chroma server when CHROMA_SERVER_HOST is set)
+        if os.getenv("CHROMA_SERVER_HOST"):
+            client = chromadb.HttpClient(
+                host=os.environ["CHROMA_SERVER_HOST"],
+                port=int(os.getenv("CHROMA_SERVER_PORT", "8000")),
+                settings=Settings(anonymized_telemetry=False)
+            )
+        else:
+            client = chromadb.PersistentClient(
+                path="./data/chroma",
+                settings=Settings(anonymized_telemetry=False)
+            )
         
         # Get the collection
         collection = client.get_or_create_collection("knowledge_chunks")
@@ -48,26 +57,27 @@ def test_chroma_directly():
             
             # Test project extraction
             print("\n🔍 Testing Project Extraction:")
-            project_groups = {}
+            metadatas = pd.DataFrame({
+                "source_id": [m.get('source_id', '') for m in results['metadatas']],
+                "source_type": [m.get('source_type', 'unknown') for m in results['metadatas']],
+            })
             
-            for i, metadata in enumerate(results['metadatas']):
-                source_id = metadata.get('source_id', '')
-                source_type = metadata.get('source_type', 'unknown')
-                
-                # Extract project name
-                if "/" in source_id:
-                    project_name = source_id.split("/")[0]
-                else:
-                    project_name = source_id
-                
-                if project_name and project_name != "" and project_name != "unknown":
-                    if project_name not in project_groups:
-                        project_groups[project_name] = {
-                            "name": project_name,
-                            "documents": 0,
-                            "source_type": source_type
-                        }
-                    project_groups[project_name]["documents"] += 1
+            # Project name is everything before the first "/" of the source id
+            metadatas["project"] = metadatas["source_id"].str.split("/", n=1).str[0]
+            metadatas = metadatas[metadatas["project"].ne("") & metadatas["project"].ne("unknown")]
+            
+            grouped = metadatas.groupby("project", sort=False).agg(
+                documents=("project", "size"),
+                source_type=("source_type", "first"),
+            )
+            project_groups = {
+                row.Index: {
+                    "name": row.Index,
+                    "documents": int(row.documents),
+                    "source_type": row.source_type
+                }
+                for row in grouped.itertuples()
+            }
             
             print(f"   Found {len(project_groups)} projects:")
             for project_name, info in project_groups.items():
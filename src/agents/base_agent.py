@@ -2,21 +2,73 @@
 Base agent class for Agentic Mentor
 """
 
+import asyncio
+import hashlib
+import json
 from abc import ABC, abstractmethod
-from typing import Dict, Any, List, Optional
+from collections import OrderedDict
+from typing import Dict, Any, List, Optional, Tuple
 from loguru import logger
-from src.llm_client import LLMClient
+from src.llm_client import LLMClient, is_fallback_reply
 from src.config import settings
 
 
+class _LLMResponseCache:
+    """Exact-match layer (SHA-256 of the request) in front of a semantic layer.
+    
+    The semantic layer matches on the embedding of the caller's query text only,
+    kept apart per model and temperature; it needs an embedder, so only agents
+    with a vector store that pass ``semantic_text`` use it.
+    """
+    
+    def __init__(self, threshold: float, max_size: int):
+        self.threshold = threshold
+        self.max_size = max_size
+        self.exact: "OrderedDict[str, str]" = OrderedDict()
+        self._semantic: Dict[Tuple[Optional[str], float], Any] = {}
+    
+    def semantic(self, model: Optional[str], temperature: float):
+        """Semantic cache for replies generated with this model and temperature"""
+        cache = self._semantic.get((model, temperature))
+        if cache is None:
+            from src.knowledge.semantic_cache import SemanticCache
+            
+            cache = self._semantic[(model, temperature)] = SemanticCache(self.threshold, self.max_size)
+        return cache
+    
+    @staticmethod
+    def key(messages: List[Dict[str, str]], model: Optional[str], temperature: float) -> str:
+        payload = json.dumps([model, temperature, messages], sort_keys=True)
+        return hashlib.sha256(payload.encode()).hexdigest()
+    
+    def get(self, key: str) -> Optional[str]:
+        response = self.exact.get(key)
+        if response is not None:
+            self.exact.move_to_end(key)
+        return response
+    
+    def put(self, key: str, response: str) -> None:
+        self.exact[key] = response
+        self.exact.move_to_end(key)
+        if len(self.exact) > self.max_size:
+            self.exact.popitem(last=False)
+
+
 class BaseAgent(ABC):
     """Base class for all agents in the system"""
     
+    # Set to False where a caller already caches whole answers semantically
+    semantic_llm_cache = True
+    
     def __init__(self, name: str, description: str):
         self.name = name
         self.description = description
-        self.llm_client = LLMClient()
+        self.llm_client = LLMClient.shared()
         self.logger = logger.bind(agent=name)
+        self._llm_cache = (
+            _LLMResponseCache(settings.llm_cache_threshold, settings.llm_cache_size)
+            if settings.llm_cache_enabled else None
+        )
         
     @abstractmethod
     async def process(self, input_data: Dict[str, Any]) -> Dict[str, Any]:
@@ -26,21 +78,61 @@ class BaseAgent(ABC):
     async def _call_llm(self, 
                         messages: List[Dict[str, str]], 
                         model: Optional[str] = None,
-                        temperature: float = 0.7) -> str:
-        """Call the LLM with given messages"""
+                        temperature: float = 0.7,
+                        semantic_text: Optional[str] = None) -> str:
+        """Call the LLM with given messages.
+        
+        ``semantic_text`` is the user's own query; when given, a reply cached for a
+        near-identical query (same model and temperature) can be reused.
+        """
+        cache = self._llm_cache
+        if cache is None:
+            return await self._call_llm_uncached(messages, model, temperature)
+        
+        key = cache.key(messages, model, temperature)
+        response = cache.get(key)
+        if response is not None:
+            return response
+        
+        # Semantic layer: a reworded query close enough to an earlier one gets its reply.
+        # Only the query is embedded; the shared system prompt and retrieved context would
+        # otherwise dominate the embedding and make unrelated questions look alike
+        vector_store = getattr(self, "vector_store", None)
+        embedding = None
+        if vector_store is not None and semantic_text and self.semantic_llm_cache:
+            embedding = (await asyncio.to_thread(vector_store.embed, [semantic_text]))[0]
+            response = cache.semantic(model, temperature).lookup(embedding)
+            if response is not None:
+                cache.put(key, response)
+                return response
+        
+        response = await self._call_llm_uncached(messages, model, temperature)
+        if not is_fallback_reply(response):
+            cache.put(key, response)
+            if embedding is not None:
+                cache.semantic(model, temperature).add(embedding, response)
+        return response
+    
+    async def _call_llm_uncached(self,
+                                 messages: List[Dict[str, str]],
+                                 model: Optional[str] = None,
+                                 temperature: float = 0.7) -> str:
         try:
             return await self.llm_client.call_llm(messages, model, temperature)
         except Exception as e:
             self.logger.error(f"Error calling LLM: {e}")
             raise
     
+    # Messages are passed as format arguments rather than pre-built f-strings: loguru
+    # drops records below its minimum level before formatting anything, and braces in
+    # the text (e.g. from an exception message) can't break the format call
     def _log_activity(self, activity: str, data: Optional[Dict[str, Any]] = None):
         """Log agent activity"""
-        self.logger.info(f"Activity: {activity}", extra=data or {})
+        self.logger.info("Activity: {}", activity, extra=data or {})
     
     def _log_error(self, error: str, data: Optional[Dict[str, Any]] = None):
         """Log agent error"""
-        self.logger.error(f"Error: {error}", extra=data or {})
+        self.logger.error("Error: {}", error, extra=data or {})
     
     def get_status(self) -> Dict[str, Any]:
         """Get agent status"""
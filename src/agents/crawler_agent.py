@@ -2,42 +2,176 @@
 Crawler Agent for orchestrating knowledge extraction from various sources
 """
 
-from typing import Dict, Any, List
+import asyncio
+import hashlib
+from contextlib import asynccontextmanager
+from functools import lru_cache
+from types import MappingProxyType
+from typing import AsyncIterator, ClassVar, Dict, Any, List, Mapping, Optional, Set, Tuple
 from loguru import logger
 
 from src.agents.base_agent import BaseAgent
+from src.config import settings
 from src.models import KnowledgeChunk, CrawlJob, SourceType
-from src.knowledge.crawlers import GitHubCrawler, JiraCrawler, ConfluenceCrawler, SlackCrawler
+from src.knowledge.crawlers import BaseCrawler, ETagCache, GitHubCrawler, JiraCrawler, ConfluenceCrawler, SlackCrawler
 from src.knowledge.vector_store import VectorStore
 
 
+@lru_cache(maxsize=16)
+def _parse_source_type(value: str) -> Optional[SourceType]:
+    """Parse a source type string, or return None if it isn't one"""
+    try:
+        return SourceType(value)
+    except ValueError:
+        return None
+
+
+def _content_id(chunk: KnowledgeChunk) -> str:
+    """Stable chunk ID derived from where the chunk came from and what it says"""
+    key = f"{chunk.source_type.value}:{chunk.source_id}\n{chunk.content}"
+    return hashlib.sha256(key.encode()).hexdigest()
+
+
 class CrawlerAgent(BaseAgent):
     """Agent responsible for crawling knowledge from various sources"""
     
+    # Chunks from all concurrent crawls are written in batches of up to this many,
+    # flushed early once nothing new has arrived for WRITE_FLUSH_INTERVAL seconds
+    WRITE_BATCH_SIZE = 512
+    WRITE_FLUSH_INTERVAL = 0.2
+    
+    # Config keys each source type needs; read by get_crawl_status and validate_config
+    _CONFIG_REQUIREMENTS: ClassVar[Mapping[SourceType, Tuple[str, ...]]] = MappingProxyType({
+        SourceType.GITHUB: ("github_token", "repos"),
+        SourceType.JIRA: ("jira_server", "jira_username", "jira_api_token", "projects"),
+        SourceType.CONFLUENCE: ("confluence_server", "confluence_username", "confluence_api_token", "spaces"),
+        SourceType.SLACK: ("slack_bot_token", "slack_app_token", "channels")
+    })
+    
+    # Crawlers (and the HTTP pools they hold) are shared by every CrawlerAgent in the process
+    _shared_crawlers: ClassVar[Optional[Dict[SourceType, BaseCrawler]]] = None
+    
     def __init__(self, vector_store: VectorStore):
         super().__init__(
             name="Crawler Agent",
             description="Crawls and indexes knowledge from various sources"
         )
         self.vector_store = vector_store
-        self.crawlers = {
-            SourceType.GITHUB: GitHubCrawler(),
-            SourceType.JIRA: JiraCrawler(),
-            SourceType.CONFLUENCE: ConfluenceCrawler(),
-            SourceType.SLACK: SlackCrawler()
-        }
+        self.crawlers = self._crawlers()
+        self._write_queue: Optional[asyncio.Queue] = None
+        self._writer_task: Optional[asyncio.Task] = None
+        self._writer_users = 0
+    
+    @classmethod
+    def _crawlers(cls) -> Dict[SourceType, BaseCrawler]:
+        """Crawler per source type, created on first use"""
+        if CrawlerAgent._shared_crawlers is None:
+            CrawlerAgent._shared_crawlers = {
+                SourceType.GITHUB: GitHubCrawler(),
+                SourceType.JIRA: JiraCrawler(),
+                SourceType.CONFLUENCE: ConfluenceCrawler(),
+                SourceType.SLACK: SlackCrawler()
+            }
+        return CrawlerAgent._shared_crawlers
+    
+    @asynccontextmanager
+    async def _batch_writer(self) -> AsyncIterator[asyncio.Queue]:
+        """Run the batch writer while any crawl needs it.
+        
+        Concurrent crawls share one writer, started by the first to enter. The last
+        to leave queues the ``None`` sentinel and waits for the writer to drain, so
+        no task outlives the crawls or the event loop they ran on.
+        """
+        if self._writer_users == 0:
+            self._write_queue = asyncio.Queue(maxsize=4 * self.WRITE_BATCH_SIZE)
+            self._writer_task = asyncio.create_task(self._write_batches(self._write_queue))
+        queue = self._write_queue
+        self._writer_users += 1
+        try:
+            yield queue
+        finally:
+            self._writer_users -= 1
+            if self._writer_users == 0:
+                task = self._writer_task
+                self._write_queue = self._writer_task = None
+                await queue.put(None)
+                await task
+    
+    async def _store_chunks(self, queue: asyncio.Queue, chunks: List[KnowledgeChunk]) -> List[str]:
+        """Queue chunks for the batch writer and wait until they are stored"""
+        loop = asyncio.get_running_loop()
+        futures = []
+        for chunk in chunks:
+            future = loop.create_future()
+            futures.append(future)
+            await queue.put((chunk, future))
+        # Every future of a failed batch gets the same exception; retrieve them all
+        results = await asyncio.gather(*futures, return_exceptions=True)
+        for result in results:
+            if isinstance(result, BaseException):
+                raise result
+        return results
+    
+    async def _new_chunks(self, chunks: List[KnowledgeChunk], seen: Set[str]) -> List[KnowledgeChunk]:
+        """Give chunks content-hash IDs and drop those already stored or already seen in this crawl"""
+        fresh = []
+        for chunk in chunks:
+            chunk.id = _content_id(chunk)
+            if chunk.id not in seen:
+                seen.add(chunk.id)
+                fresh.append(chunk)
+        
+        existing = await self.vector_store.existing_ids([chunk.id for chunk in fresh])
+        return [chunk for chunk in fresh if chunk.id not in existing]
+    
+    async def _write_batches(self, queue: asyncio.Queue):
+        """Drain ``queue`` into ``add_chunks`` calls of up to WRITE_BATCH_SIZE chunks until the sentinel"""
+        loop = asyncio.get_running_loop()
+        stopping = False
+        while not stopping:
+            item = await queue.get()
+            if item is None:
+                return
+            batch = [item]
+            deadline = loop.time() + self.WRITE_FLUSH_INTERVAL
+            while len(batch) < self.WRITE_BATCH_SIZE:
+                timeout = deadline - loop.time()
+                if timeout <= 0:
+                    break
+                try:
+                    item = await asyncio.wait_for(queue.get(), timeout)
+                except asyncio.TimeoutError:
+                    break
+                if item is None:
+                    stopping = True
+                    break
+                batch.append(item)
+            
+            try:
+                chunk_ids = await self.vector_store.add_chunks([chunk for chunk, _ in batch])
+            except Exception as e:
+                for _, future in batch:
+                    if not future.done():
+                        future.set_exception(e)
+            else:
+                for (_, future), chunk_id in zip(batch, chunk_ids):
+                    if not future.done():
+                        future.set_result(chunk_id)
     
     async def process(self, input_data: Dict[str, Any]) -> Dict[str, Any]:
-        """Process a crawling job"""
+        """Process a crawling job.
+        
+        Returns ``source_type``, ``chunks_processed``, ``chunks_skipped`` (already
+        stored) and the ``chunk_ids`` written; the chunks themselves are not kept.
+        """
         source_type = input_data.get("source_type")
         config = input_data.get("config", {})
         
         if not source_type:
             raise ValueError("source_type is required")
         
-        try:
-            source_type_enum = SourceType(source_type)
-        except ValueError:
+        source_type_enum = _parse_source_type(source_type)
+        if source_type_enum is None:
             raise ValueError(f"Invalid source_type: {source_type}")
         
         self._log_activity("Starting crawl job", {"source_type": source_type})
@@ -48,44 +182,121 @@ class CrawlerAgent(BaseAgent):
             if not crawler:
                 raise ValueError(f"No crawler available for source type: {source_type}")
             
-            # Crawl the source
-            chunks = await crawler.crawl(config)
+            # GitHub repos unchanged since their chunks were last stored in this store
+            # are skipped; new ETags are only kept once this crawl's writes succeed
+            etags = None
+            if source_type_enum == SourceType.GITHUB:
+                etags = ETagCache(settings.github_etag_cache_path, self.vector_store.store_id)
+                config = {**config, "etags": etags}
+            
+            # Crawl the source, handing chunks to the batch writer as they stream in so
+            # storing overlaps crawling and only one batch is buffered here at a time.
+            # Chunks already in the store are skipped, so re-crawling an unchanged
+            # source doesn't embed anything again
+            chunks_processed = 0
+            seen: Set[str] = set()
+            batch: List[KnowledgeChunk] = []
+            writes = []
             
-            # Add chunks to vector store
-            if chunks:
-                chunk_ids = await self.vector_store.add_chunks(chunks)
+            async with self._batch_writer() as queue:
+                async def flush(batch: List[KnowledgeChunk]) -> None:
+                    new_chunks = await self._new_chunks(batch, seen)
+                    if new_chunks:
+                        writes.append(asyncio.ensure_future(self._store_chunks(queue, new_chunks)))
+                
+                try:
+                    async for chunk in crawler.crawl(config):
+                        batch.append(chunk)
+                        if len(batch) >= self.WRITE_BATCH_SIZE:
+                            await flush(batch)
+                            chunks_processed += len(batch)
+                            batch = []
+                    if batch:
+                        await flush(batch)
+                        chunks_processed += len(batch)
+                    results = await asyncio.gather(*writes, return_exceptions=True)
+                except BaseException:
+                    # Chunks already queued are still written; nobody waits on them
+                    for write in writes:
+                        write.cancel()
+                    raise
+            
+            for result in results:
+                if isinstance(result, BaseException):
+                    raise result
+            chunk_ids = [chunk_id for ids in results for chunk_id in ids]
+            if etags is not None:
+                try:
+                    etags.commit()
+                except OSError as e:
+                    self._log_error(f"Could not save GitHub ETags: {e}")
+            chunks_skipped = chunks_processed - len(chunk_ids)
+            
+            if chunks_processed:
                 self._log_activity("Crawl completed", {
                     "source_type": source_type,
-                    "chunks_processed": len(chunks),
-                    "chunk_ids": chunk_ids
+                    "chunks_processed": chunks_processed,
+                    "chunks_skipped": chunks_skipped,
+                    "chunks_stored": len(chunk_ids)
                 })
             else:
                 self._log_activity("Crawl completed with no chunks", {"source_type": source_type})
             
             return {
                 "source_type": source_type,
-                "chunks_processed": len(chunks),
-                "chunks": chunks
+                "chunks_processed": chunks_processed,
+                "chunks_skipped": chunks_skipped,
+                "chunk_ids": chunk_ids
             }
             
         except Exception as e:
             self._log_error(f"Error in crawler agent: {e}", {"source_type": source_type})
             raise
     
-    async def crawl_all_sources(self, configs: Dict[str, Dict[str, Any]]) -> Dict[str, Any]:
-        """Crawl all configured sources"""
-        results = {}
+    async def crawl_all_sources(self,
+                                configs: Dict[str, Dict[str, Any]],
+                                fail_fast: bool = False) -> Dict[str, Any]:
+        """Crawl all configured sources.
         
-        for source_type, config in configs.items():
-            try:
-                result = await self.process({
+        With ``fail_fast`` the first source to fail (e.g. on bad credentials) cancels
+        the crawls still running; otherwise every source runs to completion.
+        """
+        # Sources are independent, so crawl them together; the semaphore caps how
+        # many run at once to bound outbound connections
+        semaphore = asyncio.Semaphore(settings.max_concurrent_crawls)
+        
+        async def crawl_source(source_type: str, config: Dict[str, Any]) -> Dict[str, Any]:
+            async with semaphore:
+                return await self.process({
                     "source_type": source_type,
                     "config": config
                 })
-                results[source_type] = result
-            except Exception as e:
-                self._log_error(f"Error crawling {source_type}: {e}")
-                results[source_type] = {"error": str(e)}
+        
+        tasks = {
+            source_type: asyncio.ensure_future(crawl_source(source_type, config))
+            for source_type, config in configs.items()
+        }
+        try:
+            if fail_fast and tasks:
+                await asyncio.wait(tasks.values(), return_when=asyncio.FIRST_EXCEPTION)
+                for task in tasks.values():
+                    task.cancel()
+            outcomes = await asyncio.gather(*tasks.values(), return_exceptions=True)
+        except asyncio.CancelledError:
+            # Our caller gave up: don't leave the crawls running unattended
+            for task in tasks.values():
+                task.cancel()
+            raise
+        
+        results = {}
+        for source_type, outcome in zip(tasks, outcomes):
+            if isinstance(outcome, asyncio.CancelledError):
+                results[source_type] = {"error": "cancelled after another source failed"}
+            elif isinstance(outcome, Exception):
+                self._log_error(f"Error crawling {source_type}: {outcome}")
+                results[source_type] = {"error": str(outcome)}
+            else:
+                results[source_type] = outcome
         
         return results
     
@@ -102,37 +313,25 @@ class CrawlerAgent(BaseAgent):
         
         return status
     
-    def _get_config_requirements(self, source_type: SourceType) -> List[str]:
+    def _get_config_requirements(self, source_type: SourceType) -> Tuple[str, ...]:
         """Get configuration requirements for a source type"""
-        requirements = {
-            SourceType.GITHUB: ["github_token", "repos"],
-            SourceType.JIRA: ["jira_server", "jira_username", "jira_api_token", "projects"],
-            SourceType.CONFLUENCE: ["confluence_server", "confluence_username", "confluence_api_token", "spaces"],
-            SourceType.SLACK: ["slack_bot_token", "slack_app_token", "channels"]
-        }
-        
-        return requirements.get(source_type, [])
+        return self._CONFIG_REQUIREMENTS.get(source_type, ())
     
     async def validate_config(self, source_type: str, config: Dict[str, Any]) -> Dict[str, Any]:
         """Validate configuration for a source type"""
-        try:
-            source_type_enum = SourceType(source_type)
-            requirements = self._get_config_requirements(source_type_enum)
-            
-            missing = []
-            for req in requirements:
-                if req not in config:
-                    missing.append(req)
-            
-            return {
-                "valid": len(missing) == 0,
-                "missing_config": missing,
-                "source_type": source_type
-            }
-            
-        except ValueError:
+        source_type_enum = _parse_source_type(source_type)
+        if source_type_enum is None:
             return {
                 "valid": False,
                 "error": f"Invalid source type: {source_type}",
                 "source_type": source_type
-            } 
\ No newline at end of file
+            }
+        
+        requirements = self._get_config_requirements(source_type_enum)
+        missing = [req for req in requirements if req not in config]
+        
+        return {
+            "valid": len(missing) == 0,
+            "missing_config": missing,
+            "source_type": source_type
+        } 
\ No newline at end of file
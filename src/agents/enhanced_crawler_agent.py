@@ -60,13 +60,10 @@ class EnhancedCrawlerAgent(BaseAgent):
         # Initialize enhanced GitHub crawler
         github_crawler = GitHubCrawler()
         
-        # Get basic repository data
-        basic_chunks = await github_crawler.crawl(config)
-        
-        # Enhanced analysis
+        # Enhanced analysis, applied to each chunk as the crawl streams it in
         enhanced_chunks = []
         
-        for chunk in basic_chunks:
+        async for chunk in github_crawler.crawl(config):
             # Add code analysis for code files
             if "code" in chunk.metadata.get("type", ""):
                 code_analysis = await self._analyze_code_content(chunk.content)
@@ -2,13 +2,13 @@
 Memory Agent for learning from past interactions
 """
 
-import uuid
 from datetime import datetime, timedelta
 from typing import Dict, Any, List, Optional
 from loguru import logger
 
 from src.agents.base_agent import BaseAgent
 from src.models import AgentMemory, Query, AgentResponse
+from src.utils.ids import new_id
 
 
 class MemoryAgent(BaseAgent):
@@ -49,7 +49,7 @@ class MemoryAgent(BaseAgent):
         
         # Create memory entry
         memory = AgentMemory(
-            id=str(uuid.uuid4()),
+            id=new_id(),
             query_id=query.id,
             user_id=user_id,
             query_text=query.query_text,
@@ -134,7 +134,7 @@ class MemoryAgent(BaseAgent):
         else:
             # Create new memory
             memory = AgentMemory(
-                id=str(uuid.uuid4()),
+                id=new_id(),
                 query_id=query.id,
                 user_id=query.user_id,
                 query_text=query.query_text,
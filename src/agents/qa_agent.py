@@ -8,9 +8,9 @@ import asyncio
 import logging
 from typing import Dict, Any, List
 from src.agents.base_agent import BaseAgent
+from src.llm_client import QUERY_ERROR_REPLY_PREFIX, is_fallback_reply
 from src.knowledge.vector_store import VectorStore
 from src.knowledge.search import SemanticSearch
-from src.llm_client import LLMClient
 from src.models import Query, SearchResult
 from src.utils.enhanced_response_formatter import EnhancedResponseFormatter
 
@@ -23,7 +23,6 @@ class QAAgent(BaseAgent):
         super().__init__("QA Agent", "AI-powered question answering agent that provides structured responses")
         self.vector_store = vector_store
         self.search_engine = search_engine
-        self.llm_client = LLMClient()
         self.logger = logging.getLogger(__name__)
     
     async def process(self, input_data) -> Dict[str, Any]:
@@ -73,7 +72,7 @@ class QAAgent(BaseAgent):
         except Exception as e:
             self.logger.error(f"Error processing query: {e}")
             return {
-                "text": f"I encountered an error while processing your query: {str(e)}",
+                "text": f"{QUERY_ERROR_REPLY_PREFIX}: {str(e)}",
                 "confidence": 0.0,
                 "reasoning": f"Error occurred: {str(e)}",
                 "follow_up": "Please try rephrasing your question."
@@ -209,7 +208,18 @@ CRITICAL: Keep it SHORT and CRISP. Each sentence on new line. Each bullet on sin
             {"role": "user", "content": user_prompt}
         ]
         
-        response_text = await self._call_llm(messages, temperature=0.3)
+        response_text = await self._call_llm(messages, temperature=0.3, semantic_text=query_text)
+        
+        # A canned error/demo reply is not an answer: pass it through unformatted so
+        # callers (e.g. the /api/query cache) can tell it apart
+        if is_fallback_reply(response_text):
+            return {
+                "text": response_text,
+                "confidence": 0.0,
+                "reasoning": "No response from the language model",
+                "follow_up": "Please try again.",
+                "sources": []
+            }
         
         # Check if response is valid
         if not response_text or response_text.strip() == "":
@@ -27,6 +27,15 @@ class Settings(BaseSettings):
     # Vector Store Configuration
     vector_store_type: str = Field("chroma", env="VECTOR_STORE_TYPE")
     chroma_persist_directory: str = Field("./data/chroma", env="CHROMA_PERSIST_DIRECTORY")
+    # Set to use a Chroma server (``chroma run``) instead of the embedded on-disk database
+    chroma_server_host: Optional[str] = Field(None, env="CHROMA_SERVER_HOST")
+    chroma_server_port: int = Field(8000, env="CHROMA_SERVER_PORT")
+    embedding_device: Optional[str] = Field(None, env="EMBEDDING_DEVICE")  # e.g. "cuda", "cpu"; None = auto
+    embedding_cache_directory: Optional[str] = Field("./data/embed_cache", env="EMBEDDING_CACHE_DIRECTORY")  # empty = off
+    # HNSW index parameters, applied when the Chroma collection is first created
+    chroma_hnsw_m: int = Field(16, env="CHROMA_HNSW_M")
+    chroma_hnsw_construction_ef: int = Field(100, env="CHROMA_HNSW_CONSTRUCTION_EF")
+    chroma_hnsw_search_ef: int = Field(10, env="CHROMA_HNSW_SEARCH_EF")
     pinecone_api_key: Optional[str] = Field(None, env="PINECONE_API_KEY")
     pinecone_environment: Optional[str] = Field(None, env="PINECONE_ENVIRONMENT")
     pinecone_index_name: str = Field("agentic-mentor", env="PINECONE_INDEX_NAME")
@@ -37,8 +46,10 @@ class Settings(BaseSettings):
     
     # GitHub Integration
     github_token: Optional[str] = Field(None, env="GITHUB_TOKEN")
+    github_tokens: Optional[str] = Field(None, env="GITHUB_TOKENS")  # comma-separated, rotated round-robin
     github_organization: Optional[str] = Field(None, env="GITHUB_ORGANIZATION")
     github_repos: List[str] = Field(default_factory=list, env="GITHUB_REPOS")
+    github_etag_cache_path: str = Field("./data/github_etags.json", env="GITHUB_ETAG_CACHE_PATH")
     
     # Jira Integration
     jira_server: Optional[str] = Field(None, env="JIRA_SERVER")
@@ -61,6 +72,7 @@ class Settings(BaseSettings):
     web_host: str = Field("0.0.0.0", env="WEB_HOST")
     web_port: int = Field(8000, env="WEB_PORT")
     web_debug: bool = Field(False, env="WEB_DEBUG")
+    web_json_encoder: str = Field("json", env="WEB_JSON_ENCODER")  # "json" or "orjson"
     
     # Security Configuration
     secret_key: str = Field("demo-secret-key", env="SECRET_KEY")
@@ -79,10 +91,22 @@ class Settings(BaseSettings):
     search_max_results: int = Field(10, env="SEARCH_MAX_RESULTS")
     search_similarity_threshold: float = Field(0.7, env="SEARCH_SIMILARITY_THRESHOLD")
     
+    # Semantic query cache: answers a query from the response to a near-identical earlier one
+    semantic_cache_enabled: bool = Field(False, env="SEMANTIC_CACHE_ENABLED")
+    semantic_cache_threshold: float = Field(0.92, env="SEMANTIC_CACHE_THRESHOLD")
+    semantic_cache_size: int = Field(10000, env="SEMANTIC_CACHE_SIZE")
+    semantic_cache_ttl: float = Field(300.0, env="SEMANTIC_CACHE_TTL")
+    
+    # LLM response cache: agents reuse the reply to an identical or near-identical prompt
+    llm_cache_enabled: bool = Field(False, env="LLM_CACHE_ENABLED")
+    llm_cache_threshold: float = Field(0.95, env="LLM_CACHE_THRESHOLD")
+    llm_cache_size: int = Field(1000, env="LLM_CACHE_SIZE")
+    
     # Crawler Configuration
     crawler_max_depth: int = Field(3, env="CRAWLER_MAX_DEPTH")
     crawler_delay: float = Field(1.0, env="CRAWLER_DELAY")
     crawler_timeout: int = Field(30, env="CRAWLER_TIMEOUT")
+    max_concurrent_crawls: int = Field(4, env="MAX_CONCURRENT_CRAWLS")
     
     # Rate Limiting
     rate_limit_requests: int = Field(100, env="RATE_LIMIT_REQUESTS")
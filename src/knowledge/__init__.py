@@ -2,13 +2,16 @@
 Knowledge management system for Agentic Mentor
 """
 
-from .vector_store import VectorStore
+from .vector_store import VectorStore, get_vector_store
 from .search import SemanticSearch
+from .semantic_cache import SemanticCache
 from .crawlers import GitHubCrawler, JiraCrawler, ConfluenceCrawler, SlackCrawler
 
 __all__ = [
     "VectorStore",
+    "get_vector_store",
     "SemanticSearch", 
+    "SemanticCache",
     "GitHubCrawler",
     "JiraCrawler",
     "ConfluenceCrawler",
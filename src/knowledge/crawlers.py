@@ -4,14 +4,23 @@ Knowledge crawlers for Agentic Mentor
 
 import asyncio
 import base64
-import uuid
+import hashlib
+import itertools
+import json
+import os
 import re
+import threading
+import time
 from datetime import datetime
-from typing import List, Dict, Any, Optional
+from pathlib import Path
+from typing import AsyncIterator, Callable, Iterable, List, Dict, Any, Optional
 from loguru import logger
+import requests
+import requests.adapters
 
 from src.models import KnowledgeChunk, SourceType
 from src.config import settings
+from src.utils.ids import new_id
 
 try:
     from github import Github
@@ -21,17 +30,62 @@ except ImportError:
     logger.warning("GitHub API not available. Install with: pip install PyGithub")
 
 
+def new_http_session(pool_size: int = 100) -> requests.Session:
+    """Session with a connection pool large enough for every crawl worker thread"""
+    session = requests.Session()
+    adapter = requests.adapters.HTTPAdapter(pool_connections=10, pool_maxsize=pool_size)
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
+
+
 class BaseCrawler:
     """Base class for all crawlers"""
     
+    # Upper bound on repositories/projects/spaces/channels fetched at the same time
+    max_concurrency = 10
+    
     def __init__(self, source_type: SourceType):
         self.source_type = source_type
         self.logger = logger.bind(crawler=source_type.value)
     
-    async def crawl(self, config: Dict[str, Any]) -> List[KnowledgeChunk]:
-        """Crawl the source and return knowledge chunks"""
+    def crawl(self, config: Dict[str, Any]) -> AsyncIterator[KnowledgeChunk]:
+        """Crawl the source, yielding knowledge chunks as they are produced.
+        
+        Consumers can store chunks while the crawl is still running, so only the
+        items in flight are held in memory rather than the whole source.
+        """
         raise NotImplementedError
     
+    async def _crawl_concurrently(self,
+                                  items: Iterable[str],
+                                  crawl_one: Callable[[str], List[KnowledgeChunk]]) -> AsyncIterator[KnowledgeChunk]:
+        """Run the blocking ``crawl_one`` for every item in worker threads, ``max_concurrency`` at a time,
+        yielding each item's chunks as soon as it finishes.
+        
+        The source SDKs (PyGithub, jira, atlassian, slack_sdk) are synchronous, so
+        this is what lets independent items - and independent crawlers - overlap.
+        """
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+        
+        async def run(item: str) -> List[KnowledgeChunk]:
+            async with semaphore:
+                try:
+                    return await asyncio.to_thread(crawl_one, item)
+                except Exception as e:
+                    self.logger.error(f"Error crawling {item}: {e}")
+                    return []
+        
+        tasks = [asyncio.ensure_future(run(item)) for item in items]
+        try:
+            for finished in asyncio.as_completed(tasks):
+                for chunk in await finished:
+                    yield chunk
+        finally:
+            # The consumer stopped early: don't start items that haven't begun yet
+            for task in tasks:
+                task.cancel()
+    
     def _create_chunk(self, 
                      content: str, 
                      source_id: str, 
@@ -40,7 +94,7 @@ class BaseCrawler:
         """Create a knowledge chunk"""
         now = datetime.utcnow()
         return KnowledgeChunk(
-            id=str(uuid.uuid4()),
+            id=new_id(),
             content=content,
             source_type=self.source_type,
             source_id=source_id,
@@ -59,66 +113,167 @@ class BaseCrawler:
         return content
 
 
+class ETagCache:
+    """ETags persisted as JSON so re-crawls can send ``If-None-Match``.
+    
+    Entries are kept per ``namespace`` (the vector store the chunks went into)
+    and per token, since GitHub responses differ by user. New ETags are only
+    staged while crawling; ``commit`` keeps them once their chunks are stored.
+    """
+    
+    def __init__(self, path: str, namespace: str):
+        self.path = Path(path)
+        self.namespace = namespace
+        self.etags: Dict[str, str] = self._load().get(namespace, {})
+        self._staged: Dict[str, str] = {}
+    
+    def _load(self) -> Dict[str, Dict[str, str]]:
+        try:
+            data = json.loads(self.path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return {}
+        return {namespace: etags for namespace, etags in data.items() if isinstance(etags, dict)}
+    
+    @staticmethod
+    def _key(url: str, token: str) -> str:
+        return f"{hashlib.blake2b(token.encode(), digest_size=8).hexdigest()}:{url}"
+    
+    def get(self, url: str, token: str) -> Optional[str]:
+        return self.etags.get(self._key(url, token))
+    
+    def stage(self, url: str, token: str, etag: str):
+        self._staged[self._key(url, token)] = etag
+    
+    def commit(self):
+        """Keep the staged ETags and write the file, merging entries saved by other crawls meanwhile"""
+        if not self._staged:
+            return
+        self.etags.update(self._staged)
+        self._staged.clear()
+        
+        data = self._load()
+        data[self.namespace] = {**data.get(self.namespace, {}), **self.etags}
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = self.path.with_suffix(self.path.suffix + ".tmp")
+        tmp_path.write_text(json.dumps(data, indent=2, sort_keys=True), encoding="utf-8")
+        os.replace(tmp_path, self.path)
+
+
+class GitHubTokenPool:
+    """Hands out GitHub tokens round-robin, passing over tokens whose rate limit is spent until it resets"""
+    
+    def __init__(self, tokens: List[str]):
+        self.tokens = list(dict.fromkeys(tokens))
+        self._cycle = itertools.cycle(self.tokens)
+        self._reset_at: Dict[str, float] = {}
+        self._lock = threading.Lock()
+    
+    @classmethod
+    def from_settings(cls, token: Optional[str]) -> "GitHubTokenPool":
+        """Pool of GITHUB_TOKENS, falling back to the single ``token``"""
+        tokens = [t.strip() for t in (settings.github_tokens or "").split(",") if t.strip()]
+        return cls(tokens or [token])
+    
+    def next(self) -> str:
+        with self._lock:
+            now = time.time()
+            for _ in range(len(self.tokens)):
+                token = next(self._cycle)
+                if self._reset_at.get(token, 0) <= now:
+                    return token
+            # Every token is exhausted: use the one that resets first
+            return min(self.tokens, key=lambda t: self._reset_at[t])
+    
+    def update(self, token: str, response: "requests.Response"):
+        """Record the rate-limit state reported by a GitHub response made with ``token``"""
+        if response.headers.get("X-RateLimit-Remaining") == "0":
+            with self._lock:
+                self._reset_at[token] = float(response.headers.get("X-RateLimit-Reset", time.time() + 60))
+    
+    def get(self, session: requests.Session, url: str, headers: Optional[Dict[str, str]] = None, **kwargs) -> requests.Response:
+        """``session.get`` authenticated with the next token in the rotation"""
+        token = self.next()
+        response = session.get(url, headers={**(headers or {}), "Authorization": f"token {token}"}, **kwargs)
+        self.update(token, response)
+        return response
+
+
 class GitHubCrawler(BaseCrawler):
     """Crawler for GitHub repositories"""
     
-    def __init__(self):
+    def __init__(self, http: Optional[requests.Session] = None):
         super().__init__(SourceType.GITHUB)
         self.github_token = settings.github_token
         self.organization = settings.github_organization
         self.repos = settings.github_repos
+        # Used by the ETag checks; pass one in to share it across crawlers
+        self.http = http or new_http_session()
     
-    async def crawl(self, config: Dict[str, Any]) -> List[KnowledgeChunk]:
-        """Crawl GitHub repositories"""
-        chunks = []
+    async def crawl(self, config: Dict[str, Any]) -> AsyncIterator[KnowledgeChunk]:
+        """Crawl GitHub repositories.
         
+        With an ``ETagCache`` under ``config["etags"]``, repositories whose metadata
+        answers 304 Not Modified are skipped; the caller commits the cache once the
+        chunks are stored.
+        """
         if not GITHUB_AVAILABLE:
             self.logger.error("GitHub API not available. Please install PyGithub")
-            return []
+            return
         
-        if not self.github_token:
+        if not (self.github_token or settings.github_tokens):
             self.logger.error("GitHub token not configured")
-            return []
+            return
         
         try:
-            # Initialize GitHub client
-            g = Github(self.github_token)
-            self.logger.info(f"Initialized GitHub client for organization: {self.organization}")
-            
+            # Initialize GitHub clients; with several tokens configured, requests are
+            # spread across all of them. The pool belongs to this crawl: the crawler
+            # itself is shared by every CrawlerAgent, so concurrent crawls each get one
+            tokens = GitHubTokenPool.from_settings(self.github_token)
+            self.logger.info(f"Initialized GitHub client for organization: {self.organization} "
+                             f"({len(tokens.tokens)} token(s))")
+            
+            etags: Optional[ETagCache] = config.get('etags')
             repos_to_crawl = config.get('repos', self.repos)
             organization = config.get('organization', self.organization)
             
             self.logger.info(f"Starting crawl for {len(repos_to_crawl)} repositories")
             
-            for repo_name in repos_to_crawl:
-                try:
-                    # Add organization prefix if not already present
-                    full_repo_name = repo_name
-                    if organization and not '/' in repo_name:
-                        full_repo_name = f"{organization}/{repo_name}"
-                    
-                    self.logger.info(f"Crawling repository: {full_repo_name}")
-                    repo_chunks = await self._crawl_repository(g, full_repo_name)
-                    chunks.extend(repo_chunks)
-                    self.logger.info(f"Successfully crawled {len(repo_chunks)} chunks from {full_repo_name}")
-                    
-                except Exception as e:
-                    self.logger.error(f"Error crawling repo {repo_name}: {e}")
-                    # Continue with other repos even if one fails
-                    continue
-            
-            self.logger.info(f"GitHub crawl completed. Total chunks: {len(chunks)}")
-            return chunks
+            # Add organization prefix if not already present
+            full_repo_names = [
+                f"{organization}/{repo_name}" if organization and '/' not in repo_name else repo_name
+                for repo_name in repos_to_crawl
+            ]
+            total = 0
+            async for chunk in self._crawl_concurrently(
+                full_repo_names,
+                lambda full_repo_name: self._crawl_repository(Github(tokens.next()), tokens, full_repo_name, etags)
+            ):
+                total += 1
+                yield chunk
+            
+            self.logger.info(f"GitHub crawl completed. Total chunks: {total}")
             
         except Exception as e:
             self.logger.error(f"Error initializing GitHub crawler: {e}")
-            return []
     
-    async def _crawl_repository(self, g: Github, repo_name: str) -> List[KnowledgeChunk]:
+    def _crawl_repository(self,
+                          g: "Github",
+                          tokens: GitHubTokenPool,
+                          repo_name: str,
+                          etags: Optional[ETagCache] = None) -> List[KnowledgeChunk]:
         """Crawl a single GitHub repository"""
         chunks = []
         
+        # Conditional GET first: a 304 costs nothing against the rate limit and means
+        # no push or settings change since the last stored crawl
+        repo_url = f"https://api.github.com/repos/{repo_name}"
+        etag = self._fetch_etag(repo_url, tokens, etags) if etags is not None else ""
+        
         try:
+            if etag is None:
+                self.logger.info(f"Repository {repo_name} unchanged since last crawl, skipping")
+                return chunks
+            
             repo = g.get_repo(repo_name)
             self.logger.info(f"Successfully accessed repository: {repo_name}")
             
@@ -155,7 +310,7 @@ This repository contains the source code for {repo.name}. {repo_info['descriptio
 """
             
             overview_chunk = KnowledgeChunk(
-                id=str(uuid.uuid4()),
+                id=new_id(),
                 content=overview_content,
                 source_type=SourceType.GITHUB,
                 source_id=f"{repo_name}/overview",
@@ -172,7 +327,7 @@ This repository contains the source code for {repo.name}. {repo_info['descriptio
                 readme_content = base64.b64decode(readme.content).decode('utf-8')
                 
                 readme_chunk = KnowledgeChunk(
-                    id=str(uuid.uuid4()),
+                    id=new_id(),
                     content=f"# README for {repo.name}\n\n{readme_content}",
                     source_type=SourceType.GITHUB,
                     source_id=f"{repo_name}/readme",
@@ -189,9 +344,10 @@ This repository contains the source code for {repo.name}. {repo_info['descriptio
             
             # Get recent commits
             try:
+                # Slice before iterating so only the first page is requested, not the whole history
                 commits = repo.get_commits()
                 recent_commits = []
-                for commit in list(commits)[:10]:  # Get last 10 commits
+                for commit in commits[:10]:  # Get last 10 commits
                     recent_commits.append({
                         "sha": commit.sha,
                         "message": commit.commit.message,
@@ -207,7 +363,7 @@ This repository contains the source code for {repo.name}. {repo_info['descriptio
                         commits_content += f"**Date:** {commit['date']}\n\n"
                     
                     commits_chunk = KnowledgeChunk(
-                        id=str(uuid.uuid4()),
+                        id=new_id(),
                         content=commits_content,
                         source_type=SourceType.GITHUB,
                         source_id=f"{repo_name}/commits",
@@ -234,7 +390,7 @@ This repository contains the source code for {repo.name}. {repo_info['descriptio
                     structure_content += f"  - Path: {content.path}\n\n"
                 
                 structure_chunk = KnowledgeChunk(
-                    id=str(uuid.uuid4()),
+                    id=new_id(),
                     content=structure_content,
                     source_type=SourceType.GITHUB,
                     source_id=f"{repo_name}/structure",
@@ -249,12 +405,32 @@ This repository contains the source code for {repo.name}. {repo_info['descriptio
             except Exception as e:
                 self.logger.warning(f"Could not get repository structure for {repo_name}: {e}")
             
+            if etag:
+                etags.stage(repo_url, tokens.tokens[0], etag)
             self.logger.info(f"Successfully crawled {len(chunks)} chunks from {repo_name}")
             return chunks
             
         except Exception as e:
             self.logger.error(f"Error crawling repository {repo_name}: {e}")
             return []
+    
+    def _fetch_etag(self, url: str, tokens: GitHubTokenPool, etags: ETagCache) -> Optional[str]:
+        """Return the current ETag for ``url`` ("" if none), or None when it answered 304 Not Modified"""
+        # Always the same token: the response (and so its ETag) depends on who asks
+        token = tokens.tokens[0]
+        headers = {"Authorization": f"token {token}"}
+        cached = etags.get(url, token)
+        if cached:
+            headers["If-None-Match"] = cached
+        try:
+            response = self.http.get(url, headers=headers, timeout=10)
+        except requests.RequestException as e:
+            self.logger.warning(f"Conditional request for {url} failed: {e}")
+            return ""
+        tokens.update(token, response)
+        if response.status_code == 304:
+            return None
+        return response.headers.get("ETag", "")
 
 
 class JiraCrawler(BaseCrawler):
@@ -267,11 +443,11 @@ class JiraCrawler(BaseCrawler):
         self.api_token = settings.jira_api_token
         self.projects = settings.jira_projects
     
-    async def crawl(self, config: Dict[str, Any]) -> List[KnowledgeChunk]:
+    async def crawl(self, config: Dict[str, Any]) -> AsyncIterator[KnowledgeChunk]:
         """Crawl Jira issues"""
         if not all([self.server, self.username, self.api_token]):
             self.logger.warning("Jira credentials not fully configured")
-            return []
+            return
         
         try:
             from jira import JIRA
@@ -281,24 +457,20 @@ class JiraCrawler(BaseCrawler):
                 basic_auth=(self.username, self.api_token)
             )
             
-            chunks = []
             projects_to_crawl = config.get('projects', self.projects)
+            total = 0
+            async for chunk in self._crawl_concurrently(
+                projects_to_crawl, lambda project_key: self._crawl_project(jira, project_key)
+            ):
+                total += 1
+                yield chunk
             
-            for project_key in projects_to_crawl:
-                try:
-                    project_chunks = await self._crawl_project(jira, project_key)
-                    chunks.extend(project_chunks)
-                except Exception as e:
-                    self.logger.error(f"Error crawling Jira project {project_key}: {e}")
-            
-            self.logger.info(f"Crawled {len(chunks)} chunks from Jira")
-            return chunks
+            self.logger.info(f"Crawled {total} chunks from Jira")
             
         except Exception as e:
             self.logger.error(f"Error in Jira crawler: {e}")
-            return []
     
-    async def _crawl_project(self, jira_client, project_key: str) -> List[KnowledgeChunk]:
+    def _crawl_project(self, jira_client, project_key: str) -> List[KnowledgeChunk]:
         """Crawl issues from a Jira project"""
         chunks = []
         
@@ -357,11 +529,11 @@ class ConfluenceCrawler(BaseCrawler):
         self.api_token = settings.confluence_api_token
         self.spaces = settings.confluence_space_keys
     
-    async def crawl(self, config: Dict[str, Any]) -> List[KnowledgeChunk]:
+    async def crawl(self, config: Dict[str, Any]) -> AsyncIterator[KnowledgeChunk]:
         """Crawl Confluence pages"""
         if not all([self.server, self.username, self.api_token]):
             self.logger.warning("Confluence credentials not fully configured")
-            return []
+            return
         
         try:
             from atlassian import Confluence
@@ -373,24 +545,20 @@ class ConfluenceCrawler(BaseCrawler):
                 cloud=True
             )
             
-            chunks = []
             spaces_to_crawl = config.get('spaces', self.spaces)
+            total = 0
+            async for chunk in self._crawl_concurrently(
+                spaces_to_crawl, lambda space_key: self._crawl_space(confluence, space_key)
+            ):
+                total += 1
+                yield chunk
             
-            for space_key in spaces_to_crawl:
-                try:
-                    space_chunks = await self._crawl_space(confluence, space_key)
-                    chunks.extend(space_chunks)
-                except Exception as e:
-                    self.logger.error(f"Error crawling Confluence space {space_key}: {e}")
-            
-            self.logger.info(f"Crawled {len(chunks)} chunks from Confluence")
-            return chunks
+            self.logger.info(f"Crawled {total} chunks from Confluence")
             
         except Exception as e:
             self.logger.error(f"Error in Confluence crawler: {e}")
-            return []
     
-    async def _crawl_space(self, confluence_client, space_key: str) -> List[KnowledgeChunk]:
+    def _crawl_space(self, confluence_client, space_key: str) -> List[KnowledgeChunk]:
         """Crawl pages from a Confluence space"""
         chunks = []
         
@@ -439,35 +607,31 @@ class SlackCrawler(BaseCrawler):
         self.app_token = settings.slack_app_token
         self.channels = settings.slack_channels
     
-    async def crawl(self, config: Dict[str, Any]) -> List[KnowledgeChunk]:
+    async def crawl(self, config: Dict[str, Any]) -> AsyncIterator[KnowledgeChunk]:
         """Crawl Slack messages"""
         if not all([self.bot_token, self.app_token]):
             self.logger.warning("Slack credentials not fully configured")
-            return []
+            return
         
         try:
             from slack_sdk.web import WebClient
             from slack_sdk.socket_mode import SocketModeClient
             
             client = WebClient(token=self.bot_token)
-            chunks = []
             channels_to_crawl = config.get('channels', self.channels)
+            total = 0
+            async for chunk in self._crawl_concurrently(
+                channels_to_crawl, lambda channel_name: self._crawl_channel(client, channel_name)
+            ):
+                total += 1
+                yield chunk
             
-            for channel_name in channels_to_crawl:
-                try:
-                    channel_chunks = await self._crawl_channel(client, channel_name)
-                    chunks.extend(channel_chunks)
-                except Exception as e:
-                    self.logger.error(f"Error crawling Slack channel {channel_name}: {e}")
-            
-            self.logger.info(f"Crawled {len(chunks)} chunks from Slack")
-            return chunks
+            self.logger.info(f"Crawled {total} chunks from Slack")
             
         except Exception as e:
             self.logger.error(f"Error in Slack crawler: {e}")
-            return []
     
-    async def _crawl_channel(self, slack_client, channel_name: str) -> List[KnowledgeChunk]:
+    def _crawl_channel(self, slack_client, channel_name: str) -> List[KnowledgeChunk]:
         """Crawl messages from a Slack channel"""
         chunks = []
         
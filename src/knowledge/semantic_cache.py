@@ -0,0 +1,84 @@
+"""
+Semantic cache for query responses
+"""
+
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Hashable, List, Optional
+
+import numpy as np
+
+
+class SemanticCache:
+    """Cache of responses looked up by query-embedding similarity rather than exact text.
+    
+    Embeddings are kept L2-normalized in one preallocated matrix, so a lookup is
+    a single matrix-vector product (an exact inner-product index); the least
+    recently used entry is overwritten once ``max_size`` is reached.
+    
+    An optional ``scope`` (e.g. the user) partitions the entries: a lookup only
+    matches entries added with the same scope. With a ``ttl`` (seconds), entries
+    older than that no longer match.
+    """
+    
+    def __init__(self, threshold: float = 0.92, max_size: int = 10000, ttl: Optional[float] = None):
+        self.threshold = threshold
+        self.max_size = max_size
+        self.ttl = ttl
+        self._vectors: Optional[np.ndarray] = None
+        self._values: List[Any] = []
+        self._scope_ids: Optional[np.ndarray] = None
+        self._stored_at: Optional[np.ndarray] = None
+        self._scopes: Dict[Hashable, int] = {}
+        self._lru: "OrderedDict[int, None]" = OrderedDict()
+    
+    def __len__(self) -> int:
+        return len(self._values)
+    
+    @staticmethod
+    def _normalize(embedding: np.ndarray) -> np.ndarray:
+        vector = np.asarray(embedding, dtype=np.float32).ravel()
+        return vector / max(float(np.linalg.norm(vector)), 1e-12)
+    
+    def _scope_id(self, scope: Hashable) -> int:
+        return self._scopes.setdefault(scope, len(self._scopes))
+    
+    def lookup(self, embedding: np.ndarray, scope: Hashable = None) -> Optional[Any]:
+        """Return the value cached for the most similar query in ``scope``, if it is similar enough"""
+        if not self._values or scope not in self._scopes:
+            return None
+        size = len(self._values)
+        similarities = self._vectors[:size] @ self._normalize(embedding)
+        similarities[self._scope_ids[:size] != self._scopes[scope]] = -np.inf
+        if self.ttl is not None:
+            similarities[time.monotonic() - self._stored_at[:size] >= self.ttl] = -np.inf
+        slot = int(np.argmax(similarities))
+        if similarities[slot] < self.threshold:
+            return None
+        self._lru.move_to_end(slot)
+        return self._values[slot]
+    
+    def add(self, embedding: np.ndarray, value: Any, scope: Hashable = None) -> None:
+        """Cache ``value`` for the query with this embedding"""
+        vector = self._normalize(embedding)
+        if self._vectors is None:
+            self._vectors = np.empty((self.max_size, vector.shape[0]), dtype=np.float32)
+            self._scope_ids = np.empty(self.max_size, dtype=np.int64)
+            self._stored_at = np.empty(self.max_size, dtype=np.float64)
+        
+        if len(self._values) < self.max_size:
+            slot = len(self._values)
+            self._values.append(value)
+        else:
+            slot, _ = self._lru.popitem(last=False)
+            self._values[slot] = value
+        
+        self._vectors[slot] = vector
+        self._scope_ids[slot] = self._scope_id(scope)
+        self._stored_at[slot] = time.monotonic()
+        self._lru[slot] = None
+    
+    def clear(self) -> None:
+        self._values.clear()
+        self._scopes.clear()
+        self._lru.clear()
@@ -2,10 +2,15 @@
 Vector store for knowledge chunks
 """
 
+import asyncio
+import hashlib
+import os
+import threading
 import uuid
 from datetime import datetime
-from typing import List, Optional, Dict, Any
+from typing import List, Optional, Dict, Any, Set, Union
 import chromadb
+import numpy as np
 from chromadb.config import Settings
 from sentence_transformers import SentenceTransformer
 from loguru import logger
@@ -13,24 +18,48 @@ from loguru import logger
 from src.models import KnowledgeChunk, SourceType
 from src.config import settings
 
+try:
+    from diskcache import Cache
+    DISKCACHE_AVAILABLE = True
+except ImportError:
+    DISKCACHE_AVAILABLE = False
+    logger.warning("diskcache not available, embeddings will not be cached. Install with: pip install diskcache")
+
 
 class VectorStore:
     """Vector store for storing and retrieving knowledge chunks"""
     
+    EMBEDDING_MODEL = 'all-MiniLM-L6-v2'
+    # Part of every embedding cache key; bump it when the stored vector format changes
+    EMBEDDING_CACHE_FORMAT = 'f16'
+    
     def __init__(self):
-        self.client = chromadb.PersistentClient(
-            path=settings.chroma_persist_directory,
-            settings=Settings(anonymized_telemetry=False)
+        if settings.chroma_server_host:
+            # Out-of-process database: writes don't grow this process's memory
+            self.client = chromadb.HttpClient(
+                host=settings.chroma_server_host,
+                port=settings.chroma_server_port,
+                settings=Settings(anonymized_telemetry=False)
+            )
+        else:
+            self.client = chromadb.PersistentClient(
+                path=settings.chroma_persist_directory,
+                settings=Settings(anonymized_telemetry=False)
+            )
+        self.collection = self._get_or_create_collection("knowledge_chunks")
+        # Without an explicit device sentence-transformers picks CUDA when available
+        self.embedding_model = SentenceTransformer(self.EMBEDDING_MODEL, device=settings.embedding_device)
+        self.embedding_cache = (
+            Cache(settings.embedding_cache_directory)
+            if DISKCACHE_AVAILABLE and settings.embedding_cache_directory else None
         )
-        self.collection = self.client.get_or_create_collection("knowledge_chunks")
-        self.embedding_model = SentenceTransformer('all-MiniLM-L6-v2')
         self.logger = logger.bind(component="vector_store")
         
     async def add_chunk(self, chunk: KnowledgeChunk) -> str:
         """Add a knowledge chunk to the vector store"""
         try:
-            # Generate embedding
-            embedding = self.embedding_model.encode(chunk.content).tolist()
+            # Generate embedding (or reuse the cached one for unchanged content)
+            embedding = self.embed_cached([chunk.content])[0].astype(np.float32).tolist()
             
             # Add to collection
             self.collection.add(
@@ -55,34 +84,141 @@ class VectorStore:
             self.logger.error(f"Error adding chunk to vector store: {e}")
             raise
     
-    async def add_chunks(self, chunks: List[KnowledgeChunk]) -> List[str]:
-        """Add multiple knowledge chunks to the vector store"""
+    @staticmethod
+    def chunk_metadata(chunk: KnowledgeChunk) -> Dict[str, Any]:
+        """Build the Chroma metadata record for a knowledge chunk"""
+        # Filter out None values from metadata
+        clean_metadata = {k: v for k, v in chunk.metadata.items() if v is not None}
+        
+        return {
+            "id": chunk.id,
+            "source_type": chunk.source_type.value,
+            "source_id": chunk.source_id,
+            "source_url": chunk.source_url or "",
+            "created_at": chunk.created_at.isoformat(),
+            "updated_at": chunk.updated_at.isoformat(),
+            **clean_metadata
+        }
+    
+    def _get_or_create_collection(self, name: str):
+        """Open the collection, creating it with the configured HNSW parameters if missing.
+        
+        Chroma fixes index parameters at creation, so an existing collection is
+        opened as-is rather than having its metadata rewritten.
+        """
+        try:
+            return self.client.get_collection(name)
+        except Exception:
+            return self.client.get_or_create_collection(
+                name,
+                metadata={
+                    "hnsw:M": settings.chroma_hnsw_m,
+                    "hnsw:construction_ef": settings.chroma_hnsw_construction_ef,
+                    "hnsw:search_ef": settings.chroma_hnsw_search_ef
+                }
+            )
+    
+    @property
+    def store_id(self) -> str:
+        """Identifies the backing collection; changes when it is recreated (e.g. by ``clear``)"""
+        if settings.chroma_server_host:
+            location = f"http://{settings.chroma_server_host}:{settings.chroma_server_port}"
+        else:
+            location = os.path.abspath(settings.chroma_persist_directory)
+        return f"{location}#{self.collection.id}"
+    
+    @property
+    def on_gpu(self) -> bool:
+        """Whether the embedding model runs on a CUDA device"""
+        return self.embedding_model.device.type == "cuda"
+    
+    def embed(self, contents: List[str], batch_size: int = 64) -> np.ndarray:
+        """Embed a list of texts in one batched encoder call"""
+        # encode() already length-sorts the inputs before batching (and restores the
+        # order afterwards), so padding is minimal without any pre-sorting here
+        embeddings = self.embedding_model.encode(contents, batch_size=batch_size, convert_to_numpy=True)
+        return embeddings.astype(np.float32, copy=False)
+    
+    @staticmethod
+    def _pack_embedding(vector: np.ndarray) -> bytes:
+        """Cache encoding: little-endian float16, half the size of the float32 vector"""
+        return np.asarray(vector, dtype='<f2').tobytes()
+    
+    @staticmethod
+    def _unpack_embedding(blob: bytes) -> np.ndarray:
+        return np.frombuffer(blob, dtype='<f2').astype(np.float32)
+    
+    def embed_cached(self, contents: List[str], batch_size: int = 64) -> np.ndarray:
+        """Like ``embed``, but reuses vectors cached on disk by model and content hash"""
+        if self.embedding_cache is None:
+            return self.embed(contents, batch_size=batch_size)
+        
+        prefix = f"{self.EMBEDDING_CACHE_FORMAT}:{self.EMBEDDING_MODEL}:"
+        keys = [hashlib.sha256((prefix + content).encode()).digest() for content in contents]
+        vectors = [self.embedding_cache.get(key) for key in keys]
+        vectors = [None if blob is None else self._unpack_embedding(blob) for blob in vectors]
+        
+        # Encode each distinct uncached content once, in a single batched call
+        missing = {}
+        for i, vector in enumerate(vectors):
+            if vector is None:
+                missing.setdefault(keys[i], contents[i])
+        if missing:
+            encoded = {}
+            for key, vector in zip(missing, self.embed(list(missing.values()), batch_size=batch_size)):
+                blob = self._pack_embedding(vector)
+                self.embedding_cache.set(key, blob)
+                # Hand back what a later cache hit would return, so the same text is
+                # stored with the same vector whether or not it was cached
+                encoded[key] = self._unpack_embedding(blob)
+            vectors = [encoded[key] if vector is None else vector for key, vector in zip(keys, vectors)]
+        
+        return np.stack(vectors)
+    
+    async def add_chunks(self,
+                         chunks: List[KnowledgeChunk],
+                         embeddings: Optional[Union[np.ndarray, List[List[float]]]] = None,
+                         batch_size: int = 64) -> List[str]:
+        """Add multiple knowledge chunks to the vector store.
+        
+        ``embeddings`` may be precomputed (one per chunk, e.g. from ``embed``)
+        to skip the encoder pass; otherwise contents not in the embedding cache
+        are encoded together in micro-batches of ``batch_size``.
+        """
         if not chunks:
             return []
         
+        return await self.add_documents(
+            ids=[chunk.id for chunk in chunks],
+            contents=[chunk.content for chunk in chunks],
+            metadatas=[self.chunk_metadata(chunk) for chunk in chunks],
+            embeddings=embeddings,
+            batch_size=batch_size
+        )
+    
+    async def add_documents(self,
+                            ids: List[str],
+                            contents: List[str],
+                            metadatas: List[Dict[str, Any]],
+                            embeddings: Optional[Union[np.ndarray, List[List[float]]]] = None,
+                            batch_size: int = 64) -> List[str]:
+        """Add documents given as parallel id/content/metadata columns.
+        
+        Contents missing from the embedding cache are embedded in a single
+        batched encoder call unless ``embeddings`` are supplied.
+        """
+        if not ids:
+            return []
+        
         try:
-            # Generate embeddings
-            contents = [chunk.content for chunk in chunks]
-            embeddings = self.embedding_model.encode(contents).tolist()
-            
-            # Prepare metadata
-            metadatas = []
-            ids = []
-            
-            for chunk in chunks:
-                # Filter out None values from metadata
-                clean_metadata = {k: v for k, v in chunk.metadata.items() if v is not None}
-                
-                metadatas.append({
-                    "id": chunk.id,
-                    "source_type": chunk.source_type.value,
-                    "source_id": chunk.source_id,
-                    "source_url": chunk.source_url or "",
-                    "created_at": chunk.created_at.isoformat(),
-                    "updated_at": chunk.updated_at.isoformat(),
-                    **clean_metadata
-                })
-                ids.append(chunk.id)
+            # Generate embeddings in a worker thread so the event loop keeps serving
+            # requests and driving crawls while the model runs
+            if embeddings is None:
+                embeddings = await asyncio.to_thread(self.embed_cached, contents, batch_size)
+            elif len(embeddings) != len(ids):
+                raise ValueError(f"Got {len(embeddings)} embeddings for {len(ids)} documents")
+            # Chroma takes float32 lists; this also widens half-precision embeddings
+            embeddings = np.asarray(embeddings, dtype=np.float32).tolist()
             
             # Add to collection
             self.collection.add(
@@ -92,7 +228,7 @@ class VectorStore:
                 ids=ids
             )
             
-            self.logger.info(f"Added {len(chunks)} chunks to vector store")
+            self.logger.info(f"Added {len(ids)} chunks to vector store")
             return ids
             
         except Exception as e:
@@ -150,6 +286,14 @@ class VectorStore:
             self.logger.error(f"Error searching vector store: {e}")
             raise
     
+    async def existing_ids(self, ids: List[str]) -> Set[str]:
+        """Return the subset of ``ids`` already stored (no documents or embeddings are fetched)"""
+        existing: Set[str] = set()
+        # Looked up in slices so large crawls stay under SQLite's bound-parameter limit
+        for start in range(0, len(ids), 1000):
+            existing.update(self.collection.get(ids=ids[start:start + 1000], include=[])["ids"])
+        return existing
+    
     async def delete_chunk(self, chunk_id: str) -> bool:
         """Delete a chunk from the vector store"""
         try:
@@ -237,9 +381,25 @@ class VectorStore:
     async def clear(self) -> bool:
         """Clear all chunks from the vector store"""
         try:
-            self.collection.delete(where={})
+            # Recreated rather than emptied, so anything keyed by store_id starts over
+            self.client.delete_collection(self.collection.name)
+            self.collection = self._get_or_create_collection(self.collection.name)
             self.logger.info("Cleared all chunks from vector store")
             return True
         except Exception as e:
             self.logger.error(f"Error clearing vector store: {e}")
-            return False 
\ No newline at end of file
+            return False 
+
+
+_shared_store: Optional[VectorStore] = None
+_shared_store_lock = threading.Lock()
+
+
+def get_vector_store() -> VectorStore:
+    """Return the process-wide VectorStore, creating it on first use"""
+    global _shared_store
+    if _shared_store is None:
+        with _shared_store_lock:
+            if _shared_store is None:
+                _shared_store = VectorStore()
+    return _shared_store
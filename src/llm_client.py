@@ -8,6 +8,7 @@ import os
 import asyncio
 import aiohttp
 import json
+from functools import lru_cache
 from typing import List, Dict, Any, Optional
 from loguru import logger
 from src.config import settings
@@ -21,11 +22,60 @@ except ImportError:
 
 try:
     from groq import Groq
+    import httpx
     GROQ_AVAILABLE = True
 except ImportError:
     GROQ_AVAILABLE = False
     logger.warning("Groq not available. Install with: pip install groq")
 
+try:
+    import h2  # noqa: F401 - enables HTTP/2 in httpx
+    HTTP2_AVAILABLE = True
+except ImportError:
+    HTTP2_AVAILABLE = False
+
+
+# Canned replies returned instead of raising; they are not real answers and must not be cached
+ERROR_REPLY_PREFIX = "I encountered an error while processing your request"
+QUERY_ERROR_REPLY_PREFIX = "I encountered an error while processing your query"  # QAAgent.process
+EMPTY_REPLY = "I apologize, but I couldn't generate a response. Please try again."
+DEMO_REPLY = "Demo mode: Please configure a valid API key for OpenAI, Gemini, or Groq."
+
+
+def is_fallback_reply(text: str) -> bool:
+    """Whether ``text`` is one of the canned replies above rather than model output"""
+    return text.startswith((ERROR_REPLY_PREFIX, QUERY_ERROR_REPLY_PREFIX)) or text in (EMPTY_REPLY, DEMO_REPLY)
+
+
+_shared_clients: List[Any] = []
+_SHARED: Optional["LLMClient"] = None
+
+
+@lru_cache(maxsize=None)
+def _shared_groq_client(api_key: str) -> "Groq":
+    """One Groq client per process so every agent reuses the same keep-alive pool"""
+    client = Groq(
+        api_key=api_key,
+        http_client=httpx.Client(
+            http2=HTTP2_AVAILABLE,
+            timeout=30,
+            limits=httpx.Limits(max_connections=100, max_keepalive_connections=50)
+        )
+    )
+    _shared_clients.append(client)
+    return client
+
+
+def close_shared_clients() -> None:
+    """Close the pooled provider connections; the next LLMClient opens fresh ones"""
+    global _SHARED
+    _SHARED = None
+    if GROQ_AVAILABLE:
+        for client in list(_shared_clients):
+            client.close()
+        _shared_clients.clear()
+        _shared_groq_client.cache_clear()
+
 
 class LLMClient:
     """Client for interacting with different LLM providers"""
@@ -40,11 +90,26 @@ class LLMClient:
             self.model = genai.GenerativeModel(settings.gemini_model)
             self.logger.info("Using Google Gemini API")
         elif self.provider == "groq" and GROQ_AVAILABLE:
-            self.groq_client = Groq(api_key=settings.grok_api_key)
+            self.groq_client = _shared_groq_client(settings.grok_api_key)
             self.logger.info("Using Groq API")
         else:
             self.logger.warning("Using fallback OpenAI-compatible API")
     
+    @classmethod
+    def shared(cls) -> "LLMClient":
+        """Process-wide client used by the agents, so they share one provider setup and connection pool"""
+        global _SHARED
+        if _SHARED is None:
+            _SHARED = cls()
+        return _SHARED
+    
+    async def __aenter__(self) -> "LLMClient":
+        return self
+    
+    async def __aexit__(self, exc_type, exc, tb) -> None:
+        # Meant for one-shot scripts: long-running servers keep the shared pools open
+        close_shared_clients()
+    
     def _determine_provider(self) -> str:
         """Determine which LLM provider to use"""
         if settings.use_grok and settings.grok_api_key:
@@ -69,7 +134,7 @@ class LLMClient:
                 return await self._call_openai(messages, temperature, max_tokens)
         except Exception as e:
             self.logger.error(f"Error calling LLM: {e}")
-            return f"I encountered an error while processing your request: {str(e)}"
+            return f"{ERROR_REPLY_PREFIX}: {str(e)}"
     
     async def _call_groq(self, 
                          messages: List[Dict[str, str]], 
@@ -147,7 +212,7 @@ class LLMClient:
             )
             
             if not response or not response.text:
-                return "I apologize, but I couldn't generate a response. Please try again."
+                return EMPTY_REPLY
             
             return response.text
             
@@ -162,7 +227,7 @@ class LLMClient:
         """Call OpenAI API (fallback)"""
         try:
             # This is a fallback implementation
-            return "Demo mode: Please configure a valid API key for OpenAI, Gemini, or Groq."
+            return DEMO_REPLY
         except Exception as e:
             self.logger.error(f"Error calling OpenAI API: {e}")
             raise
@@ -7,37 +7,41 @@ import json
 import asyncio
 import logging
 from datetime import datetime
-from typing import Dict, Any, List
+from typing import Dict, Any, List, Optional
 from fastapi import FastAPI, Request, HTTPException, BackgroundTasks
-from fastapi.responses import HTMLResponse
+from fastapi.responses import HTMLResponse, JSONResponse, ORJSONResponse
 from fastapi.staticfiles import StaticFiles
 from fastapi.templating import Jinja2Templates
 from loguru import logger
 import uvicorn
 
 from src.config import settings
-from src.knowledge.vector_store import VectorStore
-from src.knowledge.search import SemanticSearch
-from src.agents.qa_agent import QAAgent
-from src.agents.crawler_agent import CrawlerAgent
-from src.agents.memory_agent import MemoryAgent
-from src.agents.reflection_agent import ReflectionAgent
 from src.models import Query
+from src.utils.ids import new_id
+
+try:
+    import orjson  # noqa: F401 - required by ORJSONResponse
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
 
 
 class AgenticMentor:
     """Main application class for Agentic Mentor"""
     
+    # Endpoints that answer before the components have finished loading
+    _LIVENESS_PATHS = frozenset({"/healthz", "/ready", "/api/health"})
+    
     def __init__(self):
-        # Initialize components
-        self.vector_store = VectorStore()
-        self.search_engine = SemanticSearch(self.vector_store)
-        
-        # Initialize agents
-        self.qa_agent = QAAgent(self.vector_store, self.search_engine)
-        self.crawler_agent = CrawlerAgent(self.vector_store)
-        self.memory_agent = MemoryAgent(settings.agent_memory_size)
-        self.reflection_agent = ReflectionAgent()
+        # Components load in the background once the server is up (see _warmup)
+        self.vector_store = None
+        self.search_engine = None
+        self.semantic_cache = None
+        self.qa_agent = None
+        self.crawler_agent = None
+        self.memory_agent = None
+        self.reflection_agent = None
+        self._warmup_task: Optional[asyncio.Task] = None
         
         # Setup templates
         templates_dir = "templates"
@@ -52,12 +56,25 @@ class AgenticMentor:
         self.app = FastAPI(
             title="Agentic Mentor",
             description="AI-Driven Internal Knowledge Explorer",
-            version="1.0.0"
+            version="1.0.0",
+            default_response_class=self._default_response_class()
         )
         
         # Mount static files
         self.app.mount("/static", StaticFiles(directory="static"), name="static")
         
+        # Start loading components as soon as the port is bound
+        @self.app.on_event("startup")
+        async def start_warmup():
+            self._warmup_task = asyncio.create_task(self._warmup())
+        
+        # API calls that arrive while components are loading wait for them
+        @self.app.middleware("http")
+        async def wait_until_ready(request: Request, call_next):
+            if request.url.path.startswith("/api/") and request.url.path not in self._LIVENESS_PATHS:
+                await self.ensure_ready()
+            return await call_next(request)
+        
         # Setup routes
         self._setup_routes()
         
@@ -69,9 +86,80 @@ class AgenticMentor:
             level=settings.log_level
         )
     
+    @staticmethod
+    def _default_response_class():
+        """Response class for API routes, per the WEB_JSON_ENCODER setting"""
+        if settings.web_json_encoder.lower() == "orjson":
+            if ORJSON_AVAILABLE:
+                return ORJSONResponse
+            logger.warning("WEB_JSON_ENCODER=orjson but orjson is not installed; using the standard encoder")
+        return JSONResponse
+    
+    def _load_components(self):
+        """Import and build the models, vector store and agents (slow: loads torch and Chroma)"""
+        from src.knowledge.vector_store import VectorStore
+        from src.knowledge.search import SemanticSearch
+        from src.knowledge.semantic_cache import SemanticCache
+        from src.agents.qa_agent import QAAgent
+        from src.agents.crawler_agent import CrawlerAgent
+        from src.agents.memory_agent import MemoryAgent
+        from src.agents.reflection_agent import ReflectionAgent
+        
+        self.vector_store = VectorStore()
+        self.search_engine = SemanticSearch(self.vector_store)
+        self.semantic_cache = (
+            SemanticCache(settings.semantic_cache_threshold, settings.semantic_cache_size, settings.semantic_cache_ttl)
+            if settings.semantic_cache_enabled else None
+        )
+        
+        # Initialize agents
+        self.qa_agent = QAAgent(self.vector_store, self.search_engine)
+        # One semantic layer per request path: the query-level cache below supersedes
+        # the QA agent's semantic LLM cache when both are enabled
+        self.qa_agent.semantic_llm_cache = self.semantic_cache is None
+        self.crawler_agent = CrawlerAgent(self.vector_store)
+        self.memory_agent = MemoryAgent(settings.agent_memory_size)
+        self.reflection_agent = ReflectionAgent()
+    
+    async def _warmup(self):
+        """Load components off the event loop so health checks are answered meanwhile"""
+        try:
+            await asyncio.to_thread(self._load_components)
+            logger.info("Agentic Mentor components loaded")
+        except Exception as e:
+            logger.error(f"Error loading components: {e}")
+            raise
+    
+    async def ensure_ready(self):
+        """Start loading components if nobody has yet, and wait until they are loaded.
+        
+        A failed load is not cached: the next request starts a fresh attempt.
+        """
+        task = self._warmup_task
+        if task is None or (task.done() and (task.cancelled() or task.exception() is not None)):
+            task = self._warmup_task = asyncio.create_task(self._warmup())
+        await asyncio.shield(task)
+    
+    @property
+    def ready(self) -> bool:
+        task = self._warmup_task
+        return task is not None and task.done() and not task.cancelled() and task.exception() is None
+    
     def _setup_routes(self):
         """Setup FastAPI routes"""
         
+        @self.app.get("/healthz")
+        async def healthz():
+            """Liveness: the server is up, even if components are still loading"""
+            return {"status": "alive"}
+        
+        @self.app.get("/ready")
+        async def ready():
+            """Readiness: 200 once the models, vector store and agents are loaded"""
+            if self.ready:
+                return {"status": "ready"}
+            return JSONResponse(status_code=503, content={"status": "loading"})
+        
         @self.app.get("/", response_class=HTMLResponse)
         async def home(request: Request):
             """Landing page"""
@@ -95,10 +183,8 @@ class AgenticMentor:
                     raise HTTPException(status_code=400, detail="Query text is required")
                 
                 # Create proper Query object with all required fields
-                import uuid
-                
                 query_obj = Query(
-                    id=str(uuid.uuid4()),
+                    id=new_id(),
                     user_id=user_id,
                     query_text=query_text,
                     context=context,
@@ -106,7 +192,7 @@ class AgenticMentor:
                 )
                 
                 # Process query with Q&A agent
-                result = await self.qa_agent.process(query_obj)
+                result = await self._answer_query(query_obj)
                 
                 # Store in memory for learning
                 try:
@@ -372,6 +458,13 @@ class AgenticMentor:
                 logger.error(f"Error getting stats: {e}")
                 raise HTTPException(status_code=500, detail=str(e))
         
+        # Dumps raw store contents, so it only exists on servers started with WEB_DEBUG=true
+        if settings.web_debug:
+            @self.app.get("/api/debug/repositories")
+            async def debug_repositories():
+                """Expose repository extraction so debug scripts can reuse this process"""
+                return {"repositories": await self._get_repositories_info()}
+        
         @self.app.get("/api/health")
         async def health_check():
             """Health check endpoint"""
@@ -404,6 +497,29 @@ class AgenticMentor:
                     "timestamp": datetime.utcnow().isoformat()
                 }
     
+    async def _answer_query(self, query_obj: Query) -> Dict[str, Any]:
+        """Answer a query with the Q&A agent, unless this user recently asked a near-identical
+        query in the same context"""
+        if self.semantic_cache is None:
+            return await self.qa_agent.process(query_obj)
+        
+        from src.llm_client import is_fallback_reply
+        
+        scope = (query_obj.user_id, json.dumps(query_obj.context or {}, sort_keys=True, default=str))
+        query_embedding = (await asyncio.to_thread(self.vector_store.embed, [query_obj.query_text]))[0]
+        result = self.semantic_cache.lookup(query_embedding, scope)
+        if result is None:
+            result = await self.qa_agent.process(query_obj)
+            # Error and fallback replies are not answers; the next ask should try again
+            if not is_fallback_reply(result.get("text", "")):
+                self.semantic_cache.add(query_embedding, result, scope)
+        return result
+    
+    def _forget_cached_answers(self):
+        """Drop cached query answers once a crawl has changed the knowledge behind them"""
+        if self.semantic_cache is not None:
+            self.semantic_cache.clear()
+    
     async def _crawl_source(self, source_type: str, config: Dict[str, Any]):
         """Crawl a knowledge source"""
         try:
@@ -416,6 +532,8 @@ class AgenticMentor:
             
         except Exception as e:
             logger.error(f"Error crawling {source_type}: {e}")
+        finally:
+            self._forget_cached_answers()
     
     async def _crawl_github(self, repos: List[str], organization: str):
         """Crawl GitHub repositories"""
@@ -444,6 +562,8 @@ class AgenticMentor:
                 "error": str(e),
                 "chunks": 0
             }
+        finally:
+            self._forget_cached_answers()
     
     async def _crawl_jira(self, projects: List[str]):
         """Crawl Jira projects"""
@@ -459,6 +579,8 @@ class AgenticMentor:
             
         except Exception as e:
             logger.error(f"Error crawling Jira: {e}")
+        finally:
+            self._forget_cached_answers()
     
     async def _crawl_confluence(self, spaces: List[str]):
         """Crawl Confluence spaces"""
@@ -474,6 +596,8 @@ class AgenticMentor:
             
         except Exception as e:
             logger.error(f"Error crawling Confluence: {e}")
+        finally:
+            self._forget_cached_answers()
     
     async def _get_repositories_info(self) -> List[Dict[str, Any]]:
         """Extract repository information from knowledge chunks"""
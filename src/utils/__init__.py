@@ -3,5 +3,7 @@ Utility functions for Agentic Mentor
 """
 
 from .json_parser import parse_llm_json, create_fallback_response
+from .event_loop import run
+from .ids import new_id
 
-__all__ = ['parse_llm_json', 'create_fallback_response'] 
\ No newline at end of file
+__all__ = ['parse_llm_json', 'create_fallback_response', 'run', 'new_id'] 
\ No newline at end of file
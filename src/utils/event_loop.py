@@ -0,0 +1,26 @@
+"""
+Event loop helpers for Agentic Mentor entrypoints
+"""
+
+import asyncio
+import sys
+from typing import Any, Coroutine
+
+try:
+    import uvloop
+    UVLOOP_AVAILABLE = True
+except ImportError:
+    UVLOOP_AVAILABLE = False
+
+
+def run(main: Coroutine[Any, Any, Any]) -> Any:
+    """Run a coroutine to completion, on uvloop when it is installed"""
+    if not UVLOOP_AVAILABLE:
+        return asyncio.run(main)
+    
+    if sys.version_info >= (3, 11):
+        with asyncio.Runner(loop_factory=uvloop.new_event_loop) as runner:
+            return runner.run(main)
+    
+    uvloop.install()
+    return asyncio.run(main)
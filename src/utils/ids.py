@@ -0,0 +1,20 @@
+"""
+Identifier helpers for Agentic Mentor
+"""
+
+import os
+import time
+import uuid
+
+
+def uuid7() -> uuid.UUID:
+    """Time-ordered UUID (RFC 9562 version 7): 48-bit Unix milliseconds followed by random bits"""
+    value = (time.time_ns() // 1_000_000) << 80 | int.from_bytes(os.urandom(10), "big")
+    value = value & ~(0xF << 76) | 0x7 << 76  # version
+    value = value & ~(0x3 << 62) | 0x2 << 62  # RFC 4122 variant
+    return uuid.UUID(int=value)
+
+
+def new_id() -> str:
+    """New record ID: 32 hex chars that sort by creation time, keeping index inserts append-mostly"""
+    return uuid7().hex
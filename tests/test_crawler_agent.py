@@ -0,0 +1,167 @@
+"""Tests for CrawlerAgent crawl results and its shared batch writer"""
+
+import asyncio
+from datetime import datetime
+
+import pytest
+
+from src.agents.crawler_agent import CrawlerAgent
+from src.models import KnowledgeChunk, SourceType
+
+
+def make_chunk(n):
+    now = datetime.now()
+    return KnowledgeChunk(
+        id=f"chunk-{n}",
+        content=f"content {n}",
+        source_type=SourceType.JIRA,
+        source_id=f"ISSUE-{n}",
+        created_at=now,
+        updated_at=now
+    )
+
+
+class FakeVectorStore:
+    store_id = "test-store"
+    
+    def __init__(self, stored=(), error=None, delay=0.0):
+        self.stored = set(stored)
+        self.batches = []
+        self.error = error
+        self.delay = delay
+    
+    async def existing_ids(self, ids):
+        return {chunk_id for chunk_id in ids if chunk_id in self.stored}
+    
+    async def add_chunks(self, chunks):
+        await asyncio.sleep(self.delay)
+        if self.error:
+            raise self.error
+        self.batches.append([chunk.id for chunk in chunks])
+        self.stored.update(chunk.id for chunk in chunks)
+        return [chunk.id for chunk in chunks]
+
+
+class FakeCrawler:
+    source_type = SourceType.JIRA
+    
+    def __init__(self, chunks, started=None):
+        self.chunks = chunks
+        self.started = started
+    
+    async def crawl(self, config):
+        if self.started is not None:
+            await self.started()
+        for chunk in self.chunks:
+            yield chunk
+
+
+def make_agent(vector_store, crawler):
+    agent = CrawlerAgent(vector_store)
+    agent.crawlers = {SourceType.JIRA: crawler}
+    agent.WRITE_FLUSH_INTERVAL = 0.01
+    return agent
+
+
+def test_process_reports_counts_and_stored_ids():
+    chunks = [make_chunk(n) for n in range(3)]
+    # Crawling the same content again is skipped rather than stored twice
+    first = make_agent(FakeVectorStore(), FakeCrawler(chunks))
+    result = asyncio.run(first.process({"source_type": "jira"}))
+    
+    assert set(result) == {"source_type", "chunks_processed", "chunks_skipped", "chunk_ids"}
+    assert result["source_type"] == "jira"
+    assert result["chunks_processed"] == 3
+    assert result["chunks_skipped"] == 0
+    assert len(result["chunk_ids"]) == 3
+    
+    again = make_agent(FakeVectorStore(stored=result["chunk_ids"]),
+                       FakeCrawler([make_chunk(n) for n in range(3)]))
+    result = asyncio.run(again.process({"source_type": "jira"}))
+    assert result["chunks_processed"] == 3
+    assert result["chunks_skipped"] == 3
+    assert result["chunk_ids"] == []
+
+
+
+def test_concurrent_crawls_share_one_writer():
+    vector_store = FakeVectorStore()
+    agent = make_agent(vector_store, None)
+    writers = []
+    write_batches = agent._write_batches
+    
+    def counting_write_batches(queue):
+        writers.append(queue)
+        return write_batches(queue)
+    
+    agent._write_batches = counting_write_batches
+    
+    async def scenario():
+        # Neither crawl yields until both are inside the writer
+        both_started = asyncio.Event()
+        started = []
+        
+        async def wait_for_both():
+            started.append(None)
+            if len(started) == 2:
+                both_started.set()
+            await both_started.wait()
+        
+        agent.crawlers = {
+            SourceType.JIRA: FakeCrawler([make_chunk(n) for n in range(3)], wait_for_both),
+            SourceType.CONFLUENCE: FakeCrawler([make_chunk(n) for n in range(3, 6)], wait_for_both)
+        }
+        return await asyncio.gather(
+            agent.process({"source_type": "jira"}),
+            agent.process({"source_type": "confluence"})
+        )
+    
+    results = asyncio.run(scenario())
+    
+    assert len(writers) == 1
+    assert [len(result["chunk_ids"]) for result in results] == [3, 3]
+    assert len(vector_store.stored) == 6
+    assert agent._writer_users == 0
+    assert agent._writer_task is None
+
+
+def test_failed_batch_fails_every_waiting_chunk():
+    error = RuntimeError("store unavailable")
+    agent = make_agent(FakeVectorStore(error=error), None)
+    
+    async def scenario():
+        loop = asyncio.get_running_loop()
+        futures = [loop.create_future() for _ in range(3)]
+        async with agent._batch_writer() as queue:
+            for n, future in enumerate(futures):
+                await queue.put((make_chunk(n), future))
+        return futures
+    
+    futures = asyncio.run(scenario())
+    assert [future.exception() for future in futures] == [error] * 3
+    
+    agent.crawlers = {SourceType.JIRA: FakeCrawler([make_chunk(n) for n in range(3)])}
+    with pytest.raises(RuntimeError, match="store unavailable"):
+        asyncio.run(agent.process({"source_type": "jira"}))
+    assert agent._writer_task is None
+
+
+def test_leaving_the_writer_waits_for_queued_chunks():
+    vector_store = FakeVectorStore(delay=0.05)
+    agent = make_agent(vector_store, None)
+    agent.WRITE_BATCH_SIZE = 2
+    
+    async def scenario():
+        loop = asyncio.get_running_loop()
+        futures = [loop.create_future() for _ in range(5)]
+        async with agent._batch_writer() as queue:
+            writer = agent._writer_task
+            for n, future in enumerate(futures):
+                await queue.put((make_chunk(n), future))
+        # Nobody awaited the futures, yet every queued chunk is written on exit
+        assert writer.done()
+        assert all(future.done() for future in futures)
+    
+    asyncio.run(scenario())
+    assert sorted(vector_store.stored) == [f"chunk-{n}" for n in range(5)]
+    assert all(len(batch) <= 2 for batch in vector_store.batches)
@@ -0,0 +1,80 @@
+"""Tests for the semantic /api/query answer cache in src.main"""
+
+import asyncio
+from datetime import datetime
+
+import numpy as np
+
+from src.knowledge.semantic_cache import SemanticCache
+from src.llm_client import QUERY_ERROR_REPLY_PREFIX
+from src.main import AgenticMentor
+from src.models import Query
+
+
+class FakeEmbedder:
+    """Embeds every text to the same vector, so every query is a near-duplicate"""
+    
+    def embed(self, contents):
+        return np.ones((len(contents), 4), dtype=np.float32)
+
+
+class FakeQAAgent:
+    def __init__(self, *replies):
+        self.replies = list(replies)
+        self.calls = 0
+    
+    async def process(self, query):
+        self.calls += 1
+        return self.replies.pop(0)
+
+
+class FakeCrawlerAgent:
+    async def process(self, input_data):
+        return {"chunks_processed": 1}
+
+
+def make_mentor(*replies):
+    mentor = AgenticMentor()
+    mentor.vector_store = FakeEmbedder()
+    mentor.qa_agent = FakeQAAgent(*replies)
+    mentor.semantic_cache = SemanticCache(threshold=0.9, max_size=8, ttl=300)
+    return mentor
+
+
+def make_query(text="How do I deploy the service?"):
+    return Query(id="q", user_id="alice", query_text=text, context={}, timestamp=datetime.now())
+
+
+ANSWER = {"text": "Run make deploy.", "confidence": 0.8}
+ERROR = {"text": f"{QUERY_ERROR_REPLY_PREFIX}: search failed", "confidence": 0.0}
+
+
+def test_answer_is_reused_for_repeated_query():
+    mentor = make_mentor(ANSWER)
+    
+    first = asyncio.run(mentor._answer_query(make_query()))
+    second = asyncio.run(mentor._answer_query(make_query("How to deploy the service?")))
+    
+    assert first == second == ANSWER
+    assert mentor.qa_agent.calls == 1
+
+
+def test_failed_query_is_not_cached():
+    mentor = make_mentor(ERROR, ANSWER)
+    
+    assert asyncio.run(mentor._answer_query(make_query())) == ERROR
+    assert len(mentor.semantic_cache) == 0
+    
+    assert asyncio.run(mentor._answer_query(make_query())) == ANSWER
+    assert mentor.qa_agent.calls == 2
+
+
+def test_crawl_clears_cached_answers():
+    mentor = make_mentor(ANSWER, ANSWER)
+    mentor.crawler_agent = FakeCrawlerAgent()
+    
+    asyncio.run(mentor._answer_query(make_query()))
+    asyncio.run(mentor._crawl_jira(["ENG"]))
+    asyncio.run(mentor._answer_query(make_query()))
+    
+    assert mentor.qa_agent.calls == 2
@@ -0,0 +1,28 @@
+"""Tests for src.knowledge.semantic_cache"""
+
+from types import SimpleNamespace
+
+import numpy as np
+
+from src.knowledge import semantic_cache
+from src.knowledge.semantic_cache import SemanticCache
+
+
+def test_entries_expire_after_ttl(monkeypatch):
+    now = [1000.0]
+    monkeypatch.setattr(semantic_cache, "time", SimpleNamespace(monotonic=lambda: now[0]))
+    cache = SemanticCache(threshold=0.9, max_size=4, ttl=60)
+    cache.add(np.array([1.0, 0.0]), "answer")
+    
+    now[0] += 59
+    assert cache.lookup(np.array([1.0, 0.0])) == "answer"
+    now[0] += 1
+    assert cache.lookup(np.array([1.0, 0.0])) is None
+
+
+def test_lookup_only_matches_same_scope():
+    cache = SemanticCache(threshold=0.9, max_size=4)
+    cache.add(np.array([1.0, 0.0]), "alice's answer", scope="alice")
+    
+    assert cache.lookup(np.array([1.0, 0.0]), scope="alice") == "alice's answer"
+    assert cache.lookup(np.array([1.0, 0.0]), scope="bob") is None
@@ -0,0 +1,30 @@
+"""Tests for lazy component loading in src.main"""
+
+import asyncio
+
+import pytest
+
+from src.main import AgenticMentor
+
+
+def test_failed_load_is_retried_on_next_request():
+    mentor = AgenticMentor()
+    attempts = []
+    
+    def load_components():
+        attempts.append(len(attempts))
+        if len(attempts) == 1:
+            raise RuntimeError("vector store unavailable")
+    
+    mentor._load_components = load_components
+    
+    async def scenario():
+        with pytest.raises(RuntimeError):
+            await mentor.ensure_ready()
+        assert not mentor.ready
+        
+        await mentor.ensure_ready()
+        assert mentor.ready
+    
+    asyncio.run(scenario())
+    assert len(attempts) == 2